@@ -0,0 +1,56 @@
+"""
+Benchmark: memory of a 100k-card deck as dicts vs. Card objects (__slots__).
+
+Builds the same deck both ways and measures what tracemalloc sees. The
+card text is created beforehand and shared by both runs, so the numbers
+cover the cards themselves (dict or slots object, id and position) plus
+the list holding them.
+
+Run from startingApp/:  python benchmarks/bench_card_memory.py
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.card_model import Card
+
+N = 100_000
+
+
+def make_text(n):
+    return [(f"Question number {i}?", f"Answer {i}") for i in range(n)]
+
+
+def as_dicts(text):
+    return [{"id": i, "front": front, "back": back, "position": float(i), "due": ""}
+            for i, (front, back) in enumerate(text)]
+
+
+def as_cards(text):
+    return [Card(front, back, i, float(i), "") for i, (front, back) in enumerate(text)]
+
+
+def measure(build, text):
+    tracemalloc.start()
+    deck = build(text)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(deck) == len(text)
+    return current
+
+
+def main():
+    text = make_text(N)
+    dicts = measure(as_dicts, text)
+    cards = measure(as_cards, text)
+    print(f"{N:,} cards (text excluded)")
+    print(f"{'dicts':>7} {dicts / 2**20:>8.1f} MB {dicts / N:>7.0f} B/card")
+    print(f"{'Card':>7} {cards / 2**20:>8.1f} MB {cards / N:>7.0f} B/card")
+    print(f"saved {100 * (1 - cards / dicts):.0f}%")
+
+
+if __name__ == "__main__":
+    main()
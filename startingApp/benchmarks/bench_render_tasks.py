@@ -0,0 +1,117 @@
+"""
+Benchmark: ToDoScreen.render_tasks on the RecycleView list vs. list size.
+
+Renders N tasks into a TaskRecycleView. Long lists get their data a
+chunk per frame, so the time to the first frame (the rows on screen)
+should stay roughly flat while the total grows with N.
+
+Then times single edits (complete a task, move one a row down) on the
+rendered list. Those only rewrite the rows they touch, so their cost must
+not grow with N; the run fails if the largest list is much slower.
+
+Run from startingApp/:  python benchmarks/bench_render_tasks.py
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kivy.metrics import dp
+from kivymd.app import MDApp
+
+
+class BenchApp(MDApp):
+    def build(self):
+        pass
+
+
+class NullWriter:
+    """Stands in for the background writer so only rendering is measured."""
+    def mark_dirty(self, key, value):
+        pass
+
+    def mark_dirty_many(self, changes):
+        pass
+
+
+def make_screen(n):
+    from screens.todo import TaskRecycleView, ToDoScreen
+
+    screen = ToDoScreen()
+    list_view = TaskRecycleView(size_hint=(None, None), size=(dp(400), dp(600)))
+    screen.ids = {"todo_list_view": list_view}
+    screen.repo = object()
+    screen.writer = NullWriter()
+    screen.task_list = [
+        {"id": i, "header": f"Task {i}", "description": "", "due_date": "",
+         "completed": False, "rank": f"{i:06d}"}
+        for i in range(n)
+    ]
+    screen._ensure_loaded()  # builds the indexes, keeps the stubs above
+    return screen
+
+
+def measure(n):
+    screen = make_screen(n)
+    list_view = screen.ids["todo_list_view"]
+
+    start = time.perf_counter()
+    screen.render_tasks()
+    first_frame = time.perf_counter() - start
+    first_rows = len(list_view.data)
+    screen.flush_render()  # finish the progressive build
+    total = time.perf_counter() - start
+    assert len(list_view.data) == n
+    return first_frame, first_rows, total
+
+
+EDITS = 200
+FLAT_FACTOR = 3.0   # allowed slowdown of an edit from the smallest to the largest list
+SLACK = 0.0002      # seconds, so timer noise on tiny numbers can't fail the run
+
+
+def measure_edits(n):
+    """Seconds per edit (complete, move) on a fully rendered list of n tasks."""
+    screen = make_screen(n)
+    list_view = screen.ids["todo_list_view"]
+    screen.render_tasks()
+    screen.flush_render()
+    data = list_view.data
+
+    def per_edit(edit):
+        start = time.perf_counter()
+        for i in range(EDITS):
+            edit(n // 2 + i % 10)
+            screen.flush_render()
+        return (time.perf_counter() - start) / EDITS
+
+    toggle = per_edit(lambda i: screen.toggle_task_complete(i, not screen.task_list[i]["completed"]))
+    move = per_edit(screen.move_task_down)
+    assert list_view.data is data, "an edit rebuilt the whole list"
+    return toggle, move
+
+
+def main():
+    BenchApp()  # theme_cls must exist before KivyMD widgets are created
+    print(f"{'tasks':>7} {'first frame':>13} {'rows':>6} {'all rows':>10}")
+    for n in (50, 1000, 5000, 20000):
+        first_frame, first_rows, total = measure(n)
+        print(f"{n:>7} {first_frame * 1000:>10.1f} ms {first_rows:>6} {total * 1000:>7.1f} ms")
+
+    print(f"\n{'tasks':>7} {'complete':>12} {'move':>12}")
+    edits = {}
+    for n in (50, 1000, 5000, 20000):
+        edits[n] = measure_edits(n)
+        toggle, move = edits[n]
+        print(f"{n:>7} {toggle * 1e6:>9.0f} us {move * 1e6:>9.0f} us")
+    smallest, largest = edits[min(edits)], edits[max(edits)]
+    for name, small, large in zip(("complete", "move"), smallest, largest):
+        assert large <= small * FLAT_FACTOR + SLACK, (
+            f"{name} grows with the list: {small * 1e6:.0f} us -> {large * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
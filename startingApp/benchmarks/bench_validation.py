@@ -0,0 +1,167 @@
+"""
+Micro-benchmark: precompiled validation (screens/task_validation.py) vs.
+the original per-pattern checks that used to live in todo.py, and vs. a
+variant that finds the dangerous patterns with one alternation regex.
+
+Run from startingApp/:  python benchmarks/bench_validation.py
+"""
+
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.task_validation import (
+    DESCRIPTION_MAX_LENGTH,
+    TITLE_MAX_LENGTH,
+    _DESCRIPTION_DANGER,
+    _TITLE_CHARS_RE,
+    _TITLE_DANGER,
+    validate_task_description,
+    validate_task_title,
+    validate_tasks,
+)
+
+
+# ---------- original implementations (baseline) ----------
+
+def legacy_validate_task_title(title: str) -> tuple[bool, str]:
+    """
+    Validate task title to prevent injection attacks (CWE-20).
+    Returns: (is_valid, error_message)
+    """
+    if not title or not isinstance(title, str):
+        return False, "Task title cannot be empty!"
+    
+    # Enforce length constraints
+    if len(title) < 1 or len(title) > 100:
+        return False, "Task title must be between 1 and 100 characters!"
+    
+    # Check for potentially dangerous patterns
+    dangerous_patterns = ['<script', '</script>', 'javascript:', 'onerror=', 
+                         'onclick=', '<iframe', 'eval(', 'DROP TABLE', 
+                         'DELETE FROM', '--', '/*', '*/']
+    
+    title_lower = title.lower()
+    for pattern in dangerous_patterns:
+        if pattern in title_lower:
+            return False, f"Task title contains dangerous pattern: {pattern}"
+    
+    # Allow only safe characters: letters, numbers, spaces, and basic punctuation
+    if not re.match(r'^[a-zA-Z0-9\s\.,!?\-\(\)\'\"]+$', title):
+        return False, "Task title contains invalid characters!"
+    
+    return True, ""
+
+
+def legacy_validate_task_description(description: str) -> tuple[bool, str]:
+    """
+    Validate task description with stricter limits (CWE-20).
+    Returns: (is_valid, error_message)
+    """
+    if not description:
+        return True, ""  # Description is optional
+    
+    if not isinstance(description, str):
+        return False, "Invalid description format!"
+    
+    # Enforce maximum length to prevent resource exhaustion
+    if len(description) > 500:
+        return False, "Description too long! Maximum 500 characters allowed."
+    
+    # Check for dangerous patterns (XSS/SQL injection)
+    dangerous_patterns = ['<script', '</script>', 'javascript:', 'onerror=',
+                         'onclick=', '<iframe', 'eval(', 'DROP TABLE',
+                         'DELETE FROM', 'INSERT INTO', 'UPDATE ', '--', '/*']
+    
+    desc_lower = description.lower()
+    for pattern in dangerous_patterns:
+        if pattern in desc_lower:
+            return False, f"Description contains dangerous pattern: {pattern}"
+    
+    return True, ""
+
+
+# ---------- alternative: one alternation regex per field ----------
+# Same rules as task_validation.py, but the dangerous patterns are found
+# with a single compiled regex instead of `in` tests over a tuple.
+
+_TITLE_DANGER_RE = re.compile("|".join(re.escape(p) for p in _TITLE_DANGER))
+_DESCRIPTION_DANGER_RE = re.compile("|".join(re.escape(p) for p in _DESCRIPTION_DANGER))
+
+
+def regex_validate_task_title(title):
+    if not title or not isinstance(title, str):
+        return False, "Task title cannot be empty!"
+    if len(title) > TITLE_MAX_LENGTH:
+        return False, "Task title must be between 1 and 100 characters!"
+    match = _TITLE_DANGER_RE.search(title.lower())
+    if match:
+        return False, f"Task title contains dangerous pattern: {match.group()}"
+    if not _TITLE_CHARS_RE.match(title):
+        return False, "Task title contains invalid characters!"
+    return True, ""
+
+
+def regex_validate_task_description(description):
+    if not description:
+        return True, ""
+    if not isinstance(description, str):
+        return False, "Invalid description format!"
+    if len(description) > DESCRIPTION_MAX_LENGTH:
+        return False, "Description too long! Maximum 500 characters allowed."
+    match = _DESCRIPTION_DANGER_RE.search(description.lower())
+    if match:
+        return False, f"Description contains dangerous pattern: {match.group()}"
+    return True, ""
+
+
+# ---------- benchmark ----------
+
+TITLES = [
+    "Read chapter 6 and take notes",
+    "Finish the study app, then review PR comments!",
+    "Lab report (draft) - due Friday",
+    "x" * 90,
+    "Fix the <script> tag in my notes",
+]
+DESCRIPTIONS = [
+    "Homework problems 6-10 from the textbook, show all work.",
+    "Meet the group in the library at 3pm to split up the slides. " * 5,
+    "",
+    "Check why javascript:void(0) shows up in the exported notes.",
+]
+
+
+def run(label, func, values, number):
+    seconds = timeit.timeit(lambda: [func(v) for v in values], number=number)
+    per_call = seconds / (number * len(values)) * 1e6
+    print(f"  {label:<28} {per_call:8.2f} us/call")
+    return per_call
+
+
+def main(number=20000):
+    for name, new, old, regex, values in (
+        ("title", validate_task_title, legacy_validate_task_title,
+         regex_validate_task_title, TITLES),
+        ("description", validate_task_description, legacy_validate_task_description,
+         regex_validate_task_description, DESCRIPTIONS),
+    ):
+        for value in values:
+            assert new(value)[0] == old(value)[0] == regex(value)[0]
+        print(f"{name}:")
+        old_us = run("original", old, values, number)
+        new_us = run("precompiled ('in' scan)", new, values, number)
+        regex_us = run("alternation regex", regex, values, number)
+        print(f"  speed-up {old_us / new_us:.2f}x ('in' scan), {old_us / regex_us:.2f}x (regex)")
+
+    records = [{"header": TITLES[i % len(TITLES)], "description": DESCRIPTIONS[i % len(DESCRIPTIONS)],
+                "due_date": ""} for i in range(10000)]
+    seconds = timeit.timeit(lambda: sum(1 for _ in validate_tasks(records)), number=5) / 5
+    print(f"validate_tasks: {len(records)} records in {seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -50,6 +50,15 @@ class StudyApp(MDApp):
         # returns root widget from study.kv
         from kivy.factory import Factory
         return Factory.RootWidget()
+
+    def on_stop(self):
+        # Make sure background saves reach the disk before the app exits
+        try:
+            for screen in self.root.ids.screen_manager_root.screens:
+                if hasattr(screen, "flush_pending"):
+                    screen.flush_pending()
+        except Exception as e:
+            print(f"Error flushing saves on exit: {e}")
     
 if __name__ == "__main__":
     StudyApp().run()
\ No newline at end of file
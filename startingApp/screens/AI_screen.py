@@ -14,6 +14,8 @@ from openai import OpenAI
 import os
 from dotenv import load_dotenv
 
+from screens.card_model import Card
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -188,18 +190,8 @@ class AIWordScreen(MDScreen):
         
         # Add the card (front = word, back = definition)
         if flashcards_screen and self.current_word and self.current_definition:
-            flashcards_screen.cards.append({
-                "front": self.current_word,
-                "back": self.current_definition
-            })
-            
-            # If this is the first card, set the index
-            if len(flashcards_screen.cards) == 1:
-                flashcards_screen.current_index = 0
-                flashcards_screen.showing_back = False
-            
-            # Update the display
-            flashcards_screen._update_current_text()
+            # Saved and undoable from the flashcards screen; one `cards` update
+            flashcards_screen.add_cards([Card(self.current_word, self.current_definition)])
             
             # Close the dialog and show success message
             self._close_dialog()
@@ -0,0 +1,35 @@
+# card_model.py
+# Compact in-memory flashcard.
+#
+# A deck can hold tens of thousands of cards, and a dict per card costs a
+# couple of hundred bytes before any text is stored. Card uses __slots__
+# (no per-instance __dict__), which roughly halves that; see
+# benchmarks/bench_card_memory.py. Screens and the repository read and
+# write cards only through these attributes, so the representation can
+# change again without touching them.
+
+
+class Card:
+    """One flashcard: text plus its storage id, position and due date."""
+
+    __slots__ = ("id", "front", "back", "position", "due")
+
+    def __init__(self, front="", back="", id=None, position=None, due=""):
+        self.id = id
+        self.front = front
+        self.back = back
+        self.position = position   # sort key in the deck (set when first saved)
+        self.due = due             # ISO date of the next review, '' = new (due now)
+
+    @classmethod
+    def new(cls, source):
+        """An unsaved card with the text of `source` (a Card or a {"front", "back"} dict)."""
+        if isinstance(source, Card):
+            return cls(source.front, source.back)
+        return cls(source.get("front", ""), source.get("back", ""))
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"Card(id={self.id!r}, front={self.front!r})"
@@ -0,0 +1,136 @@
+# card_repository.py
+# SQLite storage for flashcards (stdlib sqlite3, one row per card).
+#
+# Every edit writes only the card it touches: adding a card is one INSERT,
+# deleting one is one DELETE. Cards are ordered by a numeric `position`;
+# new cards go after the last one, and a card restored by undo keeps its
+# old position, so it lands back where it was without renumbering others.
+#
+# Reading is paged (pages()), so the screen can show the first cards while
+# the rest of a large deck is still being read.
+#
+# `due` is the ISO date a card is next due for review ('' for a new card,
+# which is due right away); decks report how many cards are due.
+#
+# As with the task repository, every statement runs under `self.lock`.
+
+import sqlite3
+import threading
+from datetime import date
+from pathlib import Path
+
+from screens.card_model import Card
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cards (
+    id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    front    TEXT NOT NULL,
+    back     TEXT NOT NULL DEFAULT '',
+    position REAL NOT NULL,
+    due      TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_cards_position ON cards(position);
+"""
+
+PAGE_SIZE = 200
+
+
+class CardRepository:
+    """Row-level access to the cards table."""
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+        self.conn.commit()
+
+    def _migrate(self):
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(cards)")}
+        if "due" not in columns:
+            self.conn.execute("ALTER TABLE cards ADD COLUMN due TEXT NOT NULL DEFAULT ''")
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    @staticmethod
+    def _to_card(row):
+        return Card(row["front"], row["back"], row["id"], row["position"], row["due"])
+
+    # ---------- reads ----------
+
+    def pages(self, size=PAGE_SIZE):
+        """Yield the deck in display order, `size` cards at a time."""
+        position, last_id = float("-inf"), -1
+        while True:
+            with self.lock:
+                rows = self.conn.execute(
+                    "SELECT * FROM cards WHERE (position, id) > (?, ?) "
+                    "ORDER BY position, id LIMIT ?",
+                    (position, last_id, size),
+                ).fetchall()
+            if not rows:
+                return
+            yield [self._to_card(row) for row in rows]
+            position, last_id = rows[-1]["position"], rows[-1]["id"]
+
+    def all(self):
+        return [card for page in self.pages() for card in page]
+
+    def count(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM cards").fetchone()[0]
+
+    def due_count(self, today=None):
+        """Cards due on or before today (new cards included)."""
+        today = (today or date.today()).isoformat()
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM cards WHERE due <= ?",
+                                     (today,)).fetchone()[0]
+
+    # ---------- writes (one row each) ----------
+
+    def put(self, card):
+        """
+        Save a Card. A card without an id is added after the last one (and
+        gets its id and position); a card with one is written back under
+        that id, which also restores a deleted card (undo). Returns the id.
+        """
+        with self.lock, self.conn:
+            return self._put(card)
+
+    def write_batch(self, put=(), delete=()):
+        """Delete the cards with ids in `delete`, then save the cards in `put`, in one transaction."""
+        with self.lock, self.conn:
+            self.conn.executemany("DELETE FROM cards WHERE id = ?", ((card_id,) for card_id in delete))
+            for card in put:
+                self._put(card)
+
+    def _put(self, card):
+        if card.position is None:
+            last = self.conn.execute("SELECT MAX(position) FROM cards").fetchone()[0]
+            card.position = 0.0 if last is None else float(int(last) + 1)
+        cursor = self.conn.execute(
+            "INSERT OR REPLACE INTO cards (id, front, back, position, due) VALUES (?, ?, ?, ?, ?)",
+            (card.id, card.front, card.back, card.position, card.due),
+        )
+        if card.id is None:
+            card.id = cursor.lastrowid
+        return card.id
+
+    def update(self, card_id, **fields):
+        columns = {key: value for key, value in fields.items() if key in ("front", "back", "position", "due")}
+        if not columns:
+            return
+        assignments = ", ".join(f"{name} = ?" for name in columns)
+        with self.lock, self.conn:
+            self.conn.execute(f"UPDATE cards SET {assignments} WHERE id = ?",
+                              (*columns.values(), card_id))
+
+    def delete(self, card_id):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM cards WHERE id = ?", (card_id,))
+
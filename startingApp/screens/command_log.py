@@ -0,0 +1,109 @@
+# command_log.py
+# Undo/redo history made of inverse commands.
+#
+# Each edit records a pair of callables: `undo` puts back what the edit
+# changed, `redo` applies it again. The closures only hold the data the
+# edit touched (a task's old fields, a deleted card), never a copy of the
+# whole list. The history is bounded by an approximate memory budget and
+# an entry limit; the oldest entries are dropped first.
+
+import sys
+
+DEFAULT_BUDGET = 256 * 1024   # bytes, approximate
+DEFAULT_MAX_ENTRIES = 100
+
+
+def estimate_size(obj):
+    """Rough deep size in bytes of plain data (dicts, lists, tuples, sets, strings, __slots__ objects)."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(estimate_size(key) + estimate_size(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item) for item in obj)
+    elif hasattr(type(obj), "__slots__"):
+        size += sum(estimate_size(getattr(obj, name, None)) for name in type(obj).__slots__)
+    return size
+
+
+class Command:
+    """One undoable edit."""
+
+    __slots__ = ("label", "undo", "redo", "size")
+
+    def __init__(self, label, undo, redo, size):
+        self.label = label
+        self.undo = undo
+        self.redo = redo
+        self.size = size
+
+
+class CommandLog:
+    """Undo and redo stacks of Commands within a memory budget."""
+
+    def __init__(self, budget=DEFAULT_BUDGET, max_entries=DEFAULT_MAX_ENTRIES):
+        self.budget = budget
+        self.max_entries = max_entries
+        self._undo = []
+        self._redo = []
+        self._bytes = 0
+        self.replaying = False   # True while an undo/redo runs
+
+    def record(self, label, undo, redo, payload=None):
+        """
+        Add an edit to the history (clears the redo stack). `payload` is the
+        data the closures keep alive; it is only used to size the entry.
+        Edits made while undoing or redoing are not recorded.
+        """
+        if self.replaying:
+            return
+        self._drop(self._redo)
+        size = estimate_size(payload) + sys.getsizeof(label)
+        if size > self.budget:
+            # Too big to keep: it can't be undone, and older entries would
+            # no longer apply on top of it either.
+            self.clear()
+            return
+        self._undo.append(Command(label, undo, redo, size))
+        self._bytes += size
+        while self._undo and (self._bytes > self.budget or len(self._undo) > self.max_entries):
+            self._bytes -= self._undo.pop(0).size
+
+    def undo(self):
+        """Undo the latest edit. Returns its label, or None if there was nothing to undo."""
+        return self._replay(self._undo, self._redo, "undo")
+
+    def redo(self):
+        return self._replay(self._redo, self._undo, "redo")
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def clear(self):
+        self._undo = []
+        self._redo = []
+        self._bytes = 0
+
+    def stats(self):
+        return {"undo": len(self._undo), "redo": len(self._redo), "bytes": self._bytes}
+
+    # ---------- internals ----------
+
+    def _drop(self, stack):
+        for command in stack:
+            self._bytes -= command.size
+        stack.clear()
+
+    def _replay(self, source, target, action):
+        if not source:
+            return None
+        command = source.pop()
+        self.replaying = True
+        try:
+            getattr(command, action)()
+        finally:
+            self.replaying = False
+        target.append(command)
+        return command.label
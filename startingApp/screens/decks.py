@@ -0,0 +1,37 @@
+# decks.py
+# Named flashcard decks, one SQLite file (card_repository.py) per deck.
+#
+# The deck manifest also records each deck's card count and due count, so
+# the deck picker can show them without opening any deck: startup reads
+# only the manifest. A deck's cards are read when it is opened, and closing
+# it records its counts and drops its connection (the screen drops the
+# cards). The first deck is the original flashcards.db.
+
+from screens.card_repository import CardRepository
+from screens.task_lists import TaskListStore
+
+DEFAULT_DECK = "My Cards"
+
+
+class DeckStore(TaskListStore):
+    """Manifest of decks with their counts; opens each deck's file on demand."""
+
+    default_name = DEFAULT_DECK
+    kind = "Deck"
+    repository = CardRepository
+
+    def summary(self, name):
+        """{"cards": n, "due": n} as last recorded in the manifest."""
+        info = self.info(name)
+        return {"cards": info.get("cards", 0), "due": info.get("due", 0)}
+
+    def record_counts(self, name, today=None):
+        """Store an open deck's current counts in the manifest."""
+        repo = self.open(name)
+        self.set_info(name, cards=repo.count(), due=repo.due_count(today))
+
+    def close_deck(self, name):
+        """Record the deck's counts and close its file."""
+        if self.is_open(name):
+            self.record_counts(name)
+            self.close(name)
@@ -0,0 +1,93 @@
+# due_index.py
+# Due dates kept in sorted order for date-based views.
+#
+# Each task's MM/DD/YYYY string is parsed once, when the task is indexed,
+# into a day number (date.toordinal()). The (day, task id) pairs live in a
+# sorted list, so "overdue", "due today" and "due in the next N days" are
+# bisect range queries instead of a strptime over every task.
+
+from bisect import bisect_left, insort
+from datetime import date, datetime
+
+UI_DATE_FORMAT = "%m/%d/%Y"
+
+
+def due_ordinal(due_date):
+    """'12/31/2025' -> day number, or None for an empty/invalid date."""
+    if not due_date:
+        return None
+    try:
+        return datetime.strptime(due_date.strip(), UI_DATE_FORMAT).date().toordinal()
+    except ValueError:
+        return None
+
+
+class DueDateIndex:
+    """Sorted (due day, task id) pairs with range queries."""
+
+    def __init__(self, tasks=()):
+        self._entries = []   # sorted [(ordinal, task id)]
+        self._due_of = {}    # task id -> ordinal
+        for task in tasks:
+            self.add(task)
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ---------- updates ----------
+
+    def add(self, task):
+        """Index a task (or re-index it after its due date or state changed)."""
+        task_id = task["id"]
+        self.remove(task_id)
+        if task.get("completed", False):
+            return  # done tasks are not due any more
+        ordinal = due_ordinal(task.get("due_date", ""))
+        if ordinal is None:
+            return
+        insort(self._entries, (ordinal, task_id))
+        self._due_of[task_id] = ordinal
+
+    update = add
+
+    def remove(self, task_id):
+        ordinal = self._due_of.pop(task_id, None)
+        if ordinal is None:
+            return
+        pos = bisect_left(self._entries, (ordinal, task_id))
+        if pos < len(self._entries) and self._entries[pos] == (ordinal, task_id):
+            del self._entries[pos]
+
+    # ---------- queries (day numbers, inclusive ranges) ----------
+
+    def between(self, first_day, last_day):
+        """Ids of tasks due from first_day to last_day (None = open end), soonest first."""
+        start = 0 if first_day is None else bisect_left(self._entries, (first_day,))
+        end = len(self._entries) if last_day is None else bisect_left(self._entries, (last_day + 1,))
+        return [task_id for _, task_id in self._entries[start:end]]
+
+    def overdue(self, today=None):
+        return self.between(None, self._today(today) - 1)
+
+    def due_today(self, today=None):
+        day = self._today(today)
+        return self.between(day, day)
+
+    def upcoming(self, days=7, today=None):
+        """Due after today, within the next `days` days."""
+        day = self._today(today)
+        return self.between(day + 1, day + days)
+
+    def groups(self, days=7, today=None):
+        """[(title, ids)] for the overdue / today / upcoming sections."""
+        return [
+            ("Overdue", self.overdue(today)),
+            ("Today", self.due_today(today)),
+            (f"Next {days} days", self.upcoming(days, today)),
+        ]
+
+    @staticmethod
+    def _today(today):
+        if today is None:
+            return date.today().toordinal()
+        return today.toordinal() if isinstance(today, date) else today
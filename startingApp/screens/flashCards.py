@@ -1,7 +1,7 @@
 from kivymd.uix.screen import MDScreen
-from kivy.properties import ListProperty, NumericProperty, BooleanProperty, StringProperty
-from kivy.uix.boxlayout import BoxLayout
+from kivy.properties import ListProperty, NumericProperty, BooleanProperty, StringProperty, ObjectProperty
 from kivy.app import App
+from kivy.clock import Clock
 
 from kivymd.uix.dialog import (
     MDDialog,
@@ -16,9 +16,54 @@ from kivymd.uix.button import MDButton, MDButtonText
 from kivymd.uix.textfield import MDTextField
 from kivymd.uix.label import MDLabel
 from kivymd.uix.card import MDCard
-from kivy.uix.scrollview import ScrollView
-from kivy.uix.gridlayout import GridLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.metrics import dp
+from itertools import islice
+from pathlib import Path
+
+from screens.card_model import Card
+from screens.command_log import CommandLog
+from screens.decks import DEFAULT_DECK, DeckStore
+from screens.render_trigger import RenderTrigger
+
+# Cards are saved one row at a time next to this file
+CARDS_DB = Path(__file__).parent / "flashcards.db"
+DECKS_FILE = Path(__file__).parent / "decks.json"
+DECKS_DIR = Path(__file__).parent / "decks"
+
+# Named decks: the default deck is flashcards.db, every other deck has its
+# own database file. Only the manifest (names and counts) is read up front.
+decks = DeckStore(DECKS_FILE, DECKS_DIR, CARDS_DB)
+
+PREVIEW_LENGTH = 60  # characters of the front shown on a grid tile
+
+
+# ==================== VIRTUALIZED CARD GRID ====================
+
+class CardRecycleView(RecycleView):
+    """
+    Grid of all cards that only creates tiles for the ones on screen.
+    `data` holds one dict per card (see FlashCardsScreen._card_preview);
+    tiles are recycled while scrolling. Layout and tile look live in study.kv.
+    """
+    screen = ObjectProperty(None, allownone=True)
+
+
+class CardTileView(RecycleDataViewBehavior, MDCard):
+    """One recycled grid tile: card number and a preview of the front."""
+    card_index = NumericProperty(0)
+    number_text = StringProperty("")
+    preview_text = StringProperty("")
+    screen = ObjectProperty(None, allownone=True)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.screen = rv.screen
+        return super().refresh_view_attrs(rv, index, data)
+
+    def on_release(self, *args):
+        if self.screen is not None:
+            self.screen._jump_to_card(self.card_index)
 
 
 class FlashCardsScreen(MDScreen):
@@ -27,12 +72,14 @@ class FlashCardsScreen(MDScreen):
     showing_back = BooleanProperty(False)
     current_text = StringProperty("No cards yet. Add one!")
     view_mode = StringProperty("single")  # "single" or "grid"
+    current_deck = StringProperty(DEFAULT_DECK)
 
     # ----------------------------
     # Screen Lifecycle
     # ----------------------------
     def on_pre_enter(self, *args):
         App.get_running_app().flashcards_screen = self
+        self._ensure_loaded()
 
         if self.current_index >= len(self.cards):
             self.current_index = max(0, len(self.cards) - 1)
@@ -40,6 +87,154 @@ class FlashCardsScreen(MDScreen):
         self.showing_back = False
         self._update_current_text()
 
+    # ----------------------------
+    # Loading (a page per frame)
+    # ----------------------------
+    def _ensure_loaded(self):
+        """
+        Open the card database once. The first page of cards is shown right
+        away and the rest is read a page per frame.
+        """
+        if getattr(self, "repo", None) is None:
+            self.repo = decks.open(self.current_deck)
+            self._pages = self.repo.pages()
+            self._load_page()
+
+    def _load_page(self, *args):
+        page = next(self._pages, None)
+        if page is None:
+            self._pages = None
+            return
+        self._append_loaded(page)
+        self._page_event = Clock.schedule_once(self._load_page, 0)
+
+    def _all_cards(self):
+        """
+        The whole deck, for edits: the cards loaded so far plus the pages
+        not read yet. Those are read now but not added to `cards`, so the
+        edit's own assignment is the only update.
+        """
+        self._ensure_loaded()
+        cards = list(self.cards)
+        if getattr(self, "_pages", None) is not None:
+            self._page_event.cancel()
+            cards.extend(card for page in self._pages for card in page)
+            self._pages = None
+        return cards
+
+    def _append_loaded(self, loaded):
+        """
+        Add cards read from the database. The card on screen stays as it
+        is, and an up-to-date grid gets tiles for just these cards instead
+        of being rebuilt.
+        """
+        start = len(self.cards)
+        self._appending = True
+        try:
+            self.cards.extend(loaded)
+        finally:
+            self._appending = False
+        grid_view = self.ids.get('card_grid_view')
+        if self.view_mode == "grid" and grid_view is not None and not self._render_trigger().pending:
+            grid_view.data.extend(self._card_preview(card, index)
+                                  for index, card in enumerate(loaded, start))
+
+    # ----------------------------
+    # Decks
+    # ----------------------------
+    def deck_names(self):
+        return decks.names()
+
+    def deck_summary(self, name):
+        """Card and due counts of a deck (the open deck is counted now)."""
+        if name == self.current_deck and getattr(self, "repo", None) is not None:
+            decks.record_counts(name)
+        return decks.summary(name)
+
+    def open_deck(self, name):
+        """Close the current deck (dropping its cards from memory) and show another."""
+        if name == self.current_deck or name not in decks.names():
+            return
+        self.close_deck()
+        self.current_deck = name
+        self.current_index = 0
+        self._ensure_loaded()
+        self._update_current_text()
+
+    def close_deck(self):
+        """Record the open deck's counts and evict its cards."""
+        if getattr(self, "repo", None) is None:
+            return
+        if getattr(self, "_pages", None) is not None:
+            self._page_event.cancel()
+            self._pages = None
+        decks.close_deck(self.current_deck)
+        self.repo = None
+        self.history = None  # its commands edit the closed deck
+        self.cards = []
+
+    def create_deck(self, name):
+        """Add a deck and show it. Raises ValueError if the name is invalid."""
+        name = decks.create(name)
+        self.open_deck(name)
+        return name
+
+    def flush_pending(self):
+        """Record the open deck's counts in the manifest (called when the app stops)."""
+        if getattr(self, "repo", None) is not None:
+            decks.record_counts(self.current_deck)
+
+    def open_deck_menu(self, caller):
+        """Drop-down of the decks with their counts, plus an entry to create one."""
+        from kivymd.uix.menu import MDDropdownMenu
+
+        def choose(name):
+            menu.dismiss()
+            self.open_deck(name)
+
+        def new_deck():
+            menu.dismiss()
+            self.open_new_deck_dialog()
+
+        items = []
+        for name in decks.names():
+            counts = self.deck_summary(name)
+            items.append({"text": f"{name} ({counts['cards']} cards, {counts['due']} due)",
+                          "on_release": lambda name=name: choose(name)})
+        items.append({"text": "New deck...", "leading_icon": "plus", "on_release": new_deck})
+        menu = MDDropdownMenu(caller=caller, items=items)
+        menu.open()
+
+    def open_new_deck_dialog(self):
+        from kivymd.uix.textfield import MDTextFieldHelperText, MDTextFieldHintText
+
+        helper = MDTextFieldHelperText(text="", mode="on_error")
+        field = MDTextField(MDTextFieldHintText(text="Deck name (e.g. Spanish verbs)"), helper)
+        content = MDDialogContentContainer(field, orientation="vertical", padding="12dp")
+
+        def create(*args):
+            try:
+                self.create_deck(field.text)
+            except ValueError as e:
+                helper.text = str(e)
+                field.error = True
+                return
+            dialog.dismiss()
+
+        dialog = MDDialog(
+            MDDialogHeadlineText(text="New Deck", halign="left"),
+            content,
+            MDDialogButtonContainer(
+                Widget(),
+                MDButton(MDButtonText(text="CANCEL"), style="text",
+                         on_release=lambda *args: dialog.dismiss()),
+                MDButton(MDButtonText(text="CREATE"), style="filled", on_release=create),
+                spacing="8dp",
+            ),
+            scrim_color=(0, 0, 0, 0.5),
+        )
+        dialog.open()
+
     # ----------------------------
     # Card Updating
     # ----------------------------
@@ -50,11 +245,12 @@ class FlashCardsScreen(MDScreen):
 
         idx = max(0, min(self.current_index, len(self.cards) - 1))
         card = self.cards[idx]
+        self._shown_card = card
 
         if self.showing_back:
-            text = card.get("back") or "(no back text)"
+            text = card.back or "(no back text)"
         else:
-            text = card.get("front") or "(no front text)"
+            text = card.front or "(no front text)"
 
         self.current_text = text
 
@@ -81,8 +277,12 @@ class FlashCardsScreen(MDScreen):
     def on_cards(self, *args):
         if self.current_index >= len(self.cards):
             self.current_index = max(0, len(self.cards) - 1)
-        self.showing_back = False
+        if not self.cards or self.cards[self.current_index] is not getattr(self, "_shown_card", None):
+            self.showing_back = False  # another card is shown now
         self._update_current_text()
+        if self.view_mode == "grid" and not getattr(self, "_appending", False):
+            # The grid shows stale cards
+            self.invalidate()
 
     # ----------------------------
     # View Mode Toggle
@@ -137,7 +337,6 @@ class FlashCardsScreen(MDScreen):
         try:
             single_container = self.ids.get('single_card_container')
             grid_container = self.ids.get('grid_view_container')
-            grid_scroll = self.ids.get('grid_scroll_view')
             left_arrow = self.ids.get('single_card_container_left_arrow')
             right_arrow = self.ids.get('single_card_container_right_arrow')
             view_btn = self.ids.get('view_toggle_btn')
@@ -169,98 +368,56 @@ class FlashCardsScreen(MDScreen):
                     if isinstance(child, MDButtonText):
                         child.text = "Back to Card"
             
-            # Build the grid
-            if grid_scroll:
-                self._build_grid(grid_scroll)
-            else:
-                print("grid_scroll_view not found!")
+            # Fill the grid
+            self._refresh_grid()
                 
         except Exception as e:
             print(f"Error showing grid view: {e}")
 
-    def _build_grid(self, scroll_view):
-        """Build the grid of cards"""
-        # Clear existing content
-        scroll_view.clear_widgets()
-        
-        if not self.cards:
-            # Show "no cards" message
-            no_cards = MDLabel(
-                text="No flashcards yet. Add some to get started!",
-                halign="center",
-                valign="middle",
-            )
-            scroll_view.add_widget(no_cards)
+    # ----------------------------
+    # Grid Rendering (coalesced)
+    # ----------------------------
+    def _render_trigger(self):
+        if getattr(self, "_renders", None) is None:
+            self._renders = RenderTrigger(self._refresh_grid)
+        return self._renders
+
+    def invalidate(self, *args):
+        """Rebuild the grid on the next frame; many card edits share one rebuild."""
+        self._render_trigger().request()
+
+    def flush_render(self):
+        return self._render_trigger().flush()
+
+    @property
+    def render_count(self):
+        return self._render_trigger().renders
+
+    def _refresh_grid(self):
+        """
+        Point the grid at the current cards. The RecycleView only creates
+        tiles for the cards on screen, however large the deck is.
+        """
+        self._render_trigger().rendered()
+        grid_view = self.ids.get('card_grid_view')
+        if grid_view is None:
+            print("card_grid_view not found!")
             return
-        
-        # Create grid layout
-        grid = GridLayout(
-            cols=2,
-            spacing=dp(15),
-            padding=dp(15),
-            size_hint_y=None,
-        )
-        grid.bind(minimum_height=grid.setter('height'))
-        
-        # Add each card to grid
-        for index, card in enumerate(self.cards):
-            card_widget = self._create_card_preview(card, index)
-            grid.add_widget(card_widget)
-        
-        scroll_view.add_widget(grid)
-
-    def _create_card_preview(self, card, index):
-        """Create a clickable preview card for the grid"""
-        # Get card text (front side)
-        front_text = card.get("front", "")
-        
-        # Truncate if too long
-        if len(front_text) > 60:
-            display_text = front_text[:60] + "..."
+        if self.view_mode == "grid":
+            grid_view.data = [self._card_preview(card, index)
+                              for index, card in enumerate(self.cards)]
+
+    @staticmethod
+    def _card_preview(card, index):
+        """Grid data for one card (tapping the tile jumps to it)."""
+        # Get card text (front side), truncated if too long
+        front_text = card.front
+        if len(front_text) > PREVIEW_LENGTH:
+            display_text = front_text[:PREVIEW_LENGTH] + "..."
         else:
             display_text = front_text
-        
-        # Create card widget
-        card_box = BoxLayout(
-            orientation="vertical",
-            size_hint_y=None,
-            height=dp(120),
-        )
-        
-        card_widget = MDCard(
-            orientation="vertical",
-            padding=dp(15),
-            size_hint_y=None,
-            height=dp(120),
-            ripple_behavior=True,
-            style="elevated",
-        )
-        
-        # Card number
-        number_label = MDLabel(
-            text=f"Card {index + 1}",
-            size_hint_y=None,
-            height=dp(20),
-            font_size="12sp",
-            theme_text_color="Secondary",
-        )
-        
-        # Card content
-        content_label = MDLabel(
-            text=display_text,
-            halign="center",
-            valign="middle",
-            font_size="14sp",
-        )
-        
-        card_widget.add_widget(number_label)
-        card_widget.add_widget(content_label)
-        
-        # Make clickable
-        card_widget.bind(on_release=lambda x: self._jump_to_card(index))
-        
-        card_box.add_widget(card_widget)
-        return card_box
+        return {"card_index": index, "number_text": f"Card {index + 1}",
+                "preview_text": display_text}
 
     def _jump_to_card(self, index):
         """Jump to specific card and return to single view"""
@@ -269,6 +426,103 @@ class FlashCardsScreen(MDScreen):
         self.view_mode = "single"
         self._show_single_view()
 
+    # ----------------------------
+    # Card Edits (undoable)
+    # ----------------------------
+    def _history(self):
+        if getattr(self, "history", None) is None:
+            self.history = CommandLog()
+        return self.history
+
+    def add_card(self, front, back=""):
+        """Append a card and save it; can be undone."""
+        return self.add_cards([Card(front, back)])[0]
+
+    def delete_card(self, index):
+        """Remove the card at index (and its row); can be undone."""
+        self.remove_cards([index])
+
+    # Batch edits: each writes one transaction, updates `cards` with a single
+    # assignment (so on_cards and the kv bindings run once, not per card)
+    # and records one undo entry. Add and delete entries keep only the
+    # cards they touched with their indexes; undo and redo put those back
+    # into (or take them out of) the current list.
+
+    def add_cards(self, cards):
+        """Append cards (any iterable of Cards or {"front", "back"} dicts). Returns the saved Cards."""
+        added = [Card.new(card) for card in cards]
+        if not added:
+            return []
+        before = self._all_cards()
+        placed = list(enumerate(added, len(before)))
+        self._commit_cards(before + added, put=added)
+        self._history().record(self._label("add", added),
+                               lambda: self._take_cards(added),
+                               lambda: self._insert_cards(placed), placed)
+        return added
+
+    def remove_cards(self, indexes):
+        """Remove the cards at the given indexes (out-of-range ones are ignored)."""
+        before = self._all_cards()
+        doomed = {index for index in indexes if 0 <= index < len(before)}
+        if not doomed:
+            if len(before) > len(self.cards):
+                self.cards = before  # keep the pages read above
+            return
+        placed = [(index, before[index]) for index in sorted(doomed)]
+        removed = [card for _, card in placed]
+        after = [card for index, card in enumerate(before) if index not in doomed]
+        self._commit_cards(after, delete=removed)
+        self._history().record(self._label("delete", removed),
+                               lambda: self._insert_cards(placed),
+                               lambda: self._take_cards(removed), placed)
+
+    def replace_cards(self, cards):
+        """
+        Replace the whole deck with cards (any iterable of Cards or
+        {"front", "back"} dicts). Every card is touched, so the undo entry
+        holds both decks (and is sized, and evicted, accordingly).
+        """
+        before = self._all_cards()
+        after = [Card.new(card) for card in cards]
+        self._commit_cards(after, put=after, delete=before)
+        self._history().record("replace cards",
+                               lambda: self._commit_cards(before, put=before, delete=after),
+                               lambda: self._commit_cards(after, put=after, delete=before),
+                               before + after)
+
+    @staticmethod
+    def _label(action, cards):
+        return f"{action} card" if len(cards) == 1 else f"{action} {len(cards)} cards"
+
+    def _insert_cards(self, placed):
+        """Put (index, card) pairs back at their indexes, lowest first, and save them."""
+        rest = iter(self._all_cards())
+        cards = []
+        for index, card in placed:
+            cards.extend(islice(rest, index - len(cards)))
+            cards.append(card)
+        cards.extend(rest)
+        self._commit_cards(cards, put=[card for _, card in placed])
+
+    def _take_cards(self, taken):
+        """Remove these cards (matched by id) and delete their rows."""
+        ids = {card.id for card in taken}
+        self._commit_cards([card for card in self._all_cards() if card.id not in ids], delete=taken)
+
+    def _commit_cards(self, new_cards, put=(), delete=()):
+        """Save/delete rows in one transaction, then swap in the new list in one update."""
+        # New cards get their id and position here; undo and redo write
+        # them back under the same ones
+        self.repo.write_batch(put=put, delete=[card.id for card in delete])
+        self.cards = new_cards
+
+    def undo(self):
+        self._history().undo()
+
+    def redo(self):
+        self._history().redo()
+
     # ----------------------------
     # Add Flashcard Dialog
     # ----------------------------
@@ -331,15 +585,10 @@ class FlashCardsScreen(MDScreen):
                 pass
             return
 
-        # add card
-        self.cards.append({"front": front, "back": back})
-
-        if len(self.cards) == 1:
-            self.current_index = 0
-            self.showing_back = False
+        # add card (also updates the display)
+        self.add_cards([Card(front, back)])
 
-        # update display and close dialog
-        self._update_current_text()
+        # close dialog
         try:
             if getattr(self, "_add_dialog", None):
                 self._add_dialog.dismiss()
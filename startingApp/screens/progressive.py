@@ -0,0 +1,104 @@
+# progressive.py
+# Build a long list across several frames instead of in one.
+#
+# ProgressiveBuilder calls `build(item)` for each item in order, but stops
+# once a chunk has used up its time budget and continues on the next frame
+# (Clock.schedule_once). Callers pass the items that are on screen first,
+# and `first_count` of them are always built in the first chunk, so the
+# first frame already shows something useful. `on_chunk` runs after each
+# chunk, e.g. to hand the rows built so far to a RecycleView in one go.
+# The build can be cancelled at any time, e.g. when the data changes
+# before it finished.
+
+import time
+
+FRAME_BUDGET = 0.008  # seconds of building per frame (about half a 60 fps frame)
+
+
+class ProgressiveBuilder:
+    """Time-sliced loop over items, one chunk per frame."""
+
+    def __init__(self, items, build, first_count=0, budget=FRAME_BUDGET,
+                 on_chunk=None, on_done=None, clock=None, timer=time.perf_counter):
+        if clock is None:
+            from kivy.clock import Clock as clock
+        self._items = iter(items)
+        self._build = build
+        self._first_count = first_count
+        self._budget = budget
+        self._on_chunk = on_chunk
+        self._on_done = on_done
+        self._clock = clock
+        self._timer = timer
+        self._event = None
+        self.started = None
+        self.done = False
+        self.cancelled = False
+
+        # Metrics (read them through stats())
+        self.built = 0
+        self.chunks = 0
+        self.first_frame = None   # seconds from start() to the end of the first chunk
+        self.total = None         # seconds from start() to the last item
+
+    def start(self):
+        """Build the first chunk now; the rest follows on later frames."""
+        self.started = self._timer()
+        self._step(0)
+        return self
+
+    def cancel(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        if not self.done:
+            self.cancelled = True
+
+    def finish(self):
+        """Build everything that is left right away (e.g. before reading the result)."""
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        if not self.done and not self.cancelled:
+            self._budget = float("inf")
+            self._step(0)
+
+    def stats(self):
+        return {
+            "built": self.built,
+            "chunks": self.chunks,
+            "first_frame": self.first_frame,
+            "total": self.total,
+            "done": self.done,
+            "cancelled": self.cancelled,
+        }
+
+    def _step(self, dt):
+        self._event = None
+        if self.cancelled:
+            return
+        deadline = self._timer() + self._budget
+        minimum = self._first_count if self.chunks == 0 else 1
+        count = 0
+        for item in self._items:
+            self._build(item)
+            count += 1
+            if count >= minimum and self._timer() >= deadline:
+                break
+        else:
+            self._finish_chunk(count)
+            self.done = True
+            self.total = self._timer() - self.started
+            if self._on_done is not None:
+                self._on_done()
+            return
+        self._finish_chunk(count)
+        self._event = self._clock.schedule_once(self._step, 0)
+
+    def _finish_chunk(self, count):
+        self.built += count
+        self.chunks += 1
+        if self._on_chunk is not None:
+            self._on_chunk()
+        if self.first_frame is None:
+            self.first_frame = self._timer() - self.started
@@ -0,0 +1,72 @@
+# rank.py
+# Lexicographic rank keys for ordering tasks.
+#
+# Every task carries a string key and the list is sorted by it. To move a
+# task we only need a new key that sorts between its new neighbours, so a
+# reorder (or drag and drop) rewrites exactly one record.
+#
+# Keys use base-62 digits, which sort correctly as plain strings (ASCII).
+# Appending/prepending steps a fixed-width prefix by one, so keys at the
+# ends of the list stay RANK_WIDTH characters long; inserting between two
+# keys takes their midpoint, which adds at most one character.
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+RANK_WIDTH = 6
+
+_VALUE = {digit: i for i, digit in enumerate(DIGITS)}
+
+
+def _to_int(key):
+    value = 0
+    for digit in key[:RANK_WIDTH].ljust(RANK_WIDTH, "0"):
+        value = value * BASE + _VALUE[digit]
+    return value
+
+
+def _from_int(value):
+    digits = []
+    for _ in range(RANK_WIDTH):
+        value, rem = divmod(value, BASE)
+        digits.append(DIGITS[rem])
+    return "".join(reversed(digits))
+
+
+def _midpoint(before, after):
+    """Shortest-ish key strictly between before ('' = start) and after (None = end)."""
+    result = []
+    i = 0
+    while True:
+        low = _VALUE[before[i]] if i < len(before) else 0
+        high = _VALUE[after[i]] if after is not None and i < len(after) else BASE
+        if high - low > 1:
+            result.append(DIGITS[(low + high) // 2])
+            return "".join(result)
+        result.append(DIGITS[low])
+        if low < high:
+            after = None  # already below `after` at this digit
+        i += 1
+
+
+def rank_between(before=None, after=None):
+    """Return a key that sorts after `before` and before `after` (either may be None)."""
+    if before is not None and after is not None and not before < after:
+        raise ValueError(f"rank_between: {before!r} must sort before {after!r}")
+
+    if before is None and after is None:
+        return DIGITS[BASE // 2] + "0" * (RANK_WIDTH - 1)
+    if after is None:
+        value = _to_int(before) + 1
+        if value < BASE ** RANK_WIDTH:
+            return _from_int(value)
+    elif before is None:
+        value = _to_int(after) - 1
+        if value > 0 and _from_int(value) < after:
+            return _from_int(value)
+    return _midpoint(before or "", after)
+
+
+def initial_ranks(count):
+    """`count` evenly spaced keys in ascending order (for imports/migrations)."""
+    step = BASE ** RANK_WIDTH // (count + 1)
+    return [_from_int(step * (i + 1)) for i in range(count)]
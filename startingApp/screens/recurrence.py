@@ -0,0 +1,104 @@
+# recurrence.py
+# Repeat rules for recurring tasks.
+#
+# A recurring task is stored once, with its rule as text ("daily",
+# "every 3 days", "weekly mon,wed"). Its due_date is the next open
+# occurrence; the dates after it are never stored but generated on demand
+# by occurrences(), which walks forward from a start date and stops at the
+# end of the requested window. Completing an occurrence writes one row for
+# that date and moves the task on to the following occurrence.
+
+from datetime import date, timedelta
+from functools import lru_cache
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+MAX_INTERVAL_DAYS = 365
+
+
+class Recurrence:
+    """A parsed repeat rule: every `interval` days, or weekly on `weekdays`."""
+
+    def __init__(self, interval=1, weekdays=()):
+        self.interval = interval          # days between occurrences
+        self.weekdays = tuple(sorted(set(weekdays)))  # 0 = Monday; weekly rules only
+
+    def __eq__(self, other):
+        return (isinstance(other, Recurrence)
+                and (self.interval, self.weekdays) == (other.interval, other.weekdays))
+
+    def __hash__(self):
+        return hash((self.interval, self.weekdays))
+
+    def __str__(self):
+        """Canonical text, as stored with the task (parse_rule(str(r)) == r)."""
+        if self.weekdays:
+            return "weekly " + ",".join(WEEKDAYS[day] for day in self.weekdays)
+        if self.interval == 1:
+            return "daily"
+        return f"every {self.interval} days"
+
+    def matches(self, day):
+        """True if the rule repeats on `day` (interval rules match every day)."""
+        return not self.weekdays or day.weekday() in self.weekdays
+
+    def next_after(self, day):
+        """The first occurrence strictly after `day`."""
+        if not self.weekdays:
+            return day + timedelta(days=self.interval)
+        day += timedelta(days=1)
+        while day.weekday() not in self.weekdays:
+            day += timedelta(days=1)
+        return day
+
+
+@lru_cache(maxsize=256)
+def parse_rule(text):
+    """
+    'daily' | 'every N days' | 'weekly mon,wed,fri' -> Recurrence
+    (None for empty text). Raises ValueError with a message for the user.
+    """
+    words = (text or "").lower().replace(",", " ").split()
+    if not words:
+        return None
+    if words == ["daily"]:
+        return Recurrence(1)
+    if words[0] == "every" and len(words) == 3 and words[2] in ("day", "days"):
+        try:
+            interval = int(words[1])
+        except ValueError:
+            raise ValueError("Repeat interval must be a whole number of days!")
+        if not 1 <= interval <= MAX_INTERVAL_DAYS:
+            raise ValueError(f"Repeat interval must be 1-{MAX_INTERVAL_DAYS} days!")
+        return Recurrence(interval)
+    if words[0] == "weekly":
+        names = [word[:3] for word in words[1:]]
+        if not names or any(name not in WEEKDAYS for name in names):
+            raise ValueError("Weekly repeats need weekdays, e.g. 'weekly mon,wed'!")
+        return Recurrence(7, [WEEKDAYS.index(name) for name in names])
+    raise ValueError("Repeat must be 'daily', 'every N days' or 'weekly mon,wed'!")
+
+
+def occurrences(rule, first, start=None, end=None):
+    """
+    Lazily yield the dates rule produces from `first` on, within [start, end]
+    (both optional). Without an end the generator is infinite, so callers
+    take what they need from it.
+    """
+    day = first
+    if not rule.matches(day):
+        day = rule.next_after(day)
+    if start is not None and day < start:
+        if rule.weekdays:
+            day = rule.next_after(start - timedelta(days=1))
+        else:
+            # Jump straight to the window instead of stepping through it
+            skipped = -(-(start - day).days // rule.interval)
+            day += timedelta(days=skipped * rule.interval)
+    while end is None or day <= end:
+        yield day
+        day = rule.next_after(day)
+
+
+def first_occurrence(rule, first=None):
+    """The first occurrence on or after `first` (default: today)."""
+    return next(occurrences(rule, first or date.today()))
@@ -0,0 +1,173 @@
+# reminders.py
+# Due-date reminders driven by a min-heap.
+#
+# Pending reminders sit in a heap ordered by time. Only one Clock event is
+# ever armed, for the earliest entry; when it fires, every reminder that is
+# due is delivered and the event is re-armed for the next one. Changing or
+# cancelling a reminder only re-arms if the earliest entry changed. The app
+# therefore wakes up once per reminder, however many tasks there are.
+#
+# Entries are never removed from the middle of the heap: a rescheduled or
+# cancelled reminder just leaves a stale entry behind that is skipped when
+# it reaches the top (and swept out if stale entries pile up).
+
+import heapq
+import itertools
+import time
+from datetime import date, datetime, time as day_time
+
+from screens.due_index import due_ordinal
+
+REMINDER_HOUR = 9  # remind at 9:00 on the due day
+LATE_DELAY = 5     # seconds; tasks already past their reminder time are reminded this soon
+
+
+def reminder_time(task, hour=REMINDER_HOUR, now=None, reminded_on=None):
+    """
+    Epoch seconds to remind about a task, or None (done / no due date).
+    If 9:00 on the due day has already passed (added later that day, or
+    overdue), the reminder is due LATE_DELAY seconds from now instead,
+    unless `reminded_on` (the date the task was last reminded about, with
+    this due date) is today: a late reminder is given once a day.
+    """
+    if task.get("completed", False):
+        return None
+    ordinal = due_ordinal(task.get("due_date", ""))
+    if ordinal is None:
+        return None
+    when = datetime.combine(date.fromordinal(ordinal), day_time(hour)).timestamp()
+    now = time.time() if now is None else now
+    if when > now + LATE_DELAY:
+        return when
+    if reminded_on == date.fromtimestamp(now):
+        return None
+    return now + LATE_DELAY
+
+
+class ReminderScheduler:
+    """Heap of (time, key) reminders with a single armed Clock event."""
+
+    def __init__(self, notify, clock=None, now=time.time):
+        if clock is None:
+            from kivy.clock import Clock as clock
+        self._notify = notify    # called with the key of each due reminder
+        self._clock = clock
+        self._now = now
+        self._heap = []          # [time, seq, key], may contain stale entries
+        self._entry_of = {}      # key -> its live heap entry
+        self._seq = itertools.count()  # tie-breaker, keys need not be comparable
+        self._event = None
+        self._armed_for = None   # time the current Clock event is set for
+
+        # Counters (read them through stats())
+        self.wakeups = 0         # Clock callbacks
+        self.delivered = 0       # reminders passed to notify
+        self.arms = 0            # Clock events created
+
+    def __len__(self):
+        return len(self._entry_of)
+
+    # ---------- public API ----------
+
+    def schedule(self, key, when):
+        """Remind about key at `when` (epoch seconds); None or a past time cancels."""
+        if when is None or when <= self._now():
+            self.cancel(key)
+            return
+        old = self._entry_of.get(key)
+        if old is not None and old[0] == when:
+            return
+        if old is not None:
+            old[2] = None  # stale
+            self._sweep()
+        entry = [when, next(self._seq), key]
+        self._entry_of[key] = entry
+        heapq.heappush(self._heap, entry)
+        self._arm()
+
+    def schedule_many(self, items):
+        """schedule() for many (key, when) pairs: one heapify, one arm."""
+        now = self._now()
+        for key, when in items:
+            old = self._entry_of.pop(key, None)
+            if old is not None:
+                old[2] = None
+            if when is not None and when > now:
+                entry = [when, next(self._seq), key]
+                self._entry_of[key] = entry
+                self._heap.append(entry)
+        heapq.heapify(self._heap)
+        self._sweep()
+        self._arm()
+
+    def cancel(self, key):
+        entry = self._entry_of.pop(key, None)
+        if entry is None:
+            return
+        entry[2] = None
+        self._sweep()
+        self._arm()
+
+    def next_time(self):
+        """Time of the earliest pending reminder (None if there is none)."""
+        self._drop_stale_top()
+        return self._heap[0][0] if self._heap else None
+
+    def stop(self):
+        if self._event is not None:
+            self._event.cancel()
+        self._event = self._armed_for = None
+
+    def stats(self):
+        return {
+            "pending": len(self._entry_of),
+            "heap": len(self._heap),
+            "wakeups": self.wakeups,
+            "delivered": self.delivered,
+            "arms": self.arms,
+        }
+
+    # ---------- internals ----------
+
+    def _drop_stale_top(self):
+        while self._heap and self._heap[0][2] is None:
+            heapq.heappop(self._heap)
+
+    def _sweep(self):
+        # Rebuild once stale entries outnumber live ones
+        if len(self._heap) > 2 * len(self._entry_of) + 16:
+            self._heap = [entry for entry in self._heap if entry[2] is not None]
+            heapq.heapify(self._heap)
+
+    def _arm(self):
+        """Make sure exactly one Clock event is set, for the earliest reminder."""
+        when = self.next_time()
+        if when == self._armed_for:
+            return
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        self._armed_for = when
+        if when is not None:
+            self._event = self._clock.schedule_once(self._fire, max(0, when - self._now()))
+            self.arms += 1
+
+    def _fire(self, dt):
+        self.wakeups += 1
+        self._event = self._armed_for = None
+        now = self._now()
+        due = []
+        self._drop_stale_top()
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if entry[2] is not None:
+                del self._entry_of[entry[2]]
+                due.append(entry[2])
+            self._drop_stale_top()
+        for key in due:
+            self.delivered += 1
+            try:
+                self._notify(key)
+            except Exception as e:
+                print(f"Error in reminder: {e}")
+        self._arm()
@@ -0,0 +1,53 @@
+# render_trigger.py
+# Coalesce render requests: any number of invalidations in a frame -> one render.
+#
+# Edits call request() instead of rendering straight away. The first request
+# in a frame arms a Clock trigger (Clock.create_trigger); further requests in
+# the same frame are no-ops, and the render runs once on the next frame.
+# flush() renders a pending request right now (for code that reads the
+# widgets back, and for tests). The render function reports every render,
+# direct ones included, through rendered(), so `renders` counts them all.
+
+
+class RenderTrigger:
+    """Deferred, coalesced calls to a screen's render function."""
+
+    def __init__(self, render, clock=None):
+        if clock is None:
+            from kivy.clock import Clock as clock
+        self._render = render
+        self._trigger = clock.create_trigger(self._on_frame)
+        self.pending = False
+        self.requests = 0   # invalidations asked for
+        self.renders = 0    # renders actually done
+
+    def request(self, *args):
+        """Render on the next frame (accepts and ignores event arguments)."""
+        self.requests += 1
+        if not self.pending:
+            self.pending = True
+            self._trigger()
+
+    def flush(self):
+        """Run a pending render now. Returns True if there was one."""
+        if not self.pending:
+            return False
+        self._drop_pending()
+        self._render()
+        return True
+
+    def rendered(self):
+        """Called by the render function: counts it and drops any pending request."""
+        self.renders += 1
+        self._drop_pending()
+
+    def stats(self):
+        return {"requests": self.requests, "renders": self.renders, "pending": self.pending}
+
+    def _drop_pending(self):
+        if self.pending:
+            self.pending = False
+            self._trigger.cancel()
+
+    def _on_frame(self, dt):
+        self.flush()
@@ -0,0 +1,98 @@
+# tag_index.py
+# Tag -> task id sets for filtering the To-Do list by tag.
+#
+# Tags are lower-cased when they are parsed, so "Exam" and "exam" are the
+# same tag. The index is updated one task at a time; an AND filter
+# intersects the tag sets smallest first and an OR filter unions them, so
+# a query never looks at tasks that carry none of the requested tags.
+
+import re
+
+_SPLIT_RE = re.compile(r"[\s,]+")
+
+
+def parse_tags(text):
+    """'Exam, #bio  lab' -> ['exam', 'bio', 'lab'] (duplicates dropped, order kept)."""
+    tags = []
+    for part in _SPLIT_RE.split(text or ""):
+        tag = part.lstrip("#").lower()
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def task_tags(task):
+    return set(task.get("tags") or ())
+
+
+class TagIndex:
+    """Tag -> set of task ids, with AND / OR queries."""
+
+    def __init__(self, tasks=()):
+        self._ids_of = {}    # tag -> set of task ids
+        self._tags_of = {}   # task id -> set of tags
+        for task in tasks:
+            self.add(task)
+
+    def __len__(self):
+        return len(self._ids_of)
+
+    def __contains__(self, tag):
+        return tag in self._ids_of
+
+    # ---------- updates ----------
+
+    def add(self, task):
+        """Index a new task (or re-index one whose tags changed)."""
+        task_id = task["id"]
+        tags = task_tags(task)
+        old_tags = self._tags_of.get(task_id, set())
+        for tag in old_tags - tags:
+            self._unlink(tag, task_id)
+        for tag in tags - old_tags:
+            self._ids_of.setdefault(tag, set()).add(task_id)
+        if tags:
+            self._tags_of[task_id] = tags
+        else:
+            self._tags_of.pop(task_id, None)
+
+    update = add
+
+    def remove(self, task_id):
+        for tag in self._tags_of.pop(task_id, ()):
+            self._unlink(tag, task_id)
+
+    def _unlink(self, tag, task_id):
+        ids = self._ids_of.get(tag)
+        if ids is None:
+            return
+        ids.discard(task_id)
+        if not ids:
+            del self._ids_of[tag]
+
+    # ---------- queries ----------
+
+    def tags(self):
+        """Every tag in use, alphabetically."""
+        return sorted(self._ids_of)
+
+    def count(self, tag):
+        return len(self._ids_of.get(tag, ()))
+
+    def match(self, tags, mode="all"):
+        """
+        Ids of tasks carrying every tag (mode "all") or any tag (mode "any").
+        No tags returns None (meaning: no filter).
+        """
+        if not tags:
+            return None
+        sets = [self._ids_of.get(tag, set()) for tag in set(tags)]
+        if mode == "any":
+            return set().union(*sets)
+        sets.sort(key=len)
+        result = set(sets[0])
+        for ids in sets[1:]:
+            if not result:
+                break
+            result &= ids
+        return result
@@ -0,0 +1,54 @@
+# task_archive.py
+# Append-only cold storage for old completed tasks.
+#
+# Archived tasks are appended to a JSON-lines file, one task per line, and
+# removed from the live list. Nothing reads the file at startup; it is only
+# scanned (lazily, line by line) when the user browses the archive.
+
+import json
+import os
+from collections import deque
+from pathlib import Path
+
+
+class TaskArchive:
+    """Append-only JSON-lines file of archived task dicts."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def append(self, tasks):
+        """Append tasks in one write (fsync'd). Returns how many were written."""
+        lines = [json.dumps(task, ensure_ascii=False) + "\n" for task in tasks]
+        if not lines:
+            return 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(lines))
+            f.flush()
+            os.fsync(f.fileno())
+        return len(lines)
+
+    def __iter__(self):
+        """Archived tasks, oldest first, read one line at a time."""
+        try:
+            f = open(self.path, "r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A torn write at the end of the file only loses that line
+                    continue
+
+    def recent(self, limit=200):
+        """The `limit` most recently archived tasks, newest first."""
+        return list(reversed(deque(self, maxlen=limit)))
+
+    def count(self):
+        return sum(1 for _ in self)
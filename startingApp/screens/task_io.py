@@ -0,0 +1,321 @@
+# task_io.py
+# CSV and iCalendar (.ics) import/export for To-Do tasks.
+#
+# Everything streams: the readers are generators that yield one task dict
+# per CSV row / VEVENT / VTODO while reading the file line by line, and
+# validated_batches() runs them through the task validators a batch at a
+# time. Only the current batch is held in memory, so a file with tens of
+# thousands of records never has to be loaded whole. The writers take any
+# iterable of tasks and write as they go.
+
+import csv
+from datetime import date, datetime, timezone
+from itertools import islice
+
+from screens.due_index import due_ordinal
+from screens.recurrence import WEEKDAYS, first_occurrence, parse_rule
+from screens.tag_index import parse_tags
+from screens.task_validation import validate_tasks
+
+UI_DATE_FORMAT = "%m/%d/%Y"
+BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 20   # error messages kept for the user; the rest are only counted
+
+CSV_FIELDS = ["header", "description", "due_date", "completed", "tags", "recurrence"]
+# Other column names we understand (lower-cased)
+_CSV_ALIASES = {
+    "title": "header", "summary": "header", "task": "header", "name": "header",
+    "notes": "description", "details": "description",
+    "due": "due_date", "due date": "due_date", "date": "due_date",
+    "done": "completed", "status": "completed",
+    "categories": "tags", "labels": "tags",
+    "repeat": "recurrence", "rrule": "recurrence",
+}
+_TRUE_WORDS = {"1", "true", "yes", "y", "x", "done", "completed"}
+
+_ICS_DAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+
+def to_ui_date(text):
+    """MM/DD/YYYY, YYYY-MM-DD or YYYYMMDD[T...] -> 'MM/DD/YYYY' (unknown text is kept)."""
+    text = (text or "").strip()
+    if not text:
+        return ""
+    for fmt, length in (("%Y-%m-%d", 10), ("%Y%m%d", 8)):
+        try:
+            return datetime.strptime(text[:length], fmt).strftime(UI_DATE_FORMAT)
+        except ValueError:
+            pass
+    return text  # left for validate_due_date to report
+
+
+def _recurrence_text(text):
+    """Canonical repeat rule, or the raw text if it can't be parsed (reported later)."""
+    try:
+        rule = parse_rule(text)
+    except ValueError:
+        return text
+    return str(rule) if rule is not None else ""
+
+
+# ==================== CSV ====================
+
+def read_csv(fileobj):
+    """Yield a task dict per CSV row (the first row holds the column names)."""
+    reader = csv.reader(fileobj)
+    names = next(reader, None)
+    if names is None:
+        return
+    columns = []
+    for name in names:
+        name = name.strip().lower()
+        columns.append(name if name in CSV_FIELDS else _CSV_ALIASES.get(name))
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue  # blank line
+        fields = {column: cell for column, cell in zip(columns, row) if column}
+        yield {
+            "header": fields.get("header", "").strip(),
+            "description": fields.get("description", "").strip(),
+            "due_date": to_ui_date(fields.get("due_date", "")),
+            "completed": fields.get("completed", "").strip().lower() in _TRUE_WORDS,
+            "tags": parse_tags(fields.get("tags", "")),
+            "recurrence": _recurrence_text(fields.get("recurrence", "")),
+        }
+
+
+def write_csv(tasks, fileobj):
+    """Write tasks as CSV, one row at a time. Returns the number of rows."""
+    writer = csv.writer(fileobj)
+    writer.writerow(CSV_FIELDS)
+    count = 0
+    for task in tasks:
+        writer.writerow([
+            task.get("header", ""),
+            task.get("description", ""),
+            task.get("due_date", ""),
+            "1" if task.get("completed", False) else "0",
+            ",".join(task.get("tags") or ()),
+            task.get("recurrence", ""),
+        ])
+        count += 1
+    return count
+
+
+# ==================== iCalendar ====================
+
+def _unfold(lines):
+    """Join folded iCalendar lines (continuations start with a space or tab)."""
+    current = None
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def _unescape(value):
+    out = []
+    chars = iter(value)
+    for char in chars:
+        if char == "\\":
+            char = next(chars, "")
+            out.append("\n" if char in ("n", "N") else char)
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+def _escape(value):
+    return (value.replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\n", "\\n"))
+
+
+def _rrule_to_text(value):
+    """
+    RRULE value -> our repeat rule text. Raises ValueError (with a message
+    for the user) for rules we can't represent, so the record is reported
+    instead of being imported without its recurrence.
+    """
+    parts = dict(part.split("=", 1) for part in value.upper().split(";") if "=" in part)
+    freq = parts.get("FREQ")
+    try:
+        interval = int(parts.get("INTERVAL", "1"))
+    except ValueError:
+        raise ValueError(f"Repeat interval must be a whole number: RRULE:{value}")
+    if freq == "DAILY":
+        return "daily" if interval == 1 else f"every {interval} days"
+    if freq == "WEEKLY":
+        days = [day[-2:] for day in parts.get("BYDAY", "").split(",") if day[-2:] in _ICS_DAYS]
+        if days and interval == 1:
+            return "weekly " + ",".join(WEEKDAYS[_ICS_DAYS.index(day)] for day in days)
+        if not days:
+            return f"every {interval * 7} days"
+    raise ValueError(f"Unsupported repeat rule: RRULE:{value}")
+
+
+def _text_to_rrule(text):
+    rule = parse_rule(text)
+    if rule is None:
+        return ""
+    if rule.weekdays:
+        return "FREQ=WEEKLY;BYDAY=" + ",".join(_ICS_DAYS[day] for day in rule.weekdays)
+    return f"FREQ=DAILY;INTERVAL={rule.interval}"
+
+
+def read_ics(fileobj):
+    """
+    Yield a task dict per VTODO / VEVENT in an iCalendar stream. Components
+    nested inside one (VALARM, ...) are skipped, so their SUMMARY or
+    DESCRIPTION doesn't overwrite the task's.
+    """
+    task = None
+    depth = 0  # components open inside the current task
+    for line in _unfold(fileobj):
+        name, _, value = line.partition(":")
+        name, _, params = name.partition(";")
+        name = name.upper()
+        if task is None:
+            if name == "BEGIN" and value.upper() in ("VTODO", "VEVENT"):
+                task = {"header": "", "description": "", "due_date": "", "completed": False,
+                        "tags": [], "recurrence": ""}
+                start = ""
+                depth = 0
+        elif name == "BEGIN":
+            depth += 1
+        elif name == "END" and depth:
+            depth -= 1
+        elif depth:
+            continue
+        elif name == "END" and value.upper() in ("VTODO", "VEVENT"):
+            if not task["due_date"]:
+                task["due_date"] = to_ui_date(start)
+            yield task
+            task = None
+        elif name == "SUMMARY":
+            task["header"] = _unescape(value).strip()
+        elif name == "DESCRIPTION":
+            task["description"] = _unescape(value).strip()
+        elif name == "DUE":
+            task["due_date"] = to_ui_date(value)
+        elif name == "DTSTART":
+            start = value
+        elif name == "STATUS":
+            task["completed"] = value.upper() == "COMPLETED"
+        elif name == "COMPLETED":
+            task["completed"] = True
+        elif name == "CATEGORIES":
+            task["tags"] += parse_tags(_unescape(value))
+        elif name == "RRULE":
+            try:
+                task["recurrence"] = _rrule_to_text(value)
+            except ValueError as e:
+                task["import_error"] = str(e)
+
+
+def write_ics(tasks, fileobj, prodid="-//Study App//To-Do//EN"):
+    """Write tasks as VTODOs, one at a time. Returns the number written."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    fileobj.write(f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:{prodid}\r\n")
+    count = 0
+    for task in tasks:
+        lines = ["BEGIN:VTODO",
+                 f"UID:task-{task.get('id', count)}@study-app",
+                 f"DTSTAMP:{stamp}",
+                 f"SUMMARY:{_escape(task.get('header', ''))}"]
+        if task.get("description"):
+            lines.append(f"DESCRIPTION:{_escape(task['description'])}")
+        if task.get("due_date"):
+            due = datetime.strptime(task["due_date"], UI_DATE_FORMAT)
+            lines.append(f"DUE;VALUE=DATE:{due:%Y%m%d}")
+        lines.append("STATUS:COMPLETED" if task.get("completed") else "STATUS:NEEDS-ACTION")
+        if task.get("tags"):
+            lines.append("CATEGORIES:" + ",".join(_escape(tag) for tag in task["tags"]))
+        if task.get("recurrence"):
+            lines.append(f"RRULE:{_text_to_rrule(task['recurrence'])}")
+        lines.append("END:VTODO")
+        for line in lines:
+            fileobj.write(_fold(line))
+        count += 1
+    fileobj.write("END:VCALENDAR\r\n")
+    return count
+
+
+def _fold(line, width=75):
+    """Fold a content line to `width` characters (RFC 5545, 3.1)."""
+    chunks = [line[:width]]
+    for start in range(width, len(line), width - 1):
+        chunks.append(" " + line[start:start + width - 1])
+    return "\r\n".join(chunks) + "\r\n"
+
+
+# ==================== validation ====================
+
+def read_tasks(fileobj, kind):
+    """Reader for 'csv' or 'ics'."""
+    if kind == "csv":
+        return read_csv(fileobj)
+    if kind == "ics":
+        return read_ics(fileobj)
+    raise ValueError(f"Unsupported file type: {kind}")
+
+
+def new_report():
+    return {"imported": 0, "rejected": 0, "errors": []}
+
+
+def _record_errors(task, errors):
+    """Validation errors plus what task_errors doesn't check: reader errors and the repeat rule."""
+    problem = task.pop("import_error", "")
+    if problem:
+        errors = errors + [problem]
+    if task.get("recurrence"):
+        try:
+            parse_rule(task["recurrence"])
+        except ValueError as e:
+            errors = errors + [str(e)]
+    return errors
+
+
+def _align_recurring(task):
+    """A recurring task is due on its first occurrence, as when it is added by hand."""
+    rule = parse_rule(task.get("recurrence", ""))
+    if rule is None:
+        return
+    start = due_ordinal(task["due_date"])
+    start = date.fromordinal(start) if start else date.today()
+    task["due_date"] = first_occurrence(rule, start).strftime(UI_DATE_FORMAT)
+
+
+def validated_batches(records, report, batch_size=BATCH_SIZE):
+    """
+    Run records through the task validators and yield the valid ones in
+    lists of up to batch_size. Invalid records are counted in `report`
+    (with the first few messages kept for the user).
+    """
+    records = iter(records)
+    number = 0
+    while True:
+        chunk = list(islice(records, batch_size))
+        if not chunk:
+            return
+        batch = []
+        for _, task, errors in validate_tasks(chunk):
+            number += 1
+            errors = _record_errors(task, errors)
+            if errors:
+                report["rejected"] += 1
+                if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                    report["errors"].append(f"Record {number}: {errors[0]}")
+                continue
+            task["header"] = task["header"].strip()
+            _align_recurring(task)
+            batch.append(task)
+        report["imported"] += len(batch)
+        if batch:
+            yield batch
@@ -0,0 +1,80 @@
+# task_journal.py
+# Read-only loader for the JSON files older versions saved tasks in.
+#
+# Tasks now live in SQLite (task_repository.py); this is only used for the
+# one-time import when the default list's database is first created.
+#
+# Older versions kept a snapshot file with the whole list plus a journal of
+# edits made after it, one JSON line each. Loading replays the journal on
+# top of the snapshot. Both files carry a generation number: a journal left
+# over from an interrupted compaction has an older one and is not replayed.
+
+import json
+from pathlib import Path
+
+
+def read_legacy_tasks(snapshot_path, journal_path=None):
+    """Return the task list rebuilt from snapshot + journal ([] if there are none)."""
+    snapshot_path = Path(snapshot_path)
+    if journal_path is None:
+        journal_path = snapshot_path.with_suffix(".journal")
+    journal_path = Path(journal_path)
+
+    tasks, generation = _read_snapshot(snapshot_path)
+    if not journal_path.exists():
+        return tasks
+
+    with open(journal_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A torn write at the end of the log (crash mid-append)
+                # only loses that one edit.
+                print("Warning: skipping unreadable journal record.")
+                continue
+            if record.get("op") == "base":
+                if record.get("generation") != generation:
+                    # Left over from an interrupted compaction: its edits
+                    # are already part of the snapshot.
+                    break
+                continue
+            _apply(tasks, record)
+    return tasks
+
+
+def _read_snapshot(path):
+    """(tasks, generation) from the snapshot file."""
+    if not path.exists():
+        return [], 0
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            if isinstance(data, list):  # plain list written by the first versions
+                return data, 0
+            if isinstance(data, dict) and isinstance(data.get("tasks"), list):
+                return data["tasks"], data.get("generation", 0)
+    except Exception as e:
+        print(f"Warning: couldn't load tasks ({e}). Starting with empty list.")
+    return [], 0
+
+
+def _apply(tasks, record):
+    """Replay one journal record onto the list (ignores stale indexes)."""
+    op = record.get("op")
+    index = record.get("index", -1)
+    if op == "add":
+        tasks.append(record.get("task", {}))
+    elif op == "update":
+        if 0 <= index < len(tasks):
+            tasks[index].update(record.get("fields", {}))
+    elif op == "move":
+        dest = record.get("to", -1)
+        if 0 <= index < len(tasks) and 0 <= dest < len(tasks):
+            tasks.insert(dest, tasks.pop(index))
+    elif op == "delete":
+        if 0 <= index < len(tasks):
+            tasks.pop(index)
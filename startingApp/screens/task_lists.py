@@ -0,0 +1,164 @@
+# task_lists.py
+# Named task lists, one SQLite file (shard) per list.
+#
+# A small JSON manifest maps list names to their database files. Nothing
+# else is read at startup: a list's shard is opened the first time the
+# list is shown, and edits only ever touch the shard of the list they
+# belong to. The first list is the original todo_items.db, so existing
+# tasks simply become the default list.
+#
+# Flashcard decks (decks.py) use the same store with a different repository;
+# entries may carry extra fields (a deck's card counts), which are kept in
+# the manifest next to the name and file.
+
+import json
+import os
+import re
+from pathlib import Path
+
+from screens.task_repository import TaskRepository
+
+DEFAULT_LIST = "Tasks"
+LIST_NAME_MAX_LENGTH = 40
+_LIST_NAME_RE = re.compile(r"^[A-Za-z0-9 _\-]+$")
+
+
+def validate_list_name(name, existing=(), kind="List") -> tuple[bool, str]:
+    """
+    Check a new list (or deck) name.
+    Returns: (is_valid, error_message)
+    """
+    name = (name or "").strip()
+    if not name:
+        return False, f"{kind} name cannot be empty!"
+    if len(name) > LIST_NAME_MAX_LENGTH:
+        return False, f"{kind} name must be 1-{LIST_NAME_MAX_LENGTH} characters!"
+    if not _LIST_NAME_RE.match(name):
+        return False, f"{kind} name may only use letters, numbers, spaces, '-' and '_'."
+    if name.lower() in (other.lower() for other in existing):
+        return False, f"A {kind.lower()} named '{name}' already exists!"
+    return True, ""
+
+
+def _slug(name):
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_") or "list"
+
+
+class TaskListStore:
+    """Manifest of task lists; opens each list's shard on demand."""
+
+    default_name = DEFAULT_LIST
+    kind = "List"
+    repository = TaskRepository
+
+    def __init__(self, manifest_path, shard_dir, default_db):
+        self.manifest_path = Path(manifest_path)
+        self.shard_dir = Path(shard_dir)
+        self.default_db = Path(default_db)
+        self._files = None    # name -> shard path, in display order (read lazily)
+        self._info = {}       # name -> extra manifest fields
+        self._open = {}       # name -> repository
+
+    # ---------- manifest ----------
+
+    def _manifest(self):
+        if self._files is None:
+            self._files = {}
+            try:
+                with open(self.manifest_path, "r", encoding="utf-8") as f:
+                    for entry in json.load(f).get("lists", []):
+                        # Shard paths are stored relative to the manifest
+                        self._files[entry["name"]] = self.manifest_path.parent / entry["file"]
+                        self._info[entry["name"]] = {
+                            key: value for key, value in entry.items() if key not in ("name", "file")}
+            except FileNotFoundError:
+                pass
+            except (ValueError, KeyError, AttributeError) as e:
+                print(f"Warning: couldn't read task list manifest ({e}).")
+            if self.default_name not in self._files:
+                self._files = {self.default_name: self.default_db, **self._files}
+        return self._files
+
+    def _save_manifest(self):
+        data = {"lists": [{"name": name, "file": os.path.relpath(path, self.manifest_path.parent),
+                           **self._info.get(name, {})}
+                          for name, path in self._files.items()]}
+        tmp = self.manifest_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.manifest_path)
+
+    def names(self):
+        return list(self._manifest())
+
+    def path_for(self, name):
+        return self._manifest()[name]
+
+    def is_open(self, name):
+        return name in self._open
+
+    def info(self, name):
+        """Extra manifest fields of a list (empty if none were stored)."""
+        self._manifest()
+        return dict(self._info.get(name, {}))
+
+    def set_info(self, name, **fields):
+        """Store extra fields for a list in the manifest (rewritten only if they changed)."""
+        info = self.info(name)
+        if all(info.get(key) == value for key, value in fields.items()):
+            return
+        info.update(fields)
+        self._info[name] = info
+        self._save_manifest()
+
+    # ---------- lists ----------
+
+    def create(self, name):
+        """Add an empty list (its shard file is created when first opened)."""
+        name = (name or "").strip()
+        files = self._manifest()
+        is_valid, error_msg = validate_list_name(name, files, self.kind)
+        if not is_valid:
+            raise ValueError(error_msg)
+        taken = {path.name for path in files.values()}
+        base = _slug(name)
+        filename, number = f"{base}.db", 2
+        while filename in taken or (self.shard_dir / filename).exists():
+            filename, number = f"{base}_{number}.db", number + 1
+        files[name] = self.shard_dir / filename
+        self._save_manifest()
+        return name
+
+    def delete(self, name):
+        """Remove a list and its shard (the default list can't be deleted)."""
+        if name == self.default_name:
+            raise ValueError(f"The default {self.kind.lower()} can't be deleted!")
+        path = self._manifest().pop(name)
+        self._info.pop(name, None)
+        self._save_manifest()
+        repo = self._open.pop(name, None)
+        if repo is not None:
+            repo.close()
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def open(self, name):
+        """The list's repository, opening its shard the first time."""
+        repo = self._open.get(name)
+        if repo is None:
+            path = self.path_for(name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            repo = self._open[name] = self.repository(path)
+        return repo
+
+    def close(self, name=None):
+        """Close one list's shard, or all of them."""
+        names = list(self._open) if name is None else [name]
+        for name in names:
+            repo = self._open.pop(name, None)
+            if repo is not None:
+                repo.close()
@@ -0,0 +1,322 @@
+# task_repository.py
+# SQLite storage for the To-Do list (stdlib sqlite3, one row per task).
+#
+# The screen reads the list once at startup and afterwards only touches the
+# rows it changes. Due dates are kept as ISO strings (YYYY-MM-DD) in the
+# database so they sort and range-query correctly; the UI format MM/DD/YYYY
+# is converted at the boundary.
+#
+# Tasks are ordered by a string `rank` key (see rank.py), so moving a task
+# only rewrites that task's row. The older numeric sort_order column is kept
+# for databases created before ranks existed but is no longer read.
+#
+# Tags are stored in one comma-separated column (tags can't contain commas,
+# see task_validation.py); filtering happens in memory via tag_index.py.
+#
+# A recurring task is one row with its repeat rule as text (recurrence.py).
+# Its due_date is the next open occurrence; only completed occurrences get
+# a row in task_occurrences.
+#
+# The connection may be used from the background save thread as well as the
+# UI thread, so every statement runs under `self.lock`.
+
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from screens.rank import initial_ranks, rank_between
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    header      TEXT    NOT NULL,
+    description TEXT    NOT NULL DEFAULT '',
+    due_date    TEXT,
+    completed   INTEGER NOT NULL DEFAULT 0,
+    sort_order  REAL    NOT NULL DEFAULT 0,
+    rank        TEXT    NOT NULL DEFAULT '',
+    tags        TEXT    NOT NULL DEFAULT '',
+    recurrence  TEXT    NOT NULL DEFAULT '',
+    completed_at TEXT   NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks(due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed_due ON tasks(completed, due_date);
+
+CREATE TABLE IF NOT EXISTS task_occurrences (
+    task_id      INTEGER NOT NULL,
+    due_date     TEXT    NOT NULL,
+    completed_at TEXT    NOT NULL,
+    PRIMARY KEY (task_id, due_date)
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+UI_DATE_FORMAT = "%m/%d/%Y"
+
+
+def to_iso_date(ui_date):
+    """'12/31/2025' -> '2025-12-31' (None for empty/invalid input)."""
+    if not ui_date:
+        return None
+    try:
+        return datetime.strptime(ui_date.strip(), UI_DATE_FORMAT).date().isoformat()
+    except ValueError:
+        return None
+
+
+def to_ui_date(iso_date):
+    """'2025-12-31' -> '12/31/2025' ('' for NULL)."""
+    if not iso_date:
+        return ""
+    return date.fromisoformat(iso_date).strftime(UI_DATE_FORMAT)
+
+
+class TaskRepository:
+    """Row-level access to the tasks table."""
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+        self.conn.commit()
+
+    def _migrate(self):
+        """Give databases from before rank keys a rank column, in their old order."""
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(tasks)")}
+        if "rank" not in columns:
+            self.conn.execute("ALTER TABLE tasks ADD COLUMN rank TEXT NOT NULL DEFAULT ''")
+            ids = [row[0] for row in self.conn.execute("SELECT id FROM tasks ORDER BY sort_order")]
+            self.conn.executemany(
+                "UPDATE tasks SET rank = ? WHERE id = ?", zip(initial_ranks(len(ids)), ids)
+            )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_rank ON tasks(rank)")
+        if "tags" not in columns:
+            self.conn.execute("ALTER TABLE tasks ADD COLUMN tags TEXT NOT NULL DEFAULT ''")
+        if "recurrence" not in columns:
+            self.conn.execute("ALTER TABLE tasks ADD COLUMN recurrence TEXT NOT NULL DEFAULT ''")
+        if "completed_at" not in columns:
+            # Tasks completed before this column existed count as completed now
+            self.conn.execute("ALTER TABLE tasks ADD COLUMN completed_at TEXT NOT NULL DEFAULT ''")
+            self.conn.execute("UPDATE tasks SET completed_at = ? WHERE completed = 1",
+                              (datetime.now().isoformat(timespec="seconds"),))
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    # ---------- conversion ----------
+
+    @staticmethod
+    def _to_task(row):
+        return {
+            "id": row["id"],
+            "header": row["header"],
+            "description": row["description"],
+            "due_date": to_ui_date(row["due_date"]),
+            "completed": bool(row["completed"]),
+            "rank": row["rank"],
+            "tags": row["tags"].split(",") if row["tags"] else [],
+            "recurrence": row["recurrence"],
+            "completed_at": row["completed_at"],
+        }
+
+    @staticmethod
+    def _to_columns(fields):
+        """Map task-dict fields to column values (only the ones we store)."""
+        columns = {}
+        for key, value in fields.items():
+            if key == "due_date":
+                columns["due_date"] = to_iso_date(value)
+            elif key == "completed":
+                columns["completed"] = int(bool(value))
+            elif key in ("header", "description", "recurrence", "completed_at"):
+                columns[key] = value or ""
+            elif key == "rank" and value:
+                columns["rank"] = value
+            elif key == "tags":
+                columns["tags"] = ",".join(value or [])
+        return columns
+
+    # ---------- reads ----------
+
+    def all(self):
+        """Every task in display order."""
+        with self.lock:
+            rows = self.conn.execute("SELECT * FROM tasks ORDER BY rank").fetchall()
+        return [self._to_task(row) for row in rows]
+
+    def get(self, task_id):
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return self._to_task(row) if row else None
+
+    def count(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def incomplete_due_between(self, start, end):
+        """Incomplete tasks with start <= due date <= end (dates), soonest first."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT * FROM tasks WHERE completed = 0 AND due_date BETWEEN ? AND ? "
+                "ORDER BY due_date, rank",
+                (start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return [self._to_task(row) for row in rows]
+
+    def incomplete_due_this_week(self, today=None):
+        """Incomplete tasks due from today through the coming Sunday."""
+        today = today or date.today()
+        end_of_week = today + timedelta(days=6 - today.weekday())
+        return self.incomplete_due_between(today, end_of_week)
+
+    # ---------- writes (one row each) ----------
+
+    def add(self, task):
+        """Insert a task at the end of the list and return its new id."""
+        with self.lock, self.conn:
+            return self._insert(task)
+
+    def add_many(self, tasks):
+        """
+        Insert tasks (any iterable, e.g. a stream of import batches) at the
+        end of the list in a single transaction. Sets "id" and "rank" on each
+        dict and returns them as a list.
+        """
+        added = []
+        with self.lock, self.conn:
+            rank = self.last_rank()
+            for task in tasks:
+                if not task.get("rank"):
+                    rank = task["rank"] = rank_between(rank, None)
+                task["id"] = self._insert(task)
+                added.append(task)
+        return added
+
+    def last_rank(self):
+        with self.lock:
+            return self.conn.execute("SELECT MAX(rank) FROM tasks").fetchone()[0] or None
+
+    def _insert(self, task, task_id=None):
+        """Insert a row; task_id re-creates a deleted task under its old id (undo)."""
+        columns = self._to_columns(task)
+        if "rank" not in columns:
+            columns["rank"] = rank_between(self.last_rank(), None)
+            task["rank"] = columns["rank"]
+        if columns.get("completed") and not columns.get("completed_at"):
+            columns["completed_at"] = task["completed_at"] = datetime.now().isoformat(timespec="seconds")
+        cursor = self.conn.execute(
+            "INSERT INTO tasks (id, header, description, due_date, completed, sort_order, rank, "
+            "tags, recurrence, completed_at) VALUES (?, ?, ?, ?, ?, 0, ?, ?, ?, ?)",
+            (task_id, columns.get("header", ""), columns.get("description", ""),
+             columns.get("due_date"), columns.get("completed", 0), columns["rank"],
+             columns.get("tags", ""), columns.get("recurrence", ""),
+             columns.get("completed_at", "")),
+        )
+        return cursor.lastrowid
+
+    def update(self, task_id, **fields):
+        columns = self._to_columns(fields)
+        if not columns:
+            return
+        with self.lock, self.conn:
+            self._update(task_id, columns)
+
+    def _update(self, task_id, columns):
+        """Returns False if there is no such row."""
+        assignments = ", ".join(f"{name} = ?" for name in columns)
+        cursor = self.conn.execute(
+            f"UPDATE tasks SET {assignments} WHERE id = ?",
+            (*columns.values(), task_id),
+        )
+        return cursor.rowcount > 0
+
+    def delete(self, task_id):
+        with self.lock, self.conn:
+            self._delete(task_id)
+
+    def _delete(self, task_id):
+        self.conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        self.conn.execute("DELETE FROM task_occurrences WHERE task_id = ?", (task_id,))
+
+    def apply_changes(self, changes):
+        """
+        Write many row changes in one transaction.
+        `changes` maps task id -> task dict (latest state) or None (deleted).
+        A task whose row was already deleted is inserted again (undo of a delete).
+        """
+        with self.lock, self.conn:
+            for task_id, task in changes.items():
+                if task is None:
+                    self._delete(task_id)
+                else:
+                    columns = self._to_columns(task)
+                    if columns and not self._update(task_id, columns):
+                        self._insert(task, task_id)
+
+    # ---------- recurring task occurrences ----------
+
+    def complete_occurrence(self, task_id, due_date, completed_at=None):
+        """Record one completed occurrence (due_date in UI format) of a recurring task."""
+        completed_at = completed_at or datetime.now().isoformat(timespec="seconds")
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO task_occurrences (task_id, due_date, completed_at) "
+                "VALUES (?, ?, ?)",
+                (task_id, to_iso_date(due_date), completed_at),
+            )
+
+    def uncomplete_occurrence(self, task_id, due_date):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM task_occurrences WHERE task_id = ? AND due_date = ?",
+                (task_id, to_iso_date(due_date)),
+            )
+
+    def completed_occurrences(self, task_id):
+        """Due dates (UI format) of the completed occurrences of a task, oldest first."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT due_date FROM task_occurrences WHERE task_id = ? ORDER BY due_date",
+                (task_id,),
+            ).fetchall()
+        return [to_ui_date(row[0]) for row in rows]
+
+    # ---------- one-time JSON import ----------
+
+    def get_meta(self, key, default=None):
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def import_once(self, load_legacy):
+        """
+        Import the old JSON task list the first time the database is opened.
+        `load_legacy` is only called if the import has not happened yet.
+        Returns the number of imported tasks.
+        """
+        if self.get_meta("json_imported"):
+            return 0
+        tasks = load_legacy() or []
+        with self.lock, self.conn:
+            for task in tasks:
+                if isinstance(task, dict) and task.get("header"):
+                    self._insert(task)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_imported', '1')"
+            )
+        return len(tasks)
@@ -0,0 +1,102 @@
+# task_search.py
+# Incremental full-text search over tasks.
+#
+# An inverted index maps every word in a task's header and description to
+# the ids of the tasks containing it. A sorted list of the distinct words
+# lets a prefix ("chap" -> "chapter") be resolved with two bisects, so a
+# search costs about the size of its result, not the size of the list.
+# Adding, editing or deleting a task only touches that task's words.
+
+import re
+from bisect import bisect_left, insort
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Lower-cased words of text ([s] markup and punctuation are ignored)."""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def task_tokens(task):
+    return set(tokenize(task.get("header", "")) + tokenize(task.get("description", "")))
+
+
+class TaskSearchIndex:
+    """Word/prefix index of task ids."""
+
+    def __init__(self, tasks=()):
+        self._postings = {}    # word -> set of task ids
+        self._words_of = {}    # task id -> set of words
+        self._sorted_words = []
+        for task in tasks:
+            self.add(task)
+
+    def __len__(self):
+        return len(self._words_of)
+
+    # ---------- updates ----------
+
+    def add(self, task):
+        """Index a new task (or re-index one whose text changed)."""
+        task_id = task["id"]
+        words = task_tokens(task)
+        old_words = self._words_of.get(task_id, set())
+        for word in old_words - words:
+            self._unlink(word, task_id)
+        for word in words - old_words:
+            ids = self._postings.get(word)
+            if ids is None:
+                ids = self._postings[word] = set()
+                insort(self._sorted_words, word)
+            ids.add(task_id)
+        self._words_of[task_id] = words
+
+    update = add
+
+    def remove(self, task_id):
+        for word in self._words_of.pop(task_id, ()):
+            self._unlink(word, task_id)
+
+    def _unlink(self, word, task_id):
+        ids = self._postings.get(word)
+        if ids is None:
+            return
+        ids.discard(task_id)
+        if not ids:
+            del self._postings[word]
+            pos = bisect_left(self._sorted_words, word)
+            if pos < len(self._sorted_words) and self._sorted_words[pos] == word:
+                del self._sorted_words[pos]
+
+    # ---------- queries ----------
+
+    def _prefix_ids(self, prefix):
+        """Ids of tasks with a word starting with prefix."""
+        words = self._sorted_words
+        start = bisect_left(words, prefix)
+        # Words are [a-z0-9]+ and '{' sorts after 'z', so this ends the prefix range
+        end = bisect_left(words, prefix + "{", start)
+        if end - start == 1:
+            return self._postings[words[start]]
+        result = set()
+        for word in words[start:end]:
+            result |= self._postings[word]
+        return result
+
+    def search(self, query):
+        """
+        Ids of tasks matching every word of query; each word may be a prefix.
+        An empty query returns None (meaning: no filter).
+        """
+        words = tokenize(query)
+        if not words:
+            return None
+        # Longest words first: they usually match the fewest tasks
+        result = None
+        for word in sorted(set(words), key=len, reverse=True):
+            ids = self._prefix_ids(word)
+            result = set(ids) if result is None else result & ids
+            if not result:
+                return set()
+        return result
@@ -9,173 +9,186 @@ from kivy.clock import Clock
 import re
 from kivymd.uix.dialog import MDDialog, MDDialogButtonContainer, MDDialogHeadlineText
 from kivymd.uix.button import MDButton, MDButtonText
-from kivymd.uix.button import MDIconButton
 
+import csv
 import json
+import atexit
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from heapq import merge
+from bisect import bisect_left
 from typing import List
 
 from kivy.uix.modalview import ModalView
 from kivymd.uix.card import MDCard
 from kivymd.uix.label import MDLabel
 from kivy.uix.boxlayout import BoxLayout
-from kivymd.uix.selectioncontrol import MDCheckbox  # <-- NEW
-
-# Save file next to this python file (safer than CWD)
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.properties import BooleanProperty, ListProperty, ObjectProperty, StringProperty
+
+from screens.task_journal import read_legacy_tasks
+from screens.task_repository import TaskRepository
+from screens.write_behind import WriteBehind
+from screens.rank import rank_between
+from screens.task_search import TaskSearchIndex
+from screens.due_index import DueDateIndex, due_ordinal
+from screens.recurrence import first_occurrence, occurrences, parse_rule
+from screens.reminders import ReminderScheduler, reminder_time
+from screens.command_log import CommandLog
+from screens.task_lists import DEFAULT_LIST, TaskListStore
+from screens.task_archive import TaskArchive
+from screens.progressive import ProgressiveBuilder
+from screens.render_trigger import RenderTrigger
+from screens.task_io import new_report, read_tasks, validated_batches, write_csv, write_ics
+from screens.tag_index import TagIndex, parse_tags
+
+# Input validation (CWE-20) lives in task_validation.py: the patterns are
+# compiled once and the same rules gate bulk imports. Re-exported here.
+from screens.task_validation import (
+    validate_task_title,
+    validate_task_description,
+    validate_due_date,
+    validate_tags,
+    validate_tasks,
+)
+
+# Files next to this python file (safer than CWD). DATA_FILE and
+# JOURNAL_FILE are the JSON store of older versions, read once for import.
 DATA_FILE = Path(__file__).parent / "todo_items.json"
+JOURNAL_FILE = Path(__file__).parent / "todo_items.journal"
+DB_FILE = Path(__file__).parent / "todo_items.db"
+LISTS_FILE = Path(__file__).parent / "task_lists.json"
+LISTS_DIR = Path(__file__).parent / "task_lists"
+
+# Fields a completion changes (recorded for undo)
+COMPLETION_FIELDS = ("completed", "completed_at", "due_date")
+
+# Input fields shown only while the add-task box is expanded
+TASK_DETAIL_INPUTS = ("task_header_input", "task_description_input",
+                      "task_date_input", "task_tags_input", "task_repeat_input")
+
+# Completed tasks older than this are moved to the list's archive file
+# when the list is opened (or when "Archive now" is pressed).
+ARCHIVE_AFTER_DAYS = 30
+
+# A flat list longer than this gets its RecycleView data a chunk per frame
+# (the rows on screen first) instead of all in one frame.
+PROGRESSIVE_MIN_ROWS = 60
+ROW_HEIGHT = dp(50)
+
+# Named lists: the default list is todo_items.db, every other list has its
+# own database file. The manifest is only read when first needed.
+task_lists = TaskListStore(LISTS_FILE, LISTS_DIR, DB_FILE)
 
 
 def load_tasks():
-    """Load JSON tasks, return list on success or empty list on error."""
-    if not DATA_FILE.exists():
-        return []
+    """Tasks saved by older versions (JSON snapshot + journal), or [] on error."""
     try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return data
+        return read_legacy_tasks(DATA_FILE, JOURNAL_FILE)
     except Exception as e:
-        # If the file is corrupted or unreadable, warn and return empty list.
+        # If the files are corrupted or unreadable, warn and return empty list.
         print(f"Warning: couldn't load tasks ({e}). Starting with empty list.")
     return []
 
 
-def save_tasks(task_list):
-    """Save list of tasks to JSON (pretty-printed)."""
+def open_task_repository(name=DEFAULT_LIST):
+    """
+    Open the SQLite store of a task list. The first time the default list
+    is opened, any tasks from the old JSON file (snapshot + journal) are
+    imported into it.
+    """
+    repo = task_lists.open(name)
+    if name != DEFAULT_LIST:
+        return repo
     try:
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(task_list, f, ensure_ascii=False, indent=2)
+        imported = repo.import_once(load_tasks)
+        if imported:
+            print(f"Imported {imported} task(s) from {DATA_FILE.name}.")
     except Exception as e:
-        print(f"Error saving tasks: {e}")
+        print(f"Warning: couldn't import tasks from JSON ({e}).")
+    return repo
 
 
-# ==================== INPUT VALIDATION FUNCTIONS (CWE-20) ====================
+# ==================== VIRTUALIZED TASK LIST ====================
 
-def validate_task_title(title: str) -> tuple[bool, str]:
-    """
-    Validate task title to prevent injection attacks (CWE-20).
-    Returns: (is_valid, error_message)
-    """
-    if not title or not isinstance(title, str):
-        return False, "Task title cannot be empty!"
-    
-    # Enforce length constraints
-    if len(title) < 1 or len(title) > 100:
-        return False, "Task title must be between 1 and 100 characters!"
-    
-    # Check for potentially dangerous patterns
-    dangerous_patterns = ['<script', '</script>', 'javascript:', 'onerror=', 
-                         'onclick=', '<iframe', 'eval(', 'DROP TABLE', 
-                         'DELETE FROM', '--', '/*', '*/']
-    
-    title_lower = title.lower()
-    for pattern in dangerous_patterns:
-        if pattern in title_lower:
-            return False, f"Task title contains dangerous pattern: {pattern}"
-    
-    # Allow only safe characters: letters, numbers, spaces, and basic punctuation
-    if not re.match(r'^[a-zA-Z0-9\s\.,!?\-\(\)\'\"]+$', title):
-        return False, "Task title contains invalid characters!"
-    
-    return True, ""
-
-
-def validate_task_description(description: str) -> tuple[bool, str]:
-    """
-    Validate task description with stricter limits (CWE-20).
-    Returns: (is_valid, error_message)
-    """
-    if not description:
-        return True, ""  # Description is optional
-    
-    if not isinstance(description, str):
-        return False, "Invalid description format!"
-    
-    # Enforce maximum length to prevent resource exhaustion
-    if len(description) > 500:
-        return False, "Description too long! Maximum 500 characters allowed."
-    
-    # Check for dangerous patterns (XSS/SQL injection)
-    dangerous_patterns = ['<script', '</script>', 'javascript:', 'onerror=',
-                         'onclick=', '<iframe', 'eval(', 'DROP TABLE',
-                         'DELETE FROM', 'INSERT INTO', 'UPDATE ', '--', '/*']
-    
-    desc_lower = description.lower()
-    for pattern in dangerous_patterns:
-        if pattern in desc_lower:
-            return False, f"Description contains dangerous pattern: {pattern}"
-    
-    return True, ""
-
-
-def validate_due_date(due_date: str) -> tuple[bool, str]:
-    """
-    Validate due date format and logical constraints (CWE-20).
-    Accepts MM/DD/YYYY format (current UI format).
-    Returns: (is_valid, error_message)
-    """
-    if not due_date or not isinstance(due_date, str):
-        return True, ""  # Date is optional
-    
-    # Remove whitespace
-    due_date = due_date.strip()
-    
-    if not due_date:  # Empty after stripping
-        return True, ""
-    
-    # Validate format: MM/DD/YYYY (matching current UI format)
-    if not re.match(r'^(0[1-9]|1[0-2])/(0[1-9]|[12][0-9]|3[01])/(\d{4})$', due_date):
-        return False, "Invalid date format! Use MM/DD/YYYY (e.g., 12/31/2025)"
-    
-    # Parse and validate the date
-    try:
-        parsed_date = datetime.strptime(due_date, '%m/%d/%Y')
-    except ValueError:
-        return False, "Invalid date! Please check the day/month values."
-    
-    # Check if date is not too far in the past (allow up to 1 day in past for flexibility)
-    if parsed_date < datetime.now() - timedelta(days=1):
-        return False, "Due date cannot be in the past!"
-    
-    # Prevent unreasonably far future dates (max 5 years)
-    if parsed_date > datetime.now() + timedelta(days=1825):
-        return False, "Due date too far in the future! Maximum 5 years allowed."
-    
-    return True, ""
-
-
-def validate_tags(tags: List[str]) -> tuple[bool, str]:
+class TaskRecycleView(RecycleView):
     """
-    Validate tags list to prevent injection (CWE-20).
-    Returns: (is_valid, error_message)
+    Task list that only creates widgets for the rows on screen.
+    `data` holds one dict per task (see ToDoScreen._row_data), or per
+    section title in the grouped view; each names its widget class under
+    "viewclass". Row widgets are recycled while scrolling. Layout and row
+    look live in study.kv.
     """
-    if not tags:
-        return True, ""  # Tags are optional
-    
-    if not isinstance(tags, list):
-        return False, "Tags must be provided as a list!"
-    
-    # Limit number of tags
-    if len(tags) > 10:
-        return False, "Too many tags! Maximum 10 tags allowed."
-    
-    for tag in tags:
-        if not isinstance(tag, str):
-            return False, "Each tag must be a string!"
-        
-        # Validate each tag
-        if len(tag) < 1 or len(tag) > 20:
-            return False, "Each tag must be 1-20 characters!"
-        
-        # Only allow alphanumeric and hyphens
-        if not re.match(r'^[a-zA-Z0-9\-]+$', tag):
-            return False, f"Invalid tag '{tag}'! Use only letters, numbers, and hyphens."
-    
-    return True, ""
+    screen = ObjectProperty(None, allownone=True)
+
+
+class TaskRowView(RecycleDataViewBehavior, MDBoxLayout):
+    """One recycled task row: checkbox, header, description, due date, buttons."""
+    task_id = ObjectProperty(None, allownone=True)
+    header_text = StringProperty("")
+    desc_text = StringProperty("")
+    due_text = StringProperty("")
+    note_text = StringProperty("")    # repeat rule and tags, shown after the description
+    preview = BooleanProperty(False)  # a later occurrence of a recurring task (read-only)
+    completed = BooleanProperty(False)
+    can_move_up = BooleanProperty(False)
+    can_move_down = BooleanProperty(False)
+    selected = BooleanProperty(False)
+    select_mode = BooleanProperty(False)
+    screen = ObjectProperty(None, allownone=True)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.screen = rv.screen
+        return super().refresh_view_attrs(rv, index, data)
+
+    def _index(self):
+        if self.screen is None:
+            return None
+        return self.screen._index_of(self.task_id)
+
+    def on_checkbox(self, value):
+        index = self._index()
+        # Recycling a row sets `active` from data; only real clicks get through
+        if index is None or self.screen.task_list[index].get("completed", False) == value:
+            return
+        self.screen.toggle_task_complete(index, value)
+        # A recurring task moves on to its next occurrence and stays unchecked
+        task = self.screen.get_task(self.task_id)
+        checkbox = self.ids.get("checkbox")
+        if task is not None and checkbox is not None and checkbox.active != task["completed"]:
+            checkbox.active = task["completed"]
+
+    def move_up(self):
+        index = self._index()
+        if index is not None:
+            self.screen.move_task_up(index)
+
+    def move_down(self):
+        index = self._index()
+        if index is not None:
+            self.screen.move_task_down(index)
+
+    def delete(self):
+        index = self._index()
+        if index is not None:
+            self.screen.delete_task(index)
+
+    def toggle_select(self):
+        if self.screen is not None:
+            self.screen.toggle_selected(self.task_id)
 
 
 class ToDoScreen(MDScreen):
+    select_mode = BooleanProperty(False)  # multi-select for bulk actions
+    search_query = StringProperty("")
+    group_by_due = BooleanProperty(False)  # overdue / today / upcoming sections
+    tag_filter = ListProperty([])          # tags picked in the chip bar
+    tag_mode = StringProperty("all")       # "all" (AND) or "any" (OR)
+    current_list = StringProperty(DEFAULT_LIST)
+    upcoming_days = 7
+
     def on_kv_post(self, base_widget):
         """
         Called after kv rules are applied and ids exist.
@@ -186,19 +199,14 @@ class ToDoScreen(MDScreen):
 
     def _post_kv_setup(self, dt):
         # Load saved tasks
-        self.task_list = load_tasks()
+        self._ensure_loaded()
 
         # Ensure input fields exist in kv (defensive)
         try:
             # Start with compact state: show single-line new_task_input only
-            self.ids.task_header_input.opacity = 0
-            self.ids.task_header_input.disabled = True
-
-            self.ids.task_description_input.opacity = 0
-            self.ids.task_description_input.disabled = True
-
-            self.ids.task_date_input.opacity = 0
-            self.ids.task_date_input.disabled = True
+            for idn in TASK_DETAIL_INPUTS:
+                self.ids[idn].opacity = 0
+                self.ids[idn].disabled = True
 
             self.ids.new_task_input.opacity = 1
             self.ids.new_task_input.disabled = False
@@ -208,6 +216,146 @@ class ToDoScreen(MDScreen):
         # Render any loaded tasks
         self.render_tasks()
 
+    def _ensure_loaded(self):
+        """Open the task database and read the list once."""
+        if getattr(self, "repo", None) is None:
+            self.repo = open_task_repository(self.current_list)
+            # Row updates are saved off the UI thread, a burst of clicks
+            # ends up as one transaction.
+            self.writer = WriteBehind(self.repo.apply_changes, delay=0.3)
+            atexit.register(self.writer.stop)
+        if not hasattr(self, "task_list"):
+            self.task_list = self.repo.all()
+            self._auto_archive()
+        if getattr(self, "search_index", None) is None:
+            self.search_index = TaskSearchIndex(self.task_list)
+            self.due_index = DueDateIndex(self.task_list)
+            self.tag_index = TagIndex(self.task_list)
+            self.recurring_ids = {t["id"] for t in self.task_list if t.get("recurrence")}
+        if getattr(self, "reminders", None) is None:
+            # One Clock event, armed for the earliest reminder (not a polling loop)
+            list_name = self.current_list
+            self.reminders = ReminderScheduler(
+                lambda task_id: self._on_reminder(task_id, list_name))
+            self.reminders.schedule_many((t["id"], self._reminder_time(t)) for t in self.task_list)
+
+    def _index_task(self, task):
+        """Add or refresh a task in the in-memory indexes."""
+        self.search_index.add(task)
+        self.tag_index.add(task)
+        self._due_changed(task)
+        if task.get("recurrence"):
+            self.recurring_ids.add(task["id"])
+
+    def _unindex_task(self, task_id):
+        self.search_index.remove(task_id)
+        self.due_index.remove(task_id)
+        self.tag_index.remove(task_id)
+        self.recurring_ids.discard(task_id)
+        self.reminders.cancel(task_id)
+
+    def _due_changed(self, task):
+        """Call after a task's due date or completion changed."""
+        self.due_index.update(task)
+        self.reminders.schedule(task["id"], self._reminder_time(task))
+
+    def _queue_save(self, task):
+        """Schedule the latest state of one task for the background writer."""
+        self.writer.mark_dirty(task["id"], dict(task))
+
+    def flush_pending(self):
+        """Write any queued task changes now, for every open list (called when the app stops)."""
+        if getattr(self, "writer", None) is not None:
+            self.writer.flush()
+        for state in getattr(self, "_list_states", {}).values():
+            state["writer"].flush()
+
+    # ---------- task lists ----------
+    # Each open list keeps its own repository, writer, indexes and undo
+    # history. Switching parks the current list's state and restores (or
+    # lazily loads) the other one; lists that are never opened are never read.
+
+    LIST_STATE = ("repo", "writer", "task_list", "search_index", "due_index", "tag_index",
+                  "recurring_ids", "reminders", "history")
+
+    def list_names(self):
+        return task_lists.names()
+
+    def switch_list(self, name):
+        if name == self.current_list or name not in task_lists.names():
+            return
+        if not hasattr(self, "_list_states"):
+            self._list_states = {}
+        if getattr(self, "repo", None) is not None:
+            self._list_states[self.current_list] = {
+                attr: getattr(self, attr, None) for attr in self.LIST_STATE}
+        state = self._list_states.pop(name, None)
+        for attr in self.LIST_STATE:
+            if state is not None:
+                setattr(self, attr, state[attr])
+            elif hasattr(self, attr):
+                delattr(self, attr)
+        self.current_list = name
+        self.selected_ids = set()
+        self.tag_filter = []
+        self._ensure_loaded()
+        self._order_changed()
+        self.invalidate()
+
+    def create_list(self, name):
+        """Add a list and show it. Returns False (after showing why) if the name is invalid."""
+        try:
+            name = task_lists.create(name)
+        except ValueError as e:
+            self.show_error(f"\n\n{e}\n\n")
+            return False
+        self.switch_list(name)
+        return True
+
+    def open_list_menu(self, caller):
+        """Drop-down of the lists, plus an entry to create a new one."""
+        from kivymd.uix.menu import MDDropdownMenu
+
+        def choose(name):
+            menu.dismiss()
+            self.switch_list(name)
+
+        def new_list():
+            menu.dismiss()
+            self.open_new_list_dialog()
+
+        items = [{"text": name, "on_release": lambda name=name: choose(name)}
+                 for name in task_lists.names()]
+        items.append({"text": "New list...", "leading_icon": "plus", "on_release": new_list})
+        menu = MDDropdownMenu(caller=caller, items=items)
+        menu.open()
+
+    def open_new_list_dialog(self):
+        from kivymd.uix.dialog import MDDialogContentContainer
+        from kivymd.uix.textfield import MDTextField, MDTextFieldHintText
+        from kivy.uix.widget import Widget
+
+        field = MDTextField(MDTextFieldHintText(text="List name (e.g. Biology 101)"))
+        content = MDDialogContentContainer(field, orientation="vertical", padding="12dp")
+
+        def create(*args):
+            if self.create_list(field.text):
+                dialog.dismiss()
+
+        dialog = MDDialog(
+            MDDialogHeadlineText(text="New List", halign="left"),
+            content,
+            MDDialogButtonContainer(
+                Widget(),
+                MDButton(MDButtonText(text="CANCEL"), style="text",
+                         on_release=lambda *args: dialog.dismiss()),
+                MDButton(MDButtonText(text="CREATE"), style="filled", on_release=create),
+                spacing="8dp",
+            ),
+            scrim_color=(0, 0, 0, 0.5),
+        )
+        dialog.open()
+
     def expand_input(self):
         """Expands the input section to show all task fields"""
         input_box = self.ids.input_box
@@ -217,11 +365,11 @@ class ToDoScreen(MDScreen):
         self.ids.new_task_input.disabled = True
 
         # Animate height expansion
-        anim = Animation(height=dp(200), duration=0.18)
+        anim = Animation(height=dp(300), duration=0.18)
         anim.start(input_box)
 
         # Show and enable the additional fields
-        for idn in ("task_header_input", "task_description_input", "task_date_input"):
+        for idn in TASK_DETAIL_INPUTS:
             try:
                 self.ids[idn].opacity = 1
                 self.ids[idn].disabled = False
@@ -233,7 +381,7 @@ class ToDoScreen(MDScreen):
         input_box = self.ids.input_box
 
         # Hide additional fields and disable them
-        for idn in ("task_header_input", "task_description_input", "task_date_input"):
+        for idn in TASK_DETAIL_INPUTS:
             try:
                 self.ids[idn].opacity = 0
                 self.ids[idn].disabled = True
@@ -313,6 +461,12 @@ class ToDoScreen(MDScreen):
             print("Input fields missing or not ready.")
             return
 
+        # Tags are optional (older layouts have no tags field)
+        tags_input = self.ids.get("task_tags_input")
+        tags = parse_tags(tags_input.text) if tags_input is not None else []
+        repeat_input = self.ids.get("task_repeat_input")
+        repeat = repeat_input.text if repeat_input is not None else ""
+
         # Do not add blank-header tasks
         if not header:
             print("No header detected.")
@@ -338,6 +492,23 @@ class ToDoScreen(MDScreen):
             self.show_error(f"\n\n{error_msg}\n\n")
             return
 
+        # Validate tags
+        is_valid, error_msg = validate_tags(tags)
+        if not is_valid:
+            self.show_error(f"\n\n{error_msg}\n\n")
+            return
+
+        # Validate repeat rule; a recurring task is due on its first occurrence
+        try:
+            rule = parse_rule(repeat)
+        except ValueError as e:
+            self.show_error(f"\n\n{e}\n\n")
+            return
+        if rule is not None:
+            start = due_ordinal(due_date)
+            start = date.fromordinal(start) if start else date.today()
+            due_date = first_occurrence(rule, start).strftime("%m/%d/%Y")
+
         # ========== END VALIDATION ==========
 
         # Build task dictionary and append
@@ -346,22 +517,30 @@ class ToDoScreen(MDScreen):
             "description": description,
             "due_date": due_date,
             "completed": False,      # <-- NEW field
+            "tags": tags,
+            "recurrence": str(rule) if rule is not None else "",
         }
-        if not hasattr(self, "task_list"):
-            self.task_list = load_tasks()
-        self.task_list.append(task)
+        self._ensure_loaded()
 
-        # Persist
-        save_tasks(self.task_list)
+        # Persist (a single row insert)
+        task["id"] = self.repo.add(task)
+        self.task_list.append(task)
+        self._index_task(task)
+        self._order_changed()
+        self._record_added("add task", [task])
 
         # Refresh UI
-        self.render_tasks()
+        self.invalidate()
 
         # Clear inputs
         try:
             self.ids.task_header_input.text = ""
             self.ids.task_description_input.text = ""
             self.ids.task_date_input.text = ""
+            if tags_input is not None:
+                tags_input.text = ""
+            if repeat_input is not None:
+                repeat_input.text = ""
         except Exception:
             pass
 
@@ -374,187 +553,850 @@ class ToDoScreen(MDScreen):
         """Move a task one position up (if possible)."""
         if index <= 0 or index >= len(self.task_list):
             return
-        self.task_list[index - 1], self.task_list[index] = \
-            self.task_list[index], self.task_list[index - 1]
-        save_tasks(self.task_list)
-        self.render_tasks()
+        self.move_task(self.task_list[index]["id"], index - 1)
 
     def move_task_down(self, index: int):
         """Move a task one position down (if possible)."""
         if index < 0 or index >= len(self.task_list) - 1:
             return
-        self.task_list[index + 1], self.task_list[index] = \
-            self.task_list[index], self.task_list[index + 1]
-        save_tasks(self.task_list)
-        self.render_tasks()
+        self.move_task(self.task_list[index]["id"], index + 1)
+
+    def move_task(self, task_id, new_index: int):
+        """
+        Move a task to new_index (move buttons, drag and drop).
+        The task gets a rank key between its new neighbours, so only
+        this one record is saved.
+        """
+        index = self._index_of(task_id)
+        if index is None:
+            return
+        task = self.task_list.pop(index)
+        old_rank = task["rank"]
+        new_index = max(0, min(new_index, len(self.task_list)))
+        before = self.task_list[new_index - 1]["rank"] if new_index > 0 else None
+        after = self.task_list[new_index]["rank"] if new_index < len(self.task_list) else None
+        task["rank"] = rank_between(before, after)
+        self.task_list.insert(new_index, task)
+        first, last = min(index, new_index), max(index, new_index)
+        self._positions_moved(first, last)
+        self._record_fields("move task", {task_id: {"rank": old_rank}},
+                            {task_id: {"rank": task["rank"]}})
+        self._queue_save(task)
+        # Only the rows between the old and the new place changed
+        self.invalidate_tasks([t["id"] for t in self.task_list[first:last + 1]])
+
+    # ---------- multi-select + bulk operations ----------
+    # Each bulk operation validates the whole batch first, then queues all
+    # changed rows at once (one background transaction) and renders once.
+
+    def toggle_select_mode(self):
+        self.select_mode = not self.select_mode
+        self.selected_ids = set()
+        self.invalidate()
+
+    def toggle_selected(self, task_id):
+        if not hasattr(self, "selected_ids"):
+            self.selected_ids = set()
+        selected = self.selected_ids
+        if task_id in selected:
+            selected.discard(task_id)
+        else:
+            selected.add(task_id)
+        self.invalidate_tasks([task_id])
+
+    def _tasks_for(self, task_ids):
+        """Task dicts for the given ids, in list order (unknown ids are skipped)."""
+        wanted = set(task_ids)
+        return [task for task in getattr(self, "task_list", []) if task.get("id") in wanted]
+
+    def _finish_bulk(self, changes):
+        """Persist a batch of (task id, task dict or None) and render once."""
+        self.writer.mark_dirty_many(changes)
+        dirty = set(getattr(self, "selected_ids", ()))
+        dirty.update(task_id for task_id, _ in changes)
+        self.selected_ids = set()
+        self.invalidate_tasks(dirty)
+
+    def complete_tasks(self, task_ids, completed: bool = True) -> int:
+        """Mark many tasks complete (or incomplete). Returns how many changed."""
+        self._ensure_loaded()
+        tasks = [t for t in self._tasks_for(task_ids) if t.get("completed", False) != completed]
+        if not tasks:
+            return 0
+        before = self._fields_of(tasks, COMPLETION_FIELDS)
+        done = []
+        for task in tasks:
+            if completed and task.get("recurrence"):
+                done.append((task["id"], self._complete_occurrence(task)))
+            else:
+                self._set_completed(task, completed)
+            self._due_changed(task)
+        self._record_fields("complete tasks" if completed else "reopen tasks", before,
+                            self._fields_of(tasks, COMPLETION_FIELDS), done)
+        self._finish_bulk([(task["id"], dict(task)) for task in tasks])
+        return len(tasks)
+
+    def delete_tasks(self, task_ids) -> int:
+        """Delete many tasks. Returns how many were removed."""
+        self._ensure_loaded()
+        removed = self._tasks_for(task_ids)
+        doomed = {task["id"] for task in removed}
+        if not doomed:
+            return 0
+        self._record_removed("delete tasks", removed)
+        self.task_list = [task for task in self.task_list if task["id"] not in doomed]
+        for task_id in doomed:
+            self._unindex_task(task_id)
+        self._order_changed()
+        self._finish_bulk([(task_id, None) for task_id in doomed])
+        return len(doomed)
+
+    def clear_completed(self) -> int:
+        """Delete every completed task."""
+        self._ensure_loaded()
+        return self.delete_tasks([t["id"] for t in self.task_list if t.get("completed", False)])
+
+    def shift_due_dates(self, task_ids, days: int) -> int:
+        """
+        Move the due dates of many tasks by `days`. Tasks without a due date
+        are left alone. A date that would still be in the past (e.g. +1 day
+        on a task overdue by a week) becomes today, and a recurring task
+        moves on to its first occurrence from the new date. Tasks whose new
+        date isn't valid (too far ahead) are skipped; the rest still move.
+        """
+        self._ensure_loaded()
+        today = date.today()
+        updates = []
+        skipped = 0
+        for task in self._tasks_for(task_ids):
+            ordinal = due_ordinal(task.get("due_date"))
+            if ordinal is None:
+                continue
+            new_due = max(date.fromordinal(ordinal) + timedelta(days=days), today)
+            if task.get("recurrence"):
+                new_due = first_occurrence(parse_rule(task["recurrence"]), new_due)
+            new_due = new_due.strftime("%m/%d/%Y")
+            if new_due == task["due_date"]:
+                continue
+            if not validate_due_date(new_due)[0]:
+                skipped += 1
+                continue
+            updates.append((task, new_due))
+        if skipped:
+            self.notify(f"{skipped} task(s) not moved: due date out of range.")
+        if not updates:
+            return 0
+        before = self._fields_of([task for task, _ in updates], ("due_date",))
+        for task, new_due in updates:
+            task["due_date"] = new_due
+            self._due_changed(task)
+        self._record_fields("postpone tasks", before,
+                            self._fields_of([task for task, _ in updates], ("due_date",)))
+        self._finish_bulk([(task["id"], dict(task)) for task, _ in updates])
+        return len(updates)
+
+    # Buttons in the bulk action bar act on the current selection
+
+    def complete_selected(self):
+        self.complete_tasks(getattr(self, "selected_ids", ()))
+
+    def delete_selected(self):
+        self.delete_tasks(getattr(self, "selected_ids", ()))
+
+    def postpone_selected(self, days: int = 1):
+        self.shift_due_dates(getattr(self, "selected_ids", ()), days)
 
     # ---------- NEW: completion / checkbox logic ----------
 
     def toggle_task_complete(self, index: int, value: bool):
         """Mark a task as complete/incomplete and save."""
         if 0 <= index < len(self.task_list):
-            self.task_list[index]["completed"] = bool(value)
-            save_tasks(self.task_list)
-            self.render_tasks()
-
-    def _make_checkbox(self, index: int, completed: bool) -> MDCheckbox:
-        cb = MDCheckbox(
-            size_hint=(None, None),
-            size=(dp(32), dp(32)),
-            active=completed,
+            task = self.task_list[index]
+            before = self._fields_of([task], COMPLETION_FIELDS)
+            done = []
+            if value and task.get("recurrence"):
+                done.append((task["id"], self._complete_occurrence(task)))
+            else:
+                self._set_completed(task, value)
+            self._due_changed(task)
+            self._record_fields("complete task" if value else "reopen task", before,
+                                self._fields_of([task], COMPLETION_FIELDS), done)
+            self._queue_save(self.task_list[index])
+            self.invalidate_tasks([task["id"]])
+
+    # ---------- undo / redo ----------
+    # Every edit records its inverse: the fields it changed or the tasks it
+    # added/removed (see command_log.py). Replaying goes through the same
+    # indexes and background writer as a normal edit.
+
+    def _history(self):
+        if getattr(self, "history", None) is None:
+            self.history = CommandLog()
+        return self.history
+
+    def undo(self):
+        label = self._history().undo()
+        if label:
+            self.notify(f"Undone: {label}")
+
+    def redo(self):
+        label = self._history().redo()
+        if label:
+            self.notify(f"Redone: {label}")
+
+    @staticmethod
+    def _fields_of(tasks, names):
+        """{task id: {field: value}} for the given fields."""
+        return {task["id"]: {name: task.get(name) for name in names} for task in tasks}
+
+    def _record_fields(self, label, before, after, occurrences=()):
+        """Record an edit of task fields (before/after: id -> fields)."""
+        def undo():
+            for task_id, due in occurrences:
+                self.repo.uncomplete_occurrence(task_id, due)
+            self._set_fields(before)
+
+        def redo():
+            for task_id, due in occurrences:
+                self.repo.complete_occurrence(task_id, due)
+            self._set_fields(after)
+
+        self._history().record(label, undo, redo, (before, after, list(occurrences)))
+
+    def _record_added(self, label, tasks):
+        copies = [dict(task) for task in tasks]
+        ids = [task["id"] for task in copies]
+        self._history().record(label, lambda: self._take_out(ids),
+                               lambda: self._put_back(copies), copies)
+
+    def _record_removed(self, label, tasks):
+        copies = [dict(task) for task in tasks]
+        ids = [task["id"] for task in copies]
+        self._history().record(label, lambda: self._put_back(copies),
+                               lambda: self._take_out(ids), copies)
+
+    def _set_fields(self, changes):
+        """Apply {task id: {field: value}}; a changed rank moves the task to its place."""
+        changed = []
+        moved = False
+        for task_id, fields in changes.items():
+            index = self._index_of(task_id)
+            if index is None:
+                continue
+            task = self.task_list[index]
+            task.update(fields)
+            if "rank" in fields:
+                self.task_list.pop(index)
+                ranks = [other["rank"] for other in self.task_list]
+                self.task_list.insert(bisect_left(ranks, task["rank"]), task)
+                self._order_changed()
+                moved = True
+            self._index_task(task)
+            changed.append((task_id, dict(task)))
+        self.writer.mark_dirty_many(changed)
+        if moved:
+            self.invalidate()
+        else:
+            self.invalidate_tasks([task_id for task_id, _ in changed])
+
+    def _put_back(self, tasks):
+        """Re-insert removed tasks (copies) at their rank positions."""
+        ranks = [task["rank"] for task in self.task_list]
+        for task in sorted((dict(task) for task in tasks), key=lambda task: task["rank"]):
+            position = bisect_left(ranks, task["rank"])
+            ranks.insert(position, task["rank"])
+            self.task_list.insert(position, task)
+            self._index_task(task)
+        self._order_changed()
+        self.writer.mark_dirty_many((task["id"], dict(task)) for task in tasks)
+        self.invalidate()
+
+    def _take_out(self, task_ids):
+        doomed = set(task_ids)
+        self.task_list = [task for task in self.task_list if task["id"] not in doomed]
+        for task_id in doomed:
+            self._unindex_task(task_id)
+        self._order_changed()
+        self.writer.mark_dirty_many((task_id, None) for task_id in doomed)
+        self.invalidate()
+
+    # ---------- reminders ----------
+    # Each task is reminded about once a day: re-indexing an overdue task
+    # (import, undo, an edit, opening its list) doesn't remind again the
+    # same day. Reminders that come due in the same frame share a message.
+
+    def _reminder_time(self, task):
+        """reminder_time() for a task of the current list, skipping one already given today."""
+        reminded = getattr(self, "_reminded", {}).get((self.current_list, task["id"]))
+        day = reminded[1] if reminded and reminded[0] == task.get("due_date") else None
+        return reminder_time(task, reminded_on=day)
+
+    def _on_reminder(self, task_id, list_name=None):
+        """A task's reminder time came (called by the ReminderScheduler of its list)."""
+        if list_name is None or list_name == self.current_list:
+            task = self.get_task(task_id)
+        else:
+            parked = getattr(self, "_list_states", {}).get(list_name)
+            tasks = parked["task_list"] if parked else []
+            task = next((t for t in tasks if t["id"] == task_id), None)
+        if task is None or task.get("completed", False):
+            return
+        if not hasattr(self, "_reminded"):
+            self._reminded = {}
+            self._due_reminders = []
+            self._reminder_trigger = Clock.create_trigger(self._show_reminders)
+        self._reminded[(list_name or self.current_list, task_id)] = (task.get("due_date"), date.today())
+        prefix = f"{list_name}: " if list_name and list_name != DEFAULT_LIST else ""
+        ordinal = due_ordinal(task.get("due_date"))
+        overdue = ordinal is not None and ordinal < date.today().toordinal()
+        self._due_reminders.append((overdue, f"{prefix}{task.get('header', '')}"))
+        self._reminder_trigger()
+
+    def _show_reminders(self, *args):
+        """One message for the reminders collected this frame."""
+        due, self._due_reminders = self._due_reminders, []
+        if len(due) == 1:
+            overdue, title = due[0]
+            self.notify(f"{'Overdue' if overdue else 'Due today'}: {title}")
+            return
+        overdue = sum(1 for late, _ in due if late)
+        today = len(due) - overdue
+        parts = []
+        if overdue:
+            parts.append(f"{overdue} tasks overdue" if overdue > 1 else "1 task overdue")
+        if today:
+            parts.append(f"{today} due today" if overdue else f"{today} tasks due today")
+        if parts:
+            self.notify(", ".join(parts))
+
+    def notify(self, message):
+        """Short message at the bottom of the screen."""
+        from kivymd.uix.snackbar import MDSnackbar, MDSnackbarText
+        MDSnackbar(
+            MDSnackbarText(text=message),
+            y=dp(24),
+            pos_hint={"center_x": 0.5},
+            size_hint_x=0.8,
+        ).open()
+
+    # ---------- import / export ----------
+
+    def import_tasks_from(self, path):
+        """
+        Import tasks from a .csv or .ics file. Records are validated in
+        batches while the file streams in, inserted in one transaction and
+        rendered once. Returns the report {"imported", "rejected", "errors"}.
+        """
+        self._ensure_loaded()
+        report = new_report()
+        kind = Path(path).suffix.lower().lstrip(".")
+        try:
+            with open(path, newline="", encoding="utf-8-sig") as f:
+                batches = validated_batches(read_tasks(f, kind), report)
+                added = self.repo.add_many(task for batch in batches for task in batch)
+        except (OSError, ValueError, csv.Error) as e:
+            self.show_error(f"\n\nCouldn't import {Path(path).name}: {e}\n\n")
+            report["imported"] = 0
+            return report
+
+        self.task_list.extend(added)
+        for task in added:
+            self._index_task(task)
+        self._order_changed()
+        self._record_added("import tasks", added)
+        self.invalidate()
+
+        if report["errors"]:
+            self.show_error("\n\nSkipped {} invalid record(s):\n{}\n\n".format(
+                report["rejected"], "\n".join(report["errors"][:5])))
+        self.notify(f"Imported {report['imported']} task(s).")
+        return report
+
+    def export_tasks_to(self, path):
+        """Write every task to a .csv or .ics file. Returns the number written."""
+        self._ensure_loaded()
+        writer = {"csv": write_csv, "ics": write_ics}.get(Path(path).suffix.lower().lstrip("."))
+        if writer is None:
+            self.show_error("\n\nExport as .csv or .ics\n\n")
+            return 0
+        try:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                count = writer(self.task_list, f)
+        except OSError as e:
+            self.show_error(f"\n\nCouldn't export tasks: {e}\n\n")
+            return 0
+        self.notify(f"Exported {count} task(s) to {Path(path).name}.")
+        return count
+
+    def open_import_dialog(self):
+        """Pick a .csv / .ics file to import."""
+        self._open_file_manager("file", self.import_tasks_from, ext=[".csv", ".ics"])
+
+    def open_export_dialog(self):
+        """Pick a folder; the tasks are written there as tasks.csv and tasks.ics."""
+        def export_to(folder):
+            self.export_tasks_to(str(Path(folder) / "tasks.csv"))
+            self.export_tasks_to(str(Path(folder) / "tasks.ics"))
+        self._open_file_manager("folder", export_to)
+
+    def _open_file_manager(self, selector, on_select, ext=()):
+        from kivymd.uix.filemanager import MDFileManager
+
+        def select_path(path):
+            manager.close()
+            on_select(path)
+
+        manager = MDFileManager(
+            exit_manager=lambda *args: manager.close(),
+            select_path=select_path,
+            selector=selector,
+            ext=list(ext),
         )
+        manager.show(str(Path.home()))
+
+    @staticmethod
+    def _set_completed(task, value):
+        task["completed"] = bool(value)
+        task["completed_at"] = datetime.now().isoformat(timespec="seconds") if value else ""
+
+    # ---------- archive ----------
+    # Completed tasks older than ARCHIVE_AFTER_DAYS move to an append-only
+    # file next to the list's database, keeping the live list small.
+
+    def _archive(self):
+        return TaskArchive(task_lists.path_for(self.current_list).with_suffix(".archive.jsonl"))
+
+    def _archivable(self, days):
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat(timespec="seconds")
+        return [task for task in self.task_list
+                if task.get("completed", False) and task.get("completed_at", "") <= cutoff]
+
+    def _auto_archive(self):
+        """Archive old completed tasks while the list is loaded (before indexing)."""
+        try:
+            old = self._archivable(ARCHIVE_AFTER_DAYS)
+            if not old:
+                return
+            # Written to the archive before being deleted: a crash in between
+            # can leave a task in both places, never in neither.
+            self._archive().append(old)
+            self.repo.apply_changes({task["id"]: None for task in old})
+        except Exception as e:
+            print(f"Warning: couldn't archive completed tasks ({e}).")
+            return
+        doomed = {task["id"] for task in old}
+        self.task_list = [task for task in self.task_list if task["id"] not in doomed]
+
+    def archive_completed(self, days=ARCHIVE_AFTER_DAYS) -> int:
+        """Move completed tasks older than `days` into the archive. Returns how many."""
+        self._ensure_loaded()
+        old = self._archivable(days)
+        if not old:
+            return 0
+        try:
+            self._archive().append(old)
+        except OSError as e:
+            self.show_error(f"\n\nCouldn't write the archive: {e}\n\n")
+            return 0
+        doomed = {task["id"] for task in old}
+        self.task_list = [task for task in self.task_list if task["id"] not in doomed]
+        for task_id in doomed:
+            self._unindex_task(task_id)
+        self._order_changed()
+        self._finish_bulk([(task_id, None) for task_id in doomed])
+        self.writer.flush()
+        return len(old)
+
+    def open_archive(self, limit=200):
+        """Show the most recently archived tasks (the file is only read now)."""
+        from kivy.uix.scrollview import ScrollView
+
+        archived = self._archive().recent(limit)
+        view = ModalView(size_hint=(0.9, 0.8))
+        card = MDCard(orientation="vertical", padding=dp(16), spacing=dp(8), style="elevated")
+        card.add_widget(MDLabel(text=f"Archive ({len(archived)} most recent)", role="large",
+                                size_hint_y=None, height=dp(32)))
+
+        rows = MDBoxLayout(orientation="vertical", adaptive_height=True, spacing=dp(4))
+        if not archived:
+            rows.add_widget(MDLabel(text="Nothing archived yet", halign="center",
+                                    size_hint_y=None, height=dp(40)))
+        for task in archived:
+            done = (task.get("completed_at") or "")[:10]
+            rows.add_widget(MDLabel(
+                text=f"{task.get('header', '')}  [color=#888888]done {done}[/color]",
+                markup=True, size_hint_y=None, height=dp(28)))
+        scroll = ScrollView()
+        scroll.add_widget(rows)
+        card.add_widget(scroll)
+
+        def archive_now(*args):
+            count = self.archive_completed(ARCHIVE_AFTER_DAYS)
+            view.dismiss()
+            self.notify(f"Archived {count} task(s).")
+
+        buttons = MDBoxLayout(size_hint_y=None, height=dp(44), spacing=dp(8))
+        buttons.add_widget(MDButton(MDButtonText(text=f"Archive done > {ARCHIVE_AFTER_DAYS} days"),
+                                    style="text", on_release=archive_now))
+        buttons.add_widget(MDButton(MDButtonText(text="Close"), style="text",
+                                    on_release=lambda *args: view.dismiss()))
+        card.add_widget(buttons)
+        view.add_widget(card)
+        view.open()
 
-        def on_active_cb(checkbox, value):
-            self.toggle_task_complete(index, value)
+    # ---------- recurring tasks ----------
 
-        cb.bind(active=on_active_cb)
-        return cb
+    def _complete_occurrence(self, task):
+        """
+        Record the current occurrence of a recurring task as done (one row)
+        and move the task on to its next occurrence. The task itself stays open.
+        Returns the completed occurrence's date.
+        """
+        rule = parse_rule(task["recurrence"])
+        ordinal = due_ordinal(task.get("due_date"))
+        due = date.fromordinal(ordinal) if ordinal else date.today()
+        done = due.strftime("%m/%d/%Y")
+        self.repo.complete_occurrence(task["id"], done)
+        task["due_date"] = rule.next_after(due).strftime("%m/%d/%Y")
+        return done
+
+    def occurrences_between(self, first_day, last_day, visible=None):
+        """
+        (date, task) for the occurrences of recurring tasks after their
+        current one, from first_day to last_day (dates), soonest first.
+        Only dates inside the window are generated.
+        """
+        found = []
+        for task_id in self.recurring_ids:
+            if visible is not None and task_id not in visible:
+                continue
+            task = self.get_task(task_id)
+            ordinal = due_ordinal(task.get("due_date")) if task else None
+            if ordinal is None or task.get("completed", False):
+                continue
+            rule = parse_rule(task["recurrence"])
+            after = rule.next_after(date.fromordinal(ordinal))
+            found.extend((day, task) for day in occurrences(rule, after, first_day, last_day))
+        found.sort(key=lambda pair: (pair[0], pair[1]["id"]))
+        return found
+
+    def _occurrence_data(self, task, day):
+        """RecycleView data for a later occurrence (shown, but not editable)."""
+        data = self._row_data(task, 0, 1)
+        data.update(due_text=day.strftime("%m/%d/%Y"), can_move_up=False,
+                    can_move_down=False, selected=False, preview=True)
+        return data
+
+    def _index_of(self, task_id):
+        """Current list position of a task (rows look this up when clicked)."""
+        tasks = getattr(self, "task_list", [])
+        index = self._positions().get(task_id)
+        if index is not None and index < len(tasks) and tasks[index].get("id") == task_id:
+            return index
+        # Not rendered since the list changed: fall back to a scan
+        for index, task in enumerate(tasks):
+            if task.get("id") == task_id:
+                return index
+        return None
+
+    def get_task(self, task_id):
+        """The task dict with this id, or None."""
+        index = self._index_of(task_id)
+        return None if index is None else self.task_list[index]
 
     def delete_task(self, index):
         """Removes a task from the list and re-saves it (safe against bad indexes)."""
         try:
             # Safe pop: check range
             if 0 <= index < len(self.task_list):
-                self.task_list.pop(index)
-                save_tasks(self.task_list)
-                self.render_tasks()
+                task = self.task_list.pop(index)
+                self._record_removed("delete task", [task])
+                self._unindex_task(task["id"])
+                self._order_changed()
+                self.writer.mark_dirty(task["id"], None)
+                self.invalidate()
             else:
                 print("delete_task: index out of range:", index)
         except Exception as e:
             print("Error deleting task:", e)
 
-    def _make_delete_btn(self, index: int) -> MDIconButton:
-        # Create the button
-        btn = MDIconButton(
-            icon="delete",
-            theme_text_color="Custom",
-            text_color=(1, 0, 0, 1),  # red delete button
-            size_hint=(None, None),
-            size=(dp(36), dp(36)),
-        )
-
-        # Bind the callback AFTER creation
-        def on_release_handler(btn_widget):
-            self.delete_task(index)
+    # ---------- rows (RecycleView data) ----------
+
+    @staticmethod
+    def _markup(text, completed):
+        return f"[s]{text}[/s]" if completed else text
+
+    @staticmethod
+    def _note(task):
+        """'(weekly mon,wed) #bio #lab' for the row, '' if there is nothing to show."""
+        parts = [f"({task['recurrence']})"] if task.get("recurrence") else []
+        parts.extend(f"#{tag}" for tag in task.get("tags") or ())
+        return " ".join(parts)
+
+    def _row_data(self, task, index, total):
+        """RecycleView data for one task row."""
+        completed = bool(task.get("completed", False))
+        return {
+            "viewclass": "TaskRowView",
+            "task_id": task["id"],
+            "header_text": self._markup(task.get("header", ""), completed),
+            "desc_text": self._markup(task.get("description", ""), completed),
+            "due_text": task.get("due_date", ""),
+            "note_text": self._note(task),
+            "preview": False,
+            "completed": completed,
+            "can_move_up": index > 0,
+            "can_move_down": index < total - 1,
+            "selected": task["id"] in getattr(self, "selected_ids", ()),
+            "select_mode": self.select_mode,
+        }
 
-        btn.bind(on_release=on_release_handler)
-        return btn
+    # ---------- search ----------
 
-    # ---------- move buttons ----------
+    def set_search(self, text):
+        """Filter the visible rows to tasks matching text (called as you type)."""
+        self.search_query = text or ""
+        self.invalidate()
 
-    def _make_move_up_btn(self, index: int) -> MDIconButton:
-        btn = MDIconButton(
-            icon="chevron-up",
-            size_hint=(None, None),
-            size=(dp(36), dp(36)),
-        )
-
-        if index == 0:
-            # First item can't move up
-            btn.disabled = True
-            btn.opacity = 0.3
-        else:
-            btn.bind(on_release=lambda w: self.move_task_up(index))
-        return btn
-
-    def _make_move_down_btn(self, index: int, total: int) -> MDIconButton:
-        btn = MDIconButton(
-            icon="chevron-down",
-            size_hint=(None, None),
-            size=(dp(36), dp(36)),
-        )
+    def _order_changed(self):
+        """Call after tasks are added, removed or moved."""
+        self._positions_valid = False
+        self._data_index = None
 
-        if index == total - 1:
-            # Last item can't move down
-            btn.disabled = True
-            btn.opacity = 0.3
+    def _positions_moved(self, first, last):
+        """
+        Call after tasks moved within task_list[first:last + 1] only: just
+        those positions are updated instead of rebuilding the whole map.
+        """
+        if getattr(self, "_positions_valid", False):
+            for i in range(first, last + 1):
+                self._row_index[self.task_list[i]["id"]] = i
+
+    def _positions(self):
+        """task id -> index in task_list, rebuilt only after the order changed."""
+        if not getattr(self, "_positions_valid", False) or not hasattr(self, "_row_index"):
+            tasks = getattr(self, "task_list", None) or []
+            self._row_index = {task["id"]: i for i, task in enumerate(tasks)}
+            self._positions_valid = True
+        return self._row_index
+
+    def _visible_tasks(self):
+        """Tasks to display: all of them, or the search/tag matches in list order."""
+        tasks = getattr(self, "task_list", None) or []
+        index = getattr(self, "search_index", None)
+        matches = index.search(self.search_query) if index is not None else None
+        tag_index = getattr(self, "tag_index", None)
+        tagged = tag_index.match(self.tag_filter, self.tag_mode) if tag_index is not None else None
+        if tagged is not None:
+            matches = tagged if matches is None else matches & tagged
+        if matches is None:
+            return tasks
+        positions = self._positions()
+        return [tasks[i] for i in sorted(positions[task_id] for task_id in matches
+                                         if task_id in positions)]
+
+    # ---------- tag filter ----------
+
+    def toggle_tag_filter(self, tag):
+        """Add tag to the filter, or remove it if it is already there."""
+        if tag in self.tag_filter:
+            self.tag_filter.remove(tag)
         else:
-            btn.bind(on_release=lambda w: self.move_task_down(index))
-        return btn
-
-    def render_tasks(self):
-        """Clear and rebuild the task list display"""
-        # Defensive: ensure we have a container and task_list
-        try:
-            container = self.ids.todo_items_container
-        except Exception as e:
-            print("render_tasks: missing todo_items_container in kv:", e)
+            self.tag_filter.append(tag)
+        self.invalidate()
+
+    def toggle_tag_mode(self):
+        """Switch the tag filter between AND ("all") and OR ("any")."""
+        self.tag_mode = "any" if self.tag_mode == "all" else "all"
+        self.invalidate()
+
+    def clear_tag_filter(self):
+        self.tag_filter = []
+        self.invalidate()
+
+    def _refresh_tag_bar(self):
+        """Rebuild the tag chips, only when the tags in use or the selection changed."""
+        tag_index = getattr(self, "tag_index", None)
+        if tag_index is None:
             return
-
-        container.clear_widgets()
-
-        # If no tasks, show a placeholder label (optional)
-        if not getattr(self, "task_list", None):
-            from kivymd.uix.label import MDLabel
-            placeholder = MDLabel(
-                text="No tasks yet",
-                halign="center",
-                size_hint_y=None,
-                height=dp(40),
-            )
-            container.add_widget(placeholder)
+        tags = tag_index.tags()
+        # Tags whose last task is gone can't stay selected
+        stale = [tag for tag in self.tag_filter if tag not in tag_index]
+        for tag in stale:
+            self.tag_filter.remove(tag)
+
+        bar = self.ids.get("tag_chip_bar")
+        signature = (tuple(tags), tuple(self.tag_filter))
+        if bar is None or signature == getattr(self, "_tag_bar_signature", None):
             return
+        self._tag_bar_signature = signature
+
+        from kivymd.uix.chip import MDChip, MDChipText
+        bar.clear_widgets()
+        for tag in tags:
+            chip = MDChip(
+                MDChipText(text=f"#{tag} ({tag_index.count(tag)})"),
+                type="filter",
+                active=tag in self.tag_filter,
+            )
+            chip.bind(on_release=lambda _chip, tag=tag: self.toggle_tag_filter(tag))
+            bar.add_widget(chip)
+
+    # ---------- due date sections ----------
+
+    def toggle_group_by_due(self):
+        self.group_by_due = not self.group_by_due
+        self.invalidate()
+
+    def _grouped_data(self, tasks, positions, total):
+        """RecycleView data: a header row per section, then its tasks by due date."""
+        visible = None
+        if len(tasks) != total:  # a search is active
+            visible = {task["id"] for task in tasks}
+        sections = self.due_index.groups(self.upcoming_days)
+        today = date.today()
+        later = [self._occurrence_data(task, day) for day, task in self.occurrences_between(
+            today + timedelta(days=1), today + timedelta(days=self.upcoming_days), visible)]
+
+        data = []
+        for number, (title, task_ids) in enumerate(sections):
+            if visible is not None:
+                task_ids = [task_id for task_id in task_ids if task_id in visible]
+            rows = [self._row_data(self.task_list[positions[task_id]], positions[task_id], total)
+                    for task_id in task_ids]
+            if number == len(sections) - 1 and later:
+                # Repeats of recurring tasks join the upcoming section by date
+                rows = list(merge(rows, later, key=lambda row: due_ordinal(row["due_text"])))
+            data.append({
+                "viewclass": "TaskSectionHeader",
+                "text": f"{title} ({len(rows)})",
+                "height": dp(32),
+            })
+            data.extend(rows)
+        return data
+
+    # ---------- rendering ----------
+
+    def _render_trigger(self):
+        if getattr(self, "_renders", None) is None:
+            self._renders = RenderTrigger(self._render_pending)
+        return self._renders
+
+    def invalidate(self, *args):
+        """Render on the next frame; all edits made in one frame share one render."""
+        self._dirty_ids = None  # everything
+        self._render_trigger().request()
+
+    def invalidate_tasks(self, task_ids):
+        """
+        Re-render only the rows of these tasks on the next frame. For edits
+        that change no other task and don't change which tasks are shown
+        (complete, select, edit fields, a move with every task in between).
+        """
+        trigger = self._render_trigger()
+        if not trigger.pending:
+            self._dirty_ids = set()
+        if getattr(self, "_dirty_ids", None) is not None:
+            self._dirty_ids.update(task_ids)
+        trigger.request()
+
+    def _render_pending(self):
+        dirty, self._dirty_ids = getattr(self, "_dirty_ids", None), None
+        if dirty is None or not self._patch_rows(dirty):
+            self.render_tasks()
 
-        # Build each row
-        from kivymd.uix.boxlayout import MDBoxLayout
-        from kivymd.uix.label import MDLabel
+    def flush_render(self):
+        """
+        Render now if a render is pending, and finish a progressive data
+        build (before reading the rows back, and in tests).
+        """
+        rendered = self._render_trigger().flush()
+        builder = getattr(self, "_row_builder", None)
+        if builder is not None:
+            builder.finish()
+        return rendered
 
-        total = len(self.task_list)
+    @property
+    def render_count(self):
+        return self._render_trigger().renders
 
-        for index, task in enumerate(self.task_list):
-            completed = task.get("completed", False)
+    def render_tasks(self):
+        """
+        Sync the task list (the RecycleView from study.kv) with
+        self.task_list, or with the search / tag matches.
 
-            row = MDBoxLayout(
-                orientation="horizontal",
-                size_hint_y=None,
-                height=dp(50),
-                padding=[dp(10), dp(5)],
-                spacing=dp(10),
-            )
+        Only the view's data list is rebuilt; the view creates widgets for
+        the visible rows alone. A long flat list gets its data a chunk per
+        frame, starting with the rows that fit on screen.
+        """
+        self._render_trigger().rendered()
+        self._cancel_row_build()
+        self._refresh_tag_bar()
+        self._data_index = None
+        list_view = self.ids.get("todo_list_view")
+        if list_view is None:
+            return
+        positions = self._positions()
+        total = len(positions)  # up/down enablement uses the full list
+        tasks = self._visible_tasks()
 
-            # Checkbox first
-            row.add_widget(self._make_checkbox(index, completed))
-
-            # header
-            header_text = task.get("header", "")
-            if completed:
-                header_text = f"[s]{header_text}[/s]"
-            header_label = MDLabel(
-                text=header_text,
-                size_hint_x=0.3,
-                bold=True,
-                valign="middle",
-                markup=True,  # enable [s]...[/s]
-            )
-            row.add_widget(header_label)
-
-            # description
-            desc_text = task.get("description", "")
-            if completed:
-                desc_text = f"[s]{desc_text}[/s]"
-            desc_label = MDLabel(
-                text=desc_text,
-                size_hint_x=0.5,
-                valign="middle",
-                markup=True,
-            )
-            row.add_widget(desc_label)
-
-            # due date, right aligned (no strikethrough needed, but you can add it if you want)
-            row.add_widget(
-                MDLabel(
-                    text=task.get("due_date", ""),
-                    size_hint_x=0.2,
-                    halign="right",
-                    valign="middle",
-                )
-            )
+        if self.group_by_due:
+            list_view.data = self._grouped_data(tasks, positions, total)
+            return
+        self._data_index = {task["id"]: slot for slot, task in enumerate(tasks)}
+        rows = (self._row_data(task, positions[task["id"]], total) for task in tasks)
+        if len(tasks) <= PROGRESSIVE_MIN_ROWS:
+            list_view.data = list(rows)
+            return
 
-            # move up / move down buttons
-            row.add_widget(self._make_move_up_btn(index))
-            row.add_widget(self._make_move_down_btn(index, total))
+        chunk = []
 
-            # delete button
-            row.add_widget(self._make_delete_btn(index))
+        def add_chunk():
+            list_view.data.extend(chunk)
+            chunk.clear()
 
-            container.add_widget(row)
\ No newline at end of file
+        list_view.data = []
+        self._row_builder = ProgressiveBuilder(
+            rows, chunk.append,
+            first_count=int(list_view.height // ROW_HEIGHT) + 1,
+            on_chunk=add_chunk,
+        ).start()
+
+    def _patch_rows(self, task_ids):
+        """
+        Rewrite just the data rows of task_ids, in place. Returns False when
+        the whole list has to be rendered instead (grouped view, nothing
+        rendered yet, or one of the tasks is gone).
+        """
+        list_view = self.ids.get("todo_list_view")
+        slot_of = getattr(self, "_data_index", None)
+        if list_view is None or slot_of is None or self.group_by_due:
+            return False
+        positions = self._positions()
+        if any(task_id not in positions for task_id in task_ids):
+            return False
+        self._render_trigger().rendered()
+        builder = getattr(self, "_row_builder", None)
+        if builder is not None:
+            builder.finish()  # the rows to patch may not be in the data yet
+        total = len(positions)
+        # A move swaps tasks between these slots: refill them in list order
+        tasks = sorted((self.task_list[positions[task_id]] for task_id in task_ids
+                        if task_id in slot_of), key=lambda task: positions[task["id"]])
+        slots = sorted(slot_of[task["id"]] for task in tasks)
+        for slot, task in zip(slots, tasks):
+            slot_of[task["id"]] = slot
+            row = self._row_data(task, positions[task["id"]], total)
+            if list_view.data[slot] != row:
+                list_view.data[slot] = row
+        return True
+
+    def _cancel_row_build(self):
+        builder = getattr(self, "_row_builder", None)
+        if builder is not None:
+            builder.cancel()
+
+    def build_stats(self):
+        """Progress and timings of the latest progressive data build (None if there was none)."""
+        builder = getattr(self, "_row_builder", None)
+        return builder.stats() if builder is not None else None
@@ -0,0 +1,126 @@
+# write_behind.py
+# Background writer that coalesces saves.
+#
+# Callers mark keys as dirty together with their latest value. A worker
+# thread waits until no new changes arrived for `delay` seconds (or until
+# `max_delay` passed since the first pending change) and then hands every
+# pending change to `write_fn` in one call. A burst of N edits therefore
+# costs one write instead of N, and none of it happens on the UI thread.
+
+import threading
+import time
+
+
+class WriteBehind:
+    """Debounced, coalescing writer running on a daemon thread."""
+
+    def __init__(self, write_fn, delay=0.3, max_delay=2.0, name="write-behind"):
+        self._write_fn = write_fn    # called with {key: latest value}
+        self.delay = delay
+        self.max_delay = max_delay
+
+        self._pending = {}
+        self._pending_requests = 0
+        self._first_dirty = None
+        self._last_dirty = None
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()  # worker and flush() never write at once
+        self._stopped = False
+
+        # Counters (read them through stats())
+        self.requests = 0    # mark_dirty() calls
+        self.writes = 0      # calls to write_fn
+        self.coalesced = 0   # requests that were folded into another write
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    # ---------- public API ----------
+
+    def mark_dirty(self, key, value):
+        """Record the latest value for key; it will be written soon."""
+        with self._cond:
+            now = time.monotonic()
+            if not self._pending:
+                self._first_dirty = now
+            self._pending[key] = value
+            self._pending_requests += 1
+            self._last_dirty = now
+            self.requests += 1
+            self._cond.notify()
+
+    def mark_dirty_many(self, items):
+        """mark_dirty() for several (key, value) pairs under one lock."""
+        with self._cond:
+            now = time.monotonic()
+            for key, value in items:
+                if not self._pending:
+                    self._first_dirty = now
+                self._pending[key] = value
+                self._pending_requests += 1
+                self.requests += 1
+            self._last_dirty = now
+            self._cond.notify()
+
+    def flush(self):
+        """Write everything pending right now (blocks until done)."""
+        with self._write_lock:
+            with self._cond:
+                batch, count = self._take_pending()
+            self._write(batch, count)
+
+    def stop(self):
+        """Flush and shut the worker thread down."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join(timeout=5)
+        self.flush()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "requests": self.requests,
+                "writes": self.writes,
+                "coalesced": self.coalesced,
+                "pending": len(self._pending),
+            }
+
+    # ---------- worker ----------
+
+    def _take_pending(self):
+        batch, count = self._pending, self._pending_requests
+        self._pending = {}
+        self._pending_requests = 0
+        self._first_dirty = self._last_dirty = None
+        return batch, count
+
+    def _write(self, batch, count):
+        if not batch:
+            return
+        try:
+            self._write_fn(batch)
+        except Exception as e:
+            print(f"Error in background save: {e}")
+        with self._cond:
+            self.writes += 1
+            self.coalesced += count - 1
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                # Debounce: wait for a quiet period, but never longer than max_delay
+                while self._pending and not self._stopped:
+                    now = time.monotonic()
+                    due = min(self._last_dirty + self.delay,
+                              self._first_dirty + self.max_delay)
+                    if now >= due:
+                        break
+                    self._cond.wait(due - now)
+                if self._stopped:
+                    return
+            self.flush()
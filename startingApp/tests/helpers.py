@@ -0,0 +1,62 @@
+"""
+Test doubles shared by the unit tests: a stand-in for kivy.clock.Clock
+that only runs callbacks when a test asks it to.
+"""
+
+
+class FakeEvent:
+    """What FakeClock.schedule_once returns."""
+
+    def __init__(self, callback, timeout=0):
+        self.callback = callback
+        self.timeout = timeout
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeTrigger:
+    """What FakeClock.create_trigger returns: calling it arms it (once) for the next frame."""
+
+    def __init__(self, clock, callback):
+        self.clock = clock
+        self.callback = callback
+
+    def __call__(self, *args):
+        if self not in self.clock.triggers:
+            self.clock.triggers.append(self)
+
+    def cancel(self):
+        if self in self.clock.triggers:
+            self.clock.triggers.remove(self)
+
+
+class FakeClock:
+    """Stands in for kivy.clock.Clock: frames run only when next_frame() is called."""
+
+    def __init__(self):
+        self.events = []     # schedule_once calls since the last frame
+        self.triggers = []   # armed triggers
+
+    def schedule_once(self, callback, timeout=0):
+        event = FakeEvent(callback, timeout)
+        self.events.append(event)
+        return event
+
+    def create_trigger(self, callback, timeout=0):
+        return FakeTrigger(self, callback)
+
+    def armed(self):
+        """Scheduled events that weren't cancelled."""
+        return [event for event in self.events if not event.cancelled]
+
+    def next_frame(self):
+        """Run every armed event and trigger (timeouts are ignored)."""
+        events, self.events = self.events, []
+        triggers, self.triggers = self.triggers, []
+        for event in events:
+            if not event.cancelled:
+                event.callback(0)
+        for trigger in triggers:
+            trigger.callback(0)
@@ -0,0 +1,117 @@
+"""
+Unit tests for the SQLite flashcard store (screens/card_repository.py)
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.card_model import Card
+from screens.card_repository import CardRepository
+
+
+class TestCardRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / "flashcards.db"
+        self.repo = CardRepository(self.db_path)
+
+    def tearDown(self):
+        self.repo.close()
+        self.tmp.cleanup()
+
+    def _add(self, front, back=""):
+        card = Card(front, back)
+        self.repo.put(card)
+        return card
+
+    def test_put_assigns_id_and_position_in_order(self):
+        cards = [self._add(front) for front in ("A", "B", "C")]
+        self.assertEqual([card.position for card in cards], [0.0, 1.0, 2.0])
+        self.assertEqual([card.front for card in self.repo.all()], ["A", "B", "C"])
+        self.assertEqual([card.id for card in self.repo.all()], [card.id for card in cards])
+
+    def test_cards_survive_reopening(self):
+        self._add("mitosis", "cell division")
+        self.repo.close()
+        self.repo = CardRepository(self.db_path)
+        self.assertEqual(self.repo.all()[0].back, "cell division")
+
+    def test_restored_card_keeps_its_place(self):
+        a, b, c = (self._add(front) for front in ("A", "B", "C"))
+        self.repo.delete(b.id)
+        self.assertEqual([card.front for card in self.repo.all()], ["A", "C"])
+        self.repo.put(b)  # undo
+        self.assertEqual([card.front for card in self.repo.all()], ["A", "B", "C"])
+        self.assertEqual(self.repo.count(), 3)
+
+    def test_put_existing_card_rewrites_its_row(self):
+        card = self._add("A")
+        card.back = "answer"
+        self.repo.put(card)
+        self.assertEqual(self.repo.count(), 1)
+        self.assertEqual(self.repo.all()[0].back, "answer")
+
+    def test_update(self):
+        card = self._add("A")
+        self.repo.update(card.id, back="B", ignored="x")
+        self.assertEqual(self.repo.all()[0].back, "B")
+
+    def test_write_batch_deletes_then_saves_in_one_go(self):
+        a, b = self._add("A"), self._add("B")
+        new = [Card("C"), Card("D")]
+        self.repo.write_batch(put=new, delete=[a.id, b.id])
+        self.assertEqual([card.front for card in self.repo.all()], ["C", "D"])
+        self.assertTrue(all(card.id for card in new))
+        # and back again (undo): the old cards return under their ids
+        self.repo.write_batch(put=[a, b], delete=[card.id for card in new])
+        self.assertEqual([card.id for card in self.repo.all()], [a.id, b.id])
+
+    def test_write_batch_is_one_transaction(self):
+        self._add("A")
+        with self.assertRaises(sqlite3.Error):
+            self.repo.write_batch(put=[Card("B"), Card(object())])
+        self.assertEqual([card.front for card in self.repo.all()], ["A"])
+
+    def test_pages_cover_deck_once(self):
+        for i in range(25):
+            self._add(f"card {i}")
+        pages = list(self.repo.pages(size=10))
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        fronts = [card.front for page in pages for card in page]
+        self.assertEqual(fronts, [f"card {i}" for i in range(25)])
+
+    def test_pages_of_empty_deck(self):
+        self.assertEqual(list(self.repo.pages()), [])
+
+
+class TestCard(unittest.TestCase):
+
+    def test_new_copies_text_only(self):
+        saved = Card("front", "back", id=4, position=2.0, due="2026-01-01")
+        for source in (saved, {"front": "front", "back": "back", "id": 4}):
+            card = Card.new(source)
+            self.assertEqual((card.front, card.back), ("front", "back"))
+            self.assertIsNone(card.id)
+            self.assertIsNone(card.position)
+
+    def test_no_instance_dict(self):
+        card = Card("front")
+        self.assertFalse(hasattr(card, "__dict__"))
+        with self.assertRaises(AttributeError):
+            card.extra = 1
+
+    def test_to_dict(self):
+        self.assertEqual(Card("a", "b", id=1).to_dict(),
+                         {"id": 1, "front": "a", "back": "b", "position": None, "due": ""})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Unit tests for the undo/redo command log (screens/command_log.py)
+"""
+
+import os
+import sys
+import unittest
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.command_log import CommandLog, estimate_size
+
+
+class TestCommandLog(unittest.TestCase):
+
+    def setUp(self):
+        self.items = []
+        self.log = CommandLog(budget=10_000, max_entries=5)
+
+    def add(self, value):
+        """An undoable edit: append value to self.items."""
+        self.items.append(value)
+        self.log.record(f"add {value}", self.items.pop, lambda: self.items.append(value), value)
+
+    def test_undo_redo(self):
+        self.add(1)
+        self.add(2)
+        self.assertEqual(self.log.undo(), "add 2")
+        self.assertEqual(self.items, [1])
+        self.assertEqual(self.log.redo(), "add 2")
+        self.assertEqual(self.items, [1, 2])
+        self.assertIsNone(self.log.redo())
+
+    def test_new_edit_clears_redo(self):
+        self.add(1)
+        self.log.undo()
+        self.add(2)
+        self.assertFalse(self.log.can_redo())
+        self.assertEqual(self.items, [2])
+
+    def test_entry_limit(self):
+        for i in range(8):
+            self.add(i)
+        while self.log.undo():
+            pass
+        self.assertEqual(self.items, [0, 1, 2])
+
+    def test_memory_budget(self):
+        for i in range(20):
+            self.add("x" * 2000 + str(i))
+        stats = self.log.stats()
+        self.assertLessEqual(stats["bytes"], 10_000)
+        self.assertLess(stats["undo"], 5)
+
+    def test_oversized_edit_clears_history(self):
+        self.add(1)
+        self.add("x" * 20_000)
+        self.assertFalse(self.log.can_undo())
+        self.assertEqual(self.log.stats()["bytes"], 0)
+
+    def test_replay_does_not_record(self):
+        def undo():
+            self.log.record("nested", lambda: None, lambda: None)
+        self.log.record("edit", undo, lambda: None)
+        self.log.undo()
+        self.assertEqual(self.log.stats()["undo"], 0)
+        self.assertEqual(self.log.stats()["redo"], 1)
+
+    def test_estimate_size_is_deep(self):
+        self.assertGreater(estimate_size({"a": "x" * 1000}), 1000)
+        self.assertGreater(estimate_size([["x" * 500], ("y" * 500,)]), 1000)
+
+    def test_estimate_size_follows_slots(self):
+        class Slotted:
+            __slots__ = ("text", "unset")
+
+            def __init__(self):
+                self.text = "x" * 1000
+
+        self.assertGreater(estimate_size(Slotted()), 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Unit tests for named flashcard decks (screens/decks.py)
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.card_model import Card
+from screens.decks import DEFAULT_DECK, DeckStore
+
+
+class TestDeckStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.store = self.make_store()
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def make_store(self):
+        return DeckStore(self.root / "decks.json", self.root / "decks",
+                         self.root / "flashcards.db")
+
+    def _fill(self, name, count, due=""):
+        repo = self.store.open(name)
+        for i in range(count):
+            repo.put(Card(f"{name} {i}", due=due))
+
+    def test_default_deck_is_original_file(self):
+        self.assertEqual(self.store.names(), [DEFAULT_DECK])
+        self.assertEqual(self.store.path_for(DEFAULT_DECK), self.root / "flashcards.db")
+
+    def test_counts_recorded_on_close(self):
+        self.store.create("Spanish")
+        self._fill("Spanish", 3)
+        self._fill("Spanish", 2, due="2999-01-01")
+        self.store.close_deck("Spanish")
+        self.assertFalse(self.store.is_open("Spanish"))
+        self.assertEqual(self.store.summary("Spanish"), {"cards": 5, "due": 3})
+
+    def test_startup_reads_only_manifest(self):
+        self.store.create("Spanish")
+        self._fill("Spanish", 4)
+        self.store.close_deck("Spanish")
+        store = self.make_store()
+        self.assertEqual(store.summary("Spanish"), {"cards": 4, "due": 4})
+        self.assertFalse(store.is_open("Spanish"))
+        self.assertFalse(store.is_open(DEFAULT_DECK))
+
+    def test_counts_kept_in_manifest_file(self):
+        self.store.create("Spanish")
+        self._fill("Spanish", 1)
+        self.store.record_counts("Spanish", today=date(2026, 1, 1))
+        with open(self.root / "decks.json", encoding="utf-8") as f:
+            entries = {entry["name"]: entry for entry in json.load(f)["lists"]}
+        self.assertEqual(entries["Spanish"]["cards"], 1)
+        self.assertEqual(entries["Spanish"]["due"], 1)
+
+    def test_unopened_deck_summary_is_zero(self):
+        self.store.create("Empty")
+        self.assertEqual(self.store.summary("Empty"), {"cards": 0, "due": 0})
+
+    def test_deck_name_errors_mention_decks(self):
+        self.store.create("Spanish")
+        with self.assertRaisesRegex(ValueError, "deck named"):
+            self.store.create("spanish")
+        with self.assertRaisesRegex(ValueError, "default deck"):
+            self.store.delete(DEFAULT_DECK)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Unit tests for the due-date index (screens/due_index.py)
+"""
+
+import os
+import sys
+import unittest
+from datetime import date, timedelta
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.due_index import DueDateIndex, due_ordinal
+
+TODAY = date(2025, 6, 15)
+
+
+def task(task_id, days_from_today, completed=False):
+    due = "" if days_from_today is None else (TODAY + timedelta(days=days_from_today)).strftime("%m/%d/%Y")
+    return {"id": task_id, "header": f"Task {task_id}", "due_date": due, "completed": completed}
+
+
+class TestDueDateIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = DueDateIndex([
+            task(1, 3), task(2, -2), task(3, 0), task(4, None),
+            task(5, 30), task(6, 1), task(7, -1, completed=True),
+        ])
+
+    def test_due_ordinal(self):
+        self.assertEqual(due_ordinal("06/15/2025"), TODAY.toordinal())
+        self.assertIsNone(due_ordinal(""))
+        self.assertIsNone(due_ordinal("13/45/2025"))
+
+    def test_skips_undated_and_completed(self):
+        self.assertEqual(len(self.index), 5)
+
+    def test_views(self):
+        self.assertEqual(self.index.overdue(TODAY), [2])
+        self.assertEqual(self.index.due_today(TODAY), [3])
+        self.assertEqual(self.index.upcoming(7, TODAY), [6, 1])
+        self.assertEqual(self.index.upcoming(30, TODAY), [6, 1, 5])
+
+    def test_groups(self):
+        self.assertEqual(self.index.groups(7, TODAY),
+                         [("Overdue", [2]), ("Today", [3]), ("Next 7 days", [6, 1])])
+
+    def test_update_moves_task(self):
+        moved = task(1, -5)
+        self.index.update(moved)
+        self.assertEqual(self.index.overdue(TODAY), [1, 2])
+        moved["completed"] = True
+        self.index.update(moved)
+        self.assertEqual(self.index.overdue(TODAY), [2])
+
+    def test_remove(self):
+        self.index.remove(3)
+        self.index.remove(3)  # removing twice is harmless
+        self.assertEqual(self.index.due_today(TODAY), [])
+        self.assertEqual(len(self.index), 4)
+
+    def test_same_day_keeps_id_order(self):
+        index = DueDateIndex([task(9, 2), task(8, 2)])
+        self.assertEqual(index.between(None, None), [8, 9])
+
+
+if __name__ == '__main__':
+    unittest.main()
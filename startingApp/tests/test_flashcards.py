@@ -0,0 +1,155 @@
+"""
+Screen-level tests for the flash cards screen: the deck is read a page per
+frame without disturbing the card on screen or rebuilding the grid, and
+an edit updates `cards` once even before the whole deck is loaded.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kivymd.app import MDApp
+
+from screens.card_model import Card
+from screens.card_repository import PAGE_SIZE
+
+DECK_SIZE = 2 * PAGE_SIZE + 50  # three pages
+
+
+class TestApp(MDApp):
+    """Minimal test app for KivyMD initialization"""
+    def build(self):
+        pass
+
+
+class TestCardPages(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = TestApp()
+
+    def setUp(self):
+        from screens import flashCards
+        from screens.decks import DEFAULT_DECK, DeckStore
+
+        self.tmp = tempfile.TemporaryDirectory()
+        folder = Path(self.tmp.name)
+        store = DeckStore(folder / "decks.json", folder / "decks", folder / "flashcards.db")
+        p = patch.object(flashCards, "decks", store)
+        p.start()
+        self.addCleanup(p.stop)
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(store.close)
+        store.open(DEFAULT_DECK).write_batch(put=[Card(f"Front {i}", f"Back {i}")
+                                                  for i in range(DECK_SIZE)])
+
+        self.screen = flashCards.FlashCardsScreen()
+        self.grid = Mock(data=[])
+        self.screen.ids = {"card_grid_view": self.grid}
+        self.screen._ensure_loaded()  # first page now, the rest a page per frame
+        self.addCleanup(self.screen.close_deck)
+
+    def test_page_load_keeps_card_flipped(self):
+        self.screen.flip_card()
+        self.screen._load_page()
+        self.assertEqual(len(self.screen.cards), 2 * PAGE_SIZE)
+        self.assertTrue(self.screen.showing_back)
+        self.assertEqual(self.screen.current_text, "Back 0")
+
+    def test_page_load_extends_grid(self):
+        self.screen.view_mode = "grid"
+        self.screen._refresh_grid()
+        renders = self.screen.render_count
+        self.screen._load_page()
+        self.screen._load_page()
+        self.assertFalse(self.screen._render_trigger().pending)
+        self.assertEqual(self.screen.render_count, renders)
+        self.assertEqual([tile["card_index"] for tile in self.grid.data], list(range(DECK_SIZE)))
+
+    def test_edit_still_resets_flip(self):
+        self.screen.flip_card()
+        self.screen.delete_card(0)
+        self.assertFalse(self.screen.showing_back)
+        self.assertEqual(self.screen.current_text, "Front 1")
+
+    def count_updates(self):
+        updates = []
+        self.screen.bind(cards=lambda *args: updates.append(len(self.screen.cards)))
+        return updates
+
+    def test_add_before_fully_loaded_updates_once(self):
+        updates = self.count_updates()
+        self.screen.add_cards([{"front": "New"}])
+        self.assertEqual(updates, [DECK_SIZE + 1])
+        self.assertEqual(self.screen.cards[-1].front, "New")
+        self.assertIsNone(self.screen._pages)
+
+    def test_remove_and_replace_update_once(self):
+        updates = self.count_updates()
+        self.screen.remove_cards([DECK_SIZE - 1])  # a card on a page not read yet
+        self.assertEqual(updates, [DECK_SIZE - 1])
+        self.screen.replace_cards([{"front": "Only"}])
+        self.assertEqual(updates, [DECK_SIZE - 1, 1])
+
+    def test_undo_updates_once(self):
+        self.screen.add_cards([{"front": "New"}])
+        updates = self.count_updates()
+        self.screen.undo()
+        self.assertEqual(updates, [DECK_SIZE])
+
+    def test_remove_nothing_keeps_the_whole_deck(self):
+        self.screen.remove_cards([DECK_SIZE + 5])
+        self.assertEqual(len(self.screen.cards), DECK_SIZE)
+
+
+    def ids(self):
+        return [card.id for card in self.screen.cards]
+
+    def load_all(self):
+        while self.screen._pages is not None:
+            self.screen._load_page()
+
+    def largest_list_kept(self):
+        """Length of the longest list the undo entries hold on to."""
+        kept = [0]
+        for command in self.screen._history()._undo + self.screen._history()._redo:
+            for action in (command.undo, command.redo):
+                for cell in action.__closure__ or ():
+                    if isinstance(cell.cell_contents, list):
+                        kept.append(len(cell.cell_contents))
+        return max(kept)
+
+    def test_undo_redo_delete_puts_cards_back_in_place(self):
+        self.load_all()
+        original = self.ids()
+        self.screen.remove_cards([0, 5, DECK_SIZE - 1])
+        self.screen.undo()
+        self.assertEqual(self.ids(), original)
+        self.screen.redo()
+        self.assertEqual(self.ids(), [original[i] for i in range(DECK_SIZE) if i not in (0, 5, DECK_SIZE - 1)])
+
+    def test_undo_redo_add(self):
+        self.load_all()
+        original = self.ids()
+        added = self.screen.add_cards([{"front": "A"}, {"front": "B"}])
+        self.screen.undo()
+        self.assertEqual(self.ids(), original)
+        self.screen.redo()
+        self.assertEqual(self.ids(), original + [card.id for card in added])
+
+    def test_history_keeps_only_touched_cards(self):
+        for i in range(10):
+            self.screen.add_card(f"New {i}")
+        self.screen.remove_cards([3, 4])
+        self.screen.undo()
+        self.assertLessEqual(self.largest_list_kept(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Unit tests for the frame-sliced list builder (screens/progressive.py)
+"""
+
+import os
+import sys
+import unittest
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.progressive import ProgressiveBuilder
+
+from tests.helpers import FakeClock
+
+
+class FakeTimer:
+    """Every call advances time by `step` seconds (one 'widget' costs one step)."""
+
+    def __init__(self, step=0.001):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+class TestProgressiveBuilder(unittest.TestCase):
+
+    def make(self, items, **kwargs):
+        self.clock = FakeClock()
+        self.built = []
+        kwargs.setdefault("budget", 0.005)
+        return ProgressiveBuilder(items, self.built.append, clock=self.clock,
+                                  timer=FakeTimer(), **kwargs)
+
+    def test_builds_in_chunks_across_frames(self):
+        builder = self.make(range(20)).start()
+        first = len(self.built)
+        self.assertGreater(first, 0)
+        self.assertLess(first, 20)
+        self.assertFalse(builder.done)
+        while not builder.done:
+            self.clock.next_frame()
+        self.assertEqual(self.built, list(range(20)))
+        self.assertGreater(builder.stats()["chunks"], 1)
+
+    def test_first_chunk_covers_visible_items(self):
+        self.make(range(100), first_count=30).start()
+        self.assertEqual(self.built[:30], list(range(30)))
+        self.assertGreaterEqual(len(self.built), 30)
+
+    def test_cancel_stops_the_build(self):
+        builder = self.make(range(100)).start()
+        count = len(self.built)
+        builder.cancel()
+        self.clock.next_frame()
+        self.assertEqual(len(self.built), count)
+        self.assertTrue(builder.stats()["cancelled"])
+        self.assertFalse(builder.done)
+
+    def test_finish_builds_the_rest_now(self):
+        builder = self.make(range(100)).start()
+        builder.finish()
+        self.assertEqual(self.built, list(range(100)))
+        self.assertTrue(builder.done)
+
+    def test_small_build_finishes_in_first_frame(self):
+        done = []
+        builder = self.make(range(3), on_done=lambda: done.append(True)).start()
+        self.assertTrue(builder.done)
+        self.assertEqual(done, [True])
+        self.assertEqual(self.clock.events, [])
+
+    def test_on_chunk_runs_after_each_chunk(self):
+        sizes = []
+        builder = self.make(range(40), on_chunk=lambda: sizes.append(len(self.built))).start()
+        self.assertEqual(len(sizes), 1)
+        while not builder.done:
+            self.clock.next_frame()
+        self.assertEqual(len(sizes), builder.stats()["chunks"])
+        self.assertEqual(sizes[-1], 40)
+
+    def test_metrics(self):
+        builder = self.make(range(50)).start()
+        while not builder.done:
+            self.clock.next_frame()
+        stats = builder.stats()
+        self.assertEqual(stats["built"], 50)
+        self.assertIsNotNone(stats["first_frame"])
+        self.assertLessEqual(stats["first_frame"], stats["total"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Unit tests for lexicographic rank keys (screens/rank.py)
+"""
+
+import os
+import random
+import sys
+import unittest
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.rank import RANK_WIDTH, initial_ranks, rank_between
+
+
+class TestRankBetween(unittest.TestCase):
+
+    def test_first_key(self):
+        self.assertEqual(len(rank_between()), RANK_WIDTH)
+
+    def test_between_neighbours(self):
+        a = rank_between()
+        b = rank_between(a, None)
+        c = rank_between(a, b)
+        self.assertTrue(a < c < b)
+
+    def test_rejects_wrong_order(self):
+        with self.assertRaises(ValueError):
+            rank_between("b", "a")
+
+    def test_appends_and_prepends_stay_short(self):
+        keys = [rank_between()]
+        for _ in range(2000):
+            keys.append(rank_between(keys[-1], None))
+            keys.insert(0, rank_between(None, keys[0]))
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual(max(len(k) for k in keys), RANK_WIDTH)
+
+    def test_random_inserts_keep_order(self):
+        rng = random.Random(3203)
+        keys = []
+        for _ in range(3000):
+            pos = rng.randint(0, len(keys))
+            before = keys[pos - 1] if pos > 0 else None
+            after = keys[pos] if pos < len(keys) else None
+            key = rank_between(before, after)
+            if before is not None:
+                self.assertLess(before, key)
+            if after is not None:
+                self.assertLess(key, after)
+            keys.insert(pos, key)
+        self.assertEqual(len(set(keys)), len(keys))
+
+    def test_initial_ranks_sorted(self):
+        ranks = initial_ranks(500)
+        self.assertEqual(ranks, sorted(ranks))
+        self.assertEqual(len(set(ranks)), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
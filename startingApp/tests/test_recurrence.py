@@ -0,0 +1,69 @@
+"""
+Unit tests for recurring task rules (screens/recurrence.py)
+"""
+
+import os
+import sys
+import unittest
+from datetime import date
+from itertools import islice
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.recurrence import Recurrence, first_occurrence, occurrences, parse_rule
+
+MONDAY = date(2025, 6, 2)
+
+
+class TestParseRule(unittest.TestCase):
+
+    def test_rules_round_trip(self):
+        for text in ("daily", "every 3 days", "weekly mon,wed,fri"):
+            self.assertEqual(str(parse_rule(text)), text)
+        self.assertEqual(str(parse_rule("Weekly Friday, monday")), "weekly mon,fri")
+
+    def test_empty_is_no_rule(self):
+        self.assertIsNone(parse_rule(""))
+        self.assertIsNone(parse_rule("   "))
+
+    def test_invalid_rules(self):
+        for text in ("monthly", "every x days", "every 0 days", "weekly", "weekly funday"):
+            with self.assertRaises(ValueError):
+                parse_rule(text)
+
+
+class TestOccurrences(unittest.TestCase):
+
+    def test_daily(self):
+        days = list(occurrences(parse_rule("daily"), MONDAY, end=date(2025, 6, 4)))
+        self.assertEqual(days, [date(2025, 6, 2), date(2025, 6, 3), date(2025, 6, 4)])
+
+    def test_weekly_weekdays(self):
+        rule = parse_rule("weekly tue,fri")
+        days = list(islice(occurrences(rule, MONDAY), 4))
+        self.assertEqual(days, [date(2025, 6, 3), date(2025, 6, 6),
+                                date(2025, 6, 10), date(2025, 6, 13)])
+
+    def test_window_skips_ahead(self):
+        rule = Recurrence(3)
+        # 182 days after MONDAY is Dec 1, so the 3-day cycle lands on Dec 2
+        days = list(occurrences(rule, MONDAY, start=date(2025, 12, 1), end=date(2025, 12, 7)))
+        self.assertEqual(days, [date(2025, 12, 2), date(2025, 12, 5)])
+        rule = parse_rule("weekly sun")
+        days = list(occurrences(rule, MONDAY, start=date(2025, 12, 1), end=date(2025, 12, 14)))
+        self.assertEqual(days, [date(2025, 12, 7), date(2025, 12, 14)])
+
+    def test_generator_is_lazy(self):
+        # No end: an infinite generator that only produces what is taken
+        days = occurrences(parse_rule("daily"), MONDAY)
+        self.assertEqual(next(days), MONDAY)
+
+    def test_first_and_next(self):
+        rule = parse_rule("weekly mon")
+        self.assertEqual(first_occurrence(rule, date(2025, 6, 3)), date(2025, 6, 9))
+        self.assertEqual(rule.next_after(MONDAY), date(2025, 6, 9))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Unit tests for the heap-driven reminder scheduler (screens/reminders.py)
+"""
+
+import os
+import sys
+import unittest
+from datetime import date, datetime
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.reminders import LATE_DELAY, ReminderScheduler, reminder_time
+
+from tests.helpers import FakeClock
+
+
+class TestReminderScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        self.clock = FakeClock()
+        self.fired = []
+        self.scheduler = ReminderScheduler(self.fired.append, clock=self.clock,
+                                           now=lambda: self.now)
+
+    def fire(self):
+        """Advance time to the armed event and run it."""
+        (event,) = self.clock.armed()
+        self.now += event.timeout
+        event.cancel()
+        event.callback(event.timeout)
+
+    def test_one_event_for_many_reminders(self):
+        self.scheduler.schedule_many((i, 2000.0 + i) for i in range(1000))
+        self.assertEqual(len(self.clock.armed()), 1)
+        self.assertEqual(self.clock.armed()[0].timeout, 1000.0)
+
+    def test_fires_in_order_and_rearms(self):
+        self.scheduler.schedule("b", 1020.0)
+        self.scheduler.schedule("a", 1010.0)
+        self.scheduler.schedule("c", 1020.0)
+        self.fire()
+        self.assertEqual(self.fired, ["a"])
+        self.fire()
+        self.assertEqual(self.fired, ["a", "b", "c"])
+        self.assertEqual(self.clock.armed(), [])
+        self.assertEqual(self.scheduler.stats()["wakeups"], 2)
+
+    def test_reschedule_and_cancel(self):
+        self.scheduler.schedule("a", 1010.0)
+        self.scheduler.schedule("b", 1050.0)
+        self.scheduler.schedule("a", 1100.0)   # moved later: b is now first
+        self.assertEqual(self.scheduler.next_time(), 1050.0)
+        self.scheduler.cancel("b")
+        self.assertEqual(self.clock.armed()[0].timeout, 100.0)
+        self.fire()
+        self.assertEqual(self.fired, ["a"])
+
+    def test_later_reminder_does_not_rearm(self):
+        self.scheduler.schedule("a", 1010.0)
+        arms = self.scheduler.stats()["arms"]
+        for i in range(100):
+            self.scheduler.schedule(i, 5000.0 + i)
+        self.assertEqual(self.scheduler.stats()["arms"], arms)
+
+    def test_past_time_is_not_scheduled(self):
+        self.scheduler.schedule("a", 900.0)
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertEqual(self.clock.armed(), [])
+
+    def test_stale_entries_are_swept(self):
+        for i in range(500):
+            self.scheduler.schedule("a", 2000.0 + i)
+        self.assertLess(self.scheduler.stats()["heap"], 50)
+
+
+class TestReminderTime(unittest.TestCase):
+
+    def test_reminder_time(self):
+        now = datetime(2025, 6, 1, 12).timestamp()
+        task = {"due_date": "06/15/2025", "completed": False}
+        self.assertEqual(reminder_time(task, now=now), datetime(2025, 6, 15, 9).timestamp())
+        self.assertIsNone(reminder_time({"due_date": "", "completed": False}, now=now))
+        self.assertIsNone(reminder_time({"due_date": "06/15/2025", "completed": True}, now=now))
+
+    def test_due_today_after_reminder_hour_fires_soon(self):
+        now = datetime(2025, 6, 15, 14).timestamp()
+        task = {"due_date": "06/15/2025", "completed": False}
+        self.assertEqual(reminder_time(task, now=now), now + LATE_DELAY)
+
+    def test_overdue_fires_soon(self):
+        now = datetime(2025, 6, 20, 8).timestamp()
+        task = {"due_date": "06/15/2025", "completed": False}
+        when = reminder_time(task, now=now)
+        self.assertEqual(when, now + LATE_DELAY)
+
+        # ...and is actually scheduled rather than dropped as a past time
+        clock = FakeClock()
+        scheduler = ReminderScheduler(lambda key: None, clock=clock, now=lambda: now)
+        scheduler.schedule("late", when)
+        self.assertEqual([event.timeout for event in clock.armed()], [LATE_DELAY])
+
+
+    def test_late_reminder_once_a_day(self):
+        now = datetime(2025, 6, 20, 8).timestamp()
+        task = {"due_date": "06/15/2025", "completed": False}
+        self.assertIsNone(reminder_time(task, now=now, reminded_on=date(2025, 6, 20)))
+        self.assertEqual(reminder_time(task, now=now, reminded_on=date(2025, 6, 19)), now + LATE_DELAY)
+
+    def test_reminded_on_leaves_future_reminders(self):
+        now = datetime(2025, 6, 1, 12).timestamp()
+        task = {"due_date": "06/15/2025", "completed": False}
+        self.assertEqual(reminder_time(task, now=now, reminded_on=date(2025, 6, 1)),
+                         datetime(2025, 6, 15, 9).timestamp())
+
+
+if __name__ == '__main__':
+    unittest.main()
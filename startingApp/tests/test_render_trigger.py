@@ -0,0 +1,79 @@
+"""
+Unit tests for coalesced rendering (screens/render_trigger.py)
+"""
+
+import os
+import sys
+import unittest
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.render_trigger import RenderTrigger
+
+from tests.helpers import FakeClock
+
+
+class Screen:
+    """Minimal screen: render() reports itself like render_tasks does."""
+
+    def __init__(self, clock):
+        self.renders = RenderTrigger(self.render, clock=clock)
+
+    def render(self):
+        self.renders.rendered()
+
+
+class TestRenderTrigger(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.screen = Screen(self.clock)
+        self.trigger = self.screen.renders
+
+    def test_many_requests_one_render(self):
+        for _ in range(10):
+            self.trigger.request()
+        self.assertEqual(self.trigger.renders, 0)
+        self.clock.next_frame()
+        self.assertEqual(self.trigger.renders, 1)
+        self.assertEqual(self.trigger.stats(), {"requests": 10, "renders": 1, "pending": False})
+
+    def test_nothing_requested_nothing_rendered(self):
+        self.clock.next_frame()
+        self.assertEqual(self.trigger.renders, 0)
+
+    def test_requests_in_later_frame_render_again(self):
+        self.trigger.request()
+        self.clock.next_frame()
+        self.trigger.request()
+        self.trigger.request()
+        self.clock.next_frame()
+        self.assertEqual(self.trigger.renders, 2)
+
+    def test_flush_renders_now_and_disarms(self):
+        self.trigger.request()
+        self.assertTrue(self.trigger.flush())
+        self.assertEqual(self.trigger.renders, 1)
+        self.clock.next_frame()
+        self.assertEqual(self.trigger.renders, 1)
+        self.assertFalse(self.trigger.flush())
+
+    def test_direct_render_absorbs_pending_request(self):
+        self.trigger.request()
+        self.screen.render()
+        self.clock.next_frame()
+        self.assertEqual(self.trigger.renders, 1)
+
+    def test_render_without_report_does_not_stall(self):
+        calls = []
+        trigger = RenderTrigger(lambda: calls.append(1), clock=self.clock)
+        trigger.request()
+        self.clock.next_frame()
+        trigger.request()
+        self.clock.next_frame()
+        self.assertEqual(calls, [1, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Unit tests for the tag index (screens/tag_index.py)
+"""
+
+import os
+import sys
+import unittest
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.tag_index import TagIndex, parse_tags
+
+
+def task(task_id, *tags):
+    return {"id": task_id, "header": f"Task {task_id}", "tags": list(tags)}
+
+
+class TestTagIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = TagIndex([
+            task(1, "bio", "lab"),
+            task(2, "chem", "lab"),
+            task(3, "english"),
+            task(4),
+        ])
+
+    def test_parse_tags(self):
+        self.assertEqual(parse_tags("Exam, #bio  lab,exam"), ["exam", "bio", "lab"])
+        self.assertEqual(parse_tags(""), [])
+
+    def test_tags_and_counts(self):
+        self.assertEqual(self.index.tags(), ["bio", "chem", "english", "lab"])
+        self.assertEqual(self.index.count("lab"), 2)
+        self.assertIn("bio", self.index)
+
+    def test_match_all_and_any(self):
+        self.assertEqual(self.index.match(["lab"]), {1, 2})
+        self.assertEqual(self.index.match(["lab", "bio"]), {1})
+        self.assertEqual(self.index.match(["lab", "english"]), set())
+        self.assertEqual(self.index.match(["bio", "english"], mode="any"), {1, 3})
+        self.assertEqual(self.index.match(["unknown"]), set())
+
+    def test_no_tags_is_no_filter(self):
+        self.assertIsNone(self.index.match([]))
+
+    def test_update_and_remove(self):
+        self.index.update(task(1, "bio"))
+        self.assertEqual(self.index.match(["lab"]), {2})
+        self.index.remove(2)
+        self.assertNotIn("lab", self.index)
+        self.assertNotIn("chem", self.index)
+        self.assertEqual(self.index.tags(), ["bio", "english"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Unit tests for the append-only task archive (screens/task_archive.py)
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.task_archive import TaskArchive
+
+
+class TestTaskArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "todo_items.archive.jsonl"
+        self.archive = TaskArchive(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_missing_file_is_empty(self):
+        self.assertEqual(list(self.archive), [])
+        self.assertEqual(self.archive.recent(), [])
+
+    def test_append_only(self):
+        self.archive.append([{"id": 1, "header": "A"}, {"id": 2, "header": "B"}])
+        self.archive.append([{"id": 3, "header": "C"}])
+        self.assertEqual([t["header"] for t in self.archive], ["A", "B", "C"])
+        self.assertEqual(self.archive.count(), 3)
+        self.assertEqual(self.archive.append([]), 0)
+
+    def test_recent_newest_first(self):
+        self.archive.append({"id": i, "header": f"T{i}"} for i in range(10))
+        self.assertEqual([t["id"] for t in self.archive.recent(3)], [9, 8, 7])
+
+    def test_torn_line_is_skipped(self):
+        self.archive.append([{"id": 1, "header": "A"}])
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"id": 2, "hea')
+        self.assertEqual([t["id"] for t in self.archive], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
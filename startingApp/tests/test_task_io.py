@@ -0,0 +1,160 @@
+"""
+Unit tests for CSV / iCalendar task import and export (screens/task_io.py)
+"""
+
+import io
+import os
+import sys
+import unittest
+from datetime import date, timedelta
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.task_io import (
+    new_report, read_csv, read_ics, validated_batches, write_csv, write_ics,
+)
+
+SOON = date.today() + timedelta(days=30)
+SOON_UI = SOON.strftime("%m/%d/%Y")
+
+
+class TestCsv(unittest.TestCase):
+
+    def test_read_with_aliases(self):
+        text = ("Title,Notes,Due,Done,Labels\n"
+                f"Essay,Draft intro,{SOON.isoformat()},yes,\"english, Writing\"\n"
+                "\n"
+                "Quiz,,,,\n")
+        tasks = list(read_csv(io.StringIO(text)))
+        self.assertEqual(len(tasks), 2)
+        self.assertEqual(tasks[0]["header"], "Essay")
+        self.assertEqual(tasks[0]["due_date"], SOON_UI)
+        self.assertTrue(tasks[0]["completed"])
+        self.assertEqual(tasks[0]["tags"], ["english", "writing"])
+        self.assertEqual(tasks[1]["due_date"], "")
+
+    def test_round_trip(self):
+        tasks = [{"header": "Lab, part 2", "description": "Line one", "due_date": SOON_UI,
+                  "completed": False, "tags": ["bio"], "recurrence": "weekly mon"}]
+        out = io.StringIO()
+        self.assertEqual(write_csv(tasks, out), 1)
+        (task,) = read_csv(io.StringIO(out.getvalue()))
+        self.assertEqual(task, tasks[0])
+
+
+class TestIcs(unittest.TestCase):
+
+    def test_read_vtodo_and_vevent(self):
+        text = ("BEGIN:VCALENDAR\r\n"
+                "BEGIN:VTODO\r\n"
+                "SUMMARY:Read chapter 6\\, part 2\r\n"
+                "DESCRIPTION:A long description that is fol\r\n"
+                " ded over two lines\r\n"
+                f"DUE;VALUE=DATE:{SOON:%Y%m%d}\r\n"
+                "STATUS:COMPLETED\r\n"
+                "CATEGORIES:bio,reading\r\n"
+                "END:VTODO\r\n"
+                "BEGIN:VEVENT\r\n"
+                "SUMMARY:Lecture\r\n"
+                f"DTSTART:{SOON:%Y%m%d}T090000Z\r\n"
+                "RRULE:FREQ=WEEKLY;BYDAY=MO,WE\r\n"
+                "END:VEVENT\r\n"
+                "END:VCALENDAR\r\n")
+        todo, event = read_ics(io.StringIO(text))
+        self.assertEqual(todo["header"], "Read chapter 6, part 2")
+        self.assertEqual(todo["description"], "A long description that is folded over two lines")
+        self.assertEqual(todo["due_date"], SOON_UI)
+        self.assertTrue(todo["completed"])
+        self.assertEqual(todo["tags"], ["bio", "reading"])
+        self.assertEqual(event["due_date"], SOON_UI)
+        self.assertEqual(event["recurrence"], "weekly mon,wed")
+
+    def test_nested_components_are_skipped(self):
+        text = ("BEGIN:VCALENDAR\r\n"
+                "BEGIN:VTODO\r\n"
+                "SUMMARY:Write intro\r\n"
+                "BEGIN:VALARM\r\n"
+                "ACTION:DISPLAY\r\n"
+                "SUMMARY:Reminder\r\n"
+                "DESCRIPTION:Alarm text\r\n"
+                "END:VALARM\r\n"
+                "DESCRIPTION:First draft\r\n"
+                "END:VTODO\r\n"
+                "END:VCALENDAR\r\n")
+        (todo,) = read_ics(io.StringIO(text))
+        self.assertEqual(todo["header"], "Write intro")
+        self.assertEqual(todo["description"], "First draft")
+
+    def test_unsupported_rrule_is_a_record_error(self):
+        def event(summary, rrule):
+            return ("BEGIN:VEVENT\r\n"
+                    f"SUMMARY:{summary}\r\n"
+                    f"DTSTART:{SOON:%Y%m%d}\r\n"
+                    f"RRULE:{rrule}\r\n"
+                    "END:VEVENT\r\n")
+
+        text = ("BEGIN:VCALENDAR\r\n"
+                + event("Biweekly lab", "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO")
+                + event("Broken", "FREQ=DAILY;INTERVAL=two")
+                + event("Seminar", "FREQ=DAILY;INTERVAL=2")
+                + "END:VCALENDAR\r\n")
+        report = new_report()
+        (batch,) = validated_batches(read_ics(io.StringIO(text)), report)
+        self.assertEqual([task["header"] for task in batch], ["Seminar"])
+        self.assertEqual(batch[0]["recurrence"], "every 2 days")
+        self.assertNotIn("import_error", batch[0])
+        self.assertEqual(report["rejected"], 2)
+        self.assertTrue(report["errors"][0].startswith("Record 1: Unsupported repeat rule"))
+        self.assertTrue(report["errors"][1].startswith("Record 2: Repeat interval"))
+
+    def test_round_trip(self):
+        tasks = [{"id": 7, "header": "Review", "description": "x" * 200, "due_date": SOON_UI,
+                  "completed": False, "tags": ["exam"], "recurrence": "every 3 days"}]
+        out = io.StringIO()
+        write_ics(tasks, out)
+        self.assertTrue(all(len(line) <= 75 for line in out.getvalue().split("\r\n")))
+        (task,) = read_ics(io.StringIO(out.getvalue()))
+        task_without_id = dict(tasks[0])
+        del task_without_id["id"]
+        self.assertEqual(task, task_without_id)
+
+
+class TestValidatedBatches(unittest.TestCase):
+
+    def test_batches_and_report(self):
+        records = ({"header": f"Task {i}", "description": "", "due_date": SOON_UI,
+                    "tags": [], "recurrence": ""} for i in range(25))
+        bad = [{"header": "<script>", "due_date": ""},
+               {"header": "Old", "due_date": "01/01/2000"},
+               {"header": "Repeats", "due_date": "", "recurrence": "monthly"}]
+        report = new_report()
+        batches = list(validated_batches(list(records) + bad, report, batch_size=10))
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+        self.assertEqual(report["imported"], 25)
+        self.assertEqual(report["rejected"], 3)
+        self.assertTrue(report["errors"][0].startswith("Record 26:"))
+
+    def test_recurring_task_moves_to_first_occurrence(self):
+        start = SOON + timedelta(days=(1 - SOON.weekday()) % 7)  # a Tuesday
+        records = [{"header": "Lab", "description": "", "due_date": start.strftime("%m/%d/%Y"),
+                    "tags": [], "recurrence": "weekly mon"}]
+        (batch,) = validated_batches(records, new_report())
+        self.assertEqual(batch[0]["due_date"], (start + timedelta(days=6)).strftime("%m/%d/%Y"))
+
+    def test_streams_lazily(self):
+        consumed = []
+
+        def lines():
+            yield "header\n"
+            for i in range(1000):
+                consumed.append(i)
+                yield f"Task {i}\n"
+
+        batches = validated_batches(read_csv(lines()), new_report(), batch_size=100)
+        self.assertEqual(len(next(batches)), 100)
+        self.assertLessEqual(len(consumed), 101)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Unit tests for the legacy JSON task loader (screens/task_journal.py)
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.task_journal import read_legacy_tasks
+
+
+class TestReadLegacyTasks(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.snapshot = Path(self.tmp.name) / "todo_items.json"
+        self.journal = self.snapshot.with_suffix(".journal")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_journal(self, *records, generation=0, extra=""):
+        lines = [json.dumps({"op": "base", "generation": generation})]
+        lines.extend(json.dumps(record) for record in records)
+        self.journal.write_text("\n".join(lines) + "\n" + extra)
+
+    def test_no_files(self):
+        self.assertEqual(read_legacy_tasks(self.snapshot), [])
+
+    def test_replay_add_update_move_delete(self):
+        self.write_journal(
+            {"op": "add", "task": {"header": "A", "completed": False}},
+            {"op": "add", "task": {"header": "B", "completed": False}},
+            {"op": "add", "task": {"header": "C", "completed": False}},
+            {"op": "update", "index": 0, "fields": {"completed": True}},
+            {"op": "move", "index": 2, "to": 1},
+            {"op": "delete", "index": 2},
+        )
+        tasks = read_legacy_tasks(self.snapshot)
+        self.assertEqual([t["header"] for t in tasks], ["A", "C"])
+        self.assertTrue(tasks[0]["completed"])
+
+    def test_reads_plain_list_snapshot(self):
+        self.snapshot.write_text(json.dumps([{"header": "old"}]))
+        self.assertEqual(read_legacy_tasks(self.snapshot), [{"header": "old"}])
+
+    def test_journal_replayed_on_snapshot(self):
+        self.snapshot.write_text(json.dumps({"generation": 3, "tasks": [{"header": "A"}]}))
+        self.write_journal({"op": "add", "task": {"header": "B"}}, generation=3)
+        self.assertEqual(read_legacy_tasks(self.snapshot), [{"header": "A"}, {"header": "B"}])
+
+    def test_stale_journal_not_replayed(self):
+        # A crash between writing the snapshot and removing the journal
+        self.snapshot.write_text(json.dumps({"generation": 1, "tasks": [{"header": "A"}]}))
+        self.write_journal({"op": "add", "task": {"header": "A"}}, generation=0)
+        self.assertEqual(read_legacy_tasks(self.snapshot), [{"header": "A"}])
+
+    def test_torn_record_is_skipped(self):
+        self.write_journal({"op": "add", "task": {"header": "A"}}, extra='{"op": "add", "ta')
+        self.assertEqual(read_legacy_tasks(self.snapshot), [{"header": "A"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
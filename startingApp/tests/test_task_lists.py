@@ -0,0 +1,81 @@
+"""
+Unit tests for named, sharded task lists (screens/task_lists.py)
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.task_lists import DEFAULT_LIST, TaskListStore, validate_list_name
+
+
+class TestTaskListStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.store = self.make_store()
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def make_store(self):
+        return TaskListStore(self.root / "lists.json", self.root / "lists",
+                             self.root / "todo_items.db")
+
+    def test_default_list_without_manifest(self):
+        self.assertEqual(self.store.names(), [DEFAULT_LIST])
+        self.assertEqual(self.store.path_for(DEFAULT_LIST), self.root / "todo_items.db")
+
+    def test_lists_are_separate_shards(self):
+        self.store.create("Biology 101")
+        self.store.open("Biology 101").add({"header": "Lab report"})
+        self.store.open(DEFAULT_LIST).add({"header": "Groceries"})
+        self.assertEqual([t["header"] for t in self.store.open("Biology 101").all()], ["Lab report"])
+        self.assertEqual(self.store.path_for("Biology 101"), self.root / "lists" / "biology_101.db")
+
+    def test_shards_open_lazily(self):
+        self.store.create("Chemistry")
+        reopened = self.make_store()
+        self.assertEqual(reopened.names(), [DEFAULT_LIST, "Chemistry"])
+        self.assertFalse(reopened.is_open("Chemistry"))
+        self.assertFalse((self.root / "lists" / "chemistry.db").exists())
+        reopened.open("Chemistry")
+        self.assertTrue(reopened.is_open("Chemistry"))
+        reopened.close()
+
+    def test_duplicate_and_invalid_names(self):
+        self.store.create("History")
+        with self.assertRaises(ValueError):
+            self.store.create("history")
+        with self.assertRaises(ValueError):
+            self.store.create("bad/name")
+
+    def test_same_slug_gets_new_file(self):
+        self.store.create("Math 1")
+        self.store.create("Math-1")
+        self.assertNotEqual(self.store.path_for("Math 1"), self.store.path_for("Math-1"))
+
+    def test_delete(self):
+        self.store.create("Old")
+        self.store.open("Old").add({"header": "x"})
+        self.store.delete("Old")
+        self.assertEqual(self.store.names(), [DEFAULT_LIST])
+        self.assertFalse((self.root / "lists" / "old.db").exists())
+        with self.assertRaises(ValueError):
+            self.store.delete(DEFAULT_LIST)
+
+    def test_validate_list_name(self):
+        self.assertEqual(validate_list_name("Physics"), (True, ""))
+        self.assertFalse(validate_list_name("")[0])
+        self.assertFalse(validate_list_name("x" * 41)[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
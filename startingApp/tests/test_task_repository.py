@@ -0,0 +1,153 @@
+"""
+Unit tests for the SQLite task repository (screens/task_repository.py)
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.rank import rank_between
+from screens.task_repository import TaskRepository, to_iso_date, to_ui_date
+
+
+class TestTaskRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / "todo_items.db"
+        self.repo = TaskRepository(self.db_path)
+
+    def tearDown(self):
+        self.repo.close()
+        self.tmp.cleanup()
+
+    def _add(self, header, due="", completed=False):
+        return self.repo.add({"header": header, "description": "",
+                              "due_date": due, "completed": completed})
+
+    def test_date_conversion(self):
+        self.assertEqual(to_iso_date("12/31/2025"), "2025-12-31")
+        self.assertIsNone(to_iso_date(""))
+        self.assertIsNone(to_iso_date("31/12/2025"))
+        self.assertEqual(to_ui_date("2025-12-31"), "12/31/2025")
+        self.assertEqual(to_ui_date(None), "")
+
+    def test_add_and_all_keep_order(self):
+        ids = [self._add(name) for name in ("A", "B", "C")]
+        tasks = self.repo.all()
+        self.assertEqual([t["header"] for t in tasks], ["A", "B", "C"])
+        self.assertEqual([t["id"] for t in tasks], ids)
+
+    def test_update_single_row(self):
+        task_id = self._add("A", due="01/02/2026")
+        self.repo.update(task_id, completed=True, due_date="01/05/2026")
+        task = self.repo.get(task_id)
+        self.assertTrue(task["completed"])
+        self.assertEqual(task["due_date"], "01/05/2026")
+
+    def test_move_rewrites_one_rank_and_delete(self):
+        a, b, c = (self._add(name) for name in ("A", "B", "C"))
+        tasks = self.repo.all()
+        # Move C between A and B
+        self.repo.update(c, rank=rank_between(tasks[0]["rank"], tasks[1]["rank"]))
+        self.assertEqual([t["header"] for t in self.repo.all()], ["A", "C", "B"])
+        self.assertEqual(self.repo.get(a)["rank"], tasks[0]["rank"])
+        self.assertEqual(self.repo.get(b)["rank"], tasks[1]["rank"])
+        self.repo.delete(a)
+        self.assertEqual([t["header"] for t in self.repo.all()], ["C", "B"])
+
+    def test_migrates_sort_order_to_rank(self):
+        old_path = Path(self.tmp.name) / "old.db"
+        conn = sqlite3.connect(str(old_path))
+        conn.execute("CREATE TABLE tasks (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                     "header TEXT NOT NULL, description TEXT NOT NULL DEFAULT '', "
+                     "due_date TEXT, completed INTEGER NOT NULL DEFAULT 0, "
+                     "sort_order REAL NOT NULL)")
+        conn.executemany("INSERT INTO tasks (header, sort_order) VALUES (?, ?)",
+                         [("second", 2), ("first", 1), ("third", 3)])
+        conn.commit()
+        conn.close()
+
+        repo = TaskRepository(old_path)
+        repo.add({"header": "fourth"})
+        self.assertEqual([t["header"] for t in repo.all()],
+                         ["first", "second", "third", "fourth"])
+        repo.close()
+
+    def test_tags_round_trip(self):
+        task_id = self.repo.add({"header": "Lab report", "tags": ["bio", "lab"]})
+        self.assertEqual(self.repo.get(task_id)["tags"], ["bio", "lab"])
+        self.repo.update(task_id, tags=[])
+        self.assertEqual(self.repo.get(task_id)["tags"], [])
+
+    def test_completed_occurrences(self):
+        task_id = self.repo.add({"header": "Review", "due_date": "10/20/2025",
+                                 "recurrence": "daily"})
+        self.assertEqual(self.repo.get(task_id)["recurrence"], "daily")
+        self.repo.complete_occurrence(task_id, "10/20/2025")
+        self.repo.complete_occurrence(task_id, "10/20/2025")  # recorded once
+        self.repo.complete_occurrence(task_id, "10/21/2025")
+        self.assertEqual(self.repo.completed_occurrences(task_id),
+                         ["10/20/2025", "10/21/2025"])
+        self.repo.uncomplete_occurrence(task_id, "10/21/2025")
+        self.assertEqual(self.repo.completed_occurrences(task_id), ["10/20/2025"])
+        self.repo.delete(task_id)
+        self.assertEqual(self.repo.completed_occurrences(task_id), [])
+
+    def test_add_many_appends_in_order(self):
+        self._add("first")
+        added = self.repo.add_many({"header": f"T{i}"} for i in range(3))
+        self.assertEqual([t["header"] for t in self.repo.all()], ["first", "T0", "T1", "T2"])
+        self.assertEqual([t["id"] for t in added], [t["id"] for t in self.repo.all()[1:]])
+
+    def test_apply_changes_restores_deleted_row(self):
+        task_id = self._add("A")
+        task = self.repo.get(task_id)
+        self.repo.apply_changes({task_id: None})
+        self.repo.apply_changes({task_id: task})
+        self.assertEqual(self.repo.get(task_id), task)
+
+    def test_apply_changes_in_one_batch(self):
+        a, b = self._add("A"), self._add("B")
+        task_a = self.repo.get(a)
+        task_a["completed"] = True
+        self.repo.apply_changes({a: task_a, b: None})
+        tasks = self.repo.all()
+        self.assertEqual([t["header"] for t in tasks], ["A"])
+        self.assertTrue(tasks[0]["completed"])
+
+    def test_incomplete_due_this_week(self):
+        today = date(2026, 1, 7)  # a Wednesday
+        self._add("today", due="01/07/2026")
+        self._add("sunday", due="01/11/2026")
+        self._add("next week", due="01/12/2026")
+        self._add("done", due="01/08/2026", completed=True)
+        self._add("no date")
+        due = self.repo.incomplete_due_this_week(today)
+        self.assertEqual([t["header"] for t in due], ["today", "sunday"])
+
+    def test_indexes_exist(self):
+        names = {row[0] for row in self.repo.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertIn("idx_tasks_due_date", names)
+        self.assertIn("idx_tasks_completed_due", names)
+        self.assertIn("idx_tasks_rank", names)
+
+    def test_import_once(self):
+        legacy = [{"header": "Old", "description": "d", "due_date": "", "completed": True}]
+        self.assertEqual(self.repo.import_once(lambda: legacy), 1)
+        self.assertEqual(self.repo.import_once(lambda: legacy), 0)
+        tasks = self.repo.all()
+        self.assertEqual(len(tasks), 1)
+        self.assertTrue(tasks[0]["completed"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Unit tests for the incremental task search index (screens/task_search.py)
+"""
+
+import os
+import sys
+import time
+import unittest
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.task_search import TaskSearchIndex, tokenize
+
+
+def task(task_id, header, description=""):
+    return {"id": task_id, "header": header, "description": description}
+
+
+class TestTaskSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = TaskSearchIndex([
+            task(1, "Read chapter 6", "Biology textbook"),
+            task(2, "MATH homework", "Problems 6-10"),
+            task(3, "Chapter review", "before the exam"),
+        ])
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("[s]Read, Chapter-6![/s]"), ["s", "read", "chapter", "6", "s"])
+
+    def test_prefix_search(self):
+        self.assertEqual(self.index.search("chap"), {1, 3})
+        self.assertEqual(self.index.search("Math"), {2})
+        self.assertEqual(self.index.search("zzz"), set())
+
+    def test_all_words_must_match(self):
+        self.assertEqual(self.index.search("chapter bio"), {1})
+        self.assertEqual(self.index.search("6 prob"), {2})
+
+    def test_empty_query_means_no_filter(self):
+        self.assertIsNone(self.index.search("  "))
+
+    def test_incremental_updates(self):
+        self.index.add(task(4, "Chapter quiz"))
+        self.assertEqual(self.index.search("chapter"), {1, 3, 4})
+        self.index.update(task(1, "Read notes"))
+        self.assertEqual(self.index.search("chapter"), {3, 4})
+        self.assertEqual(self.index.search("notes"), {1})
+        self.index.remove(3)
+        self.assertEqual(self.index.search("chapter"), {4})
+        self.assertEqual(self.index.search("exam"), set())
+        self.assertEqual(len(self.index), 3)
+
+    def test_large_index_query_is_fast(self):
+        index = TaskSearchIndex(task(i, f"Task {i} reading week{i % 52}") for i in range(30000))
+        start = time.perf_counter()
+        result = index.search("week17 read")
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(result), len(range(17, 30000, 52)))
+        self.assertLess(elapsed, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Unit tests for the shared task validation rules (screens/task_validation.py)
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.task_validation import (
+    validate_due_date,
+    validate_tags,
+    validate_task_description,
+    validate_task_title,
+    validate_tasks,
+)
+
+
+class TestSingleValueValidators(unittest.TestCase):
+
+    def test_title(self):
+        self.assertEqual(validate_task_title("MATH Chapter 6"), (True, ""))
+        self.assertEqual(validate_task_title(""), (False, "Task title cannot be empty!"))
+        self.assertFalse(validate_task_title("x" * 101)[0])
+        self.assertEqual(validate_task_title("<SCRIPT>alert(1)"),
+                         (False, "Task title contains dangerous pattern: <script"))
+        self.assertEqual(validate_task_title("Notes & stuff"),
+                         (False, "Task title contains invalid characters!"))
+
+    def test_title_reports_patterns_in_list_order(self):
+        self.assertEqual(validate_task_title("a -- b /* c"),
+                         (False, "Task title contains dangerous pattern: --"))
+
+    def test_description(self):
+        self.assertEqual(validate_task_description(""), (True, ""))
+        self.assertEqual(validate_task_description("Please update the notes"), (True, ""))
+        self.assertFalse(validate_task_description("x" * 501)[0])
+        self.assertEqual(validate_task_description("javascript:void(0)"),
+                         (False, "Description contains dangerous pattern: javascript:"))
+
+    def test_due_date(self):
+        future = (datetime.now() + timedelta(days=10)).strftime("%m/%d/%Y")
+        self.assertEqual(validate_due_date(future), (True, ""))
+        self.assertEqual(validate_due_date(""), (True, ""))
+        self.assertFalse(validate_due_date("2025-12-31")[0])
+        self.assertFalse(validate_due_date("02/30/2026")[0])
+        self.assertFalse(validate_due_date("01/01/2000")[0])
+
+    def test_tags(self):
+        self.assertEqual(validate_tags(["cs-3203", "exam"]), (True, ""))
+        self.assertFalse(validate_tags(["bad tag"])[0])
+        self.assertFalse(validate_tags([str(i) for i in range(11)])[0])
+
+
+class TestValidateTasks(unittest.TestCase):
+
+    def test_reports_every_error_per_record(self):
+        records = [
+            {"header": "Fine task", "description": "", "due_date": ""},
+            {"header": "bad -- <iframe", "description": "eval(1)", "due_date": "13/01/2026"},
+        ]
+        results = list(validate_tasks(records))
+        self.assertEqual(results[0][2], [])
+        index, record, errors = results[1]
+        self.assertEqual(index, 1)
+        self.assertIs(record, records[1])
+        self.assertEqual(len(errors), 5)  # 2 title patterns, bad chars, description, date
+
+    def test_is_lazy(self):
+        def endless():
+            while True:
+                yield {"header": "Task"}
+        first = next(validate_tasks(endless()))
+        self.assertEqual(first[2], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,9 +11,19 @@ from unittest.mock import Mock, patch, MagicMock
 # Add the parent directory to the path so we can import from screens
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from datetime import date, timedelta
+
 from kivy.metrics import dp
 from kivymd.app import MDApp
 
+# A due date that passes validation whenever the tests run
+DUE = (date.today() + timedelta(days=30)).strftime("%m/%d/%Y")
+
+
+def row_headers(screen):
+    """Header text of every row in the task list, top to bottom."""
+    return [row['header_text'] for row in screen.ids['todo_list_view'].data]
+
 
 class TestApp(MDApp):
     """Minimal test app for KivyMD initialization"""
@@ -61,8 +71,8 @@ class TestToDoScreen(unittest.TestCase):
         mock_ids['task_date_input'].text = ""
         mock_ids['task_date_input'].opacity = 0
         
-        mock_ids['todo_items_container'] = Mock()
-        mock_ids['todo_items_container'].add_widget = Mock()
+        # Stands in for the TaskRecycleView: rendering sets its data
+        mock_ids['todo_list_view'] = Mock(data=[], height=dp(500))
         
         # Assign the mock_ids dict
         self.screen.ids = mock_ids
@@ -78,83 +88,86 @@ class TestToDoScreen(unittest.TestCase):
         self.assertEqual(self.screen.ids['task_description_input'].opacity, 1)
         self.assertEqual(self.screen.ids['task_date_input'].opacity, 1)
     
-    @patch('kivymd.uix.boxlayout.MDBoxLayout', return_value=Mock(add_widget=Mock()))
-    @patch('kivymd.uix.label.MDLabel', return_value=Mock())
+    @patch('screens.todo.ToDoScreen.render_tasks')
+    @patch('screens.todo.ToDoScreen._ensure_loaded')
+    def test_post_kv_setup_hides_detail_fields(self, mock_loaded, mock_render):
+        """Test that every detail field (tags and repeat rule included) starts hidden and disabled"""
+        from screens.todo import TASK_DETAIL_INPUTS
+
+        for idn in TASK_DETAIL_INPUTS:
+            self.screen.ids[idn] = Mock(opacity=1, disabled=False)
+
+        self.screen._post_kv_setup(0)
+
+        for idn in TASK_DETAIL_INPUTS:
+            self.assertEqual(self.screen.ids[idn].opacity, 0, idn)
+            self.assertTrue(self.screen.ids[idn].disabled, idn)
+
     @patch('screens.todo.ToDoScreen.collapse_input')
-    def test_addTask_with_valid_header(self, mock_collapse, mock_label, mock_box):
+    def test_addTask_with_valid_header(self, mock_collapse):
         """Test that addTask() creates a task when header is provided"""
         # Set up input values
         self.screen.ids['task_header_input'].text = "Complete Project"
         self.screen.ids['task_description_input'].text = "Finish the study app"
-        self.screen.ids['task_date_input'].text = "12/31/2025"
+        self.screen.ids['task_date_input'].text = DUE
         
-        # Call addTask
+        # Call addTask (rendering is deferred to the next frame)
         self.screen.addTask()
+        self.screen.flush_render()
         
-        # Assert a widget was added to the container
-        self.screen.ids['todo_items_container'].add_widget.assert_called_once()
+        # Assert the list shows a row for the task
+        self.assertIn("Complete Project", row_headers(self.screen))
     
-    @patch('kivymd.uix.boxlayout.MDBoxLayout', return_value=Mock(add_widget=Mock()))
-    @patch('kivymd.uix.label.MDLabel', return_value=Mock())
-    def test_addTask_with_whitespace_only_header(self, mock_label, mock_box):
+    def test_addTask_with_whitespace_only_header(self):
         """Test that addTask() does not add a task when header is only whitespace"""
         # Set up whitespace-only header
         self.screen.ids['task_header_input'].text = "   "
         self.screen.ids['task_description_input'].text = "Description"
-        self.screen.ids['task_date_input'].text = "12/31/2025"
+        self.screen.ids['task_date_input'].text = DUE
         
-        # Call addTask
+        # Call addTask (rendering is deferred to the next frame)
         self.screen.addTask()
+        self.screen.flush_render()
         
-        # Assert no widget was added
-        self.screen.ids['todo_items_container'].add_widget.assert_not_called()
+        # Assert no row was added
+        self.assertEqual(self.screen.ids['todo_list_view'].data, [])
     
-    @patch('kivymd.uix.boxlayout.MDBoxLayout', return_value=Mock(add_widget=Mock()))
-    @patch('kivymd.uix.label.MDLabel', return_value=Mock())
     @patch('screens.todo.ToDoScreen.collapse_input')
-    def test_addTask_with_header_only(self, mock_collapse, mock_label, mock_box):
+    def test_addTask_with_header_only(self, mock_collapse):
         """Test that addTask() works with only header filled (description and date can be optional)"""
         # Set up only header
         self.screen.ids['task_header_input'].text = "Important Task"
         self.screen.ids['task_description_input'].text = ""
         self.screen.ids['task_date_input'].text = ""
         
-        # Call addTask
+        # Call addTask (rendering is deferred to the next frame)
         self.screen.addTask()
+        self.screen.flush_render()
         
-        # Assert a widget was added
-        self.screen.ids['todo_items_container'].add_widget.assert_called_once()
+        # Assert the list shows a row for the task
+        self.assertIn("Important Task", row_headers(self.screen))
     
-    @patch('kivymd.uix.boxlayout.MDBoxLayout', return_value=Mock(add_widget=Mock()))
-    @patch('kivymd.uix.label.MDLabel')
     @patch('screens.todo.ToDoScreen.collapse_input')
-    def test_addTask_label_content(self, mock_collapse, mock_label, mock_box):
-        """Test that addTask() creates labels with correct text content"""
+    def test_addTask_label_content(self, mock_collapse):
+        """Test that addTask() shows the row with correct text content"""
         # Set up input values
         header_text = "MATH Chapter 6"
         desc_text = "Homework problems 6-10"
-        date_text = "11/15/2025"
+        date_text = DUE
         
         self.screen.ids['task_header_input'].text = header_text
         self.screen.ids['task_description_input'].text = desc_text
         self.screen.ids['task_date_input'].text = date_text
         
-        # Store the label creation calls
-        label_calls = []
-        def capture_label_call(**kwargs):
-            label_calls.append(kwargs)
-            return Mock()
-        
-        mock_label.side_effect = capture_label_call
-        
-        # Call addTask
+        # Call addTask (rendering is deferred to the next frame)
         self.screen.addTask()
+        self.screen.flush_render()
         
-        # Assert labels were created with correct text
-        self.assertEqual(len(label_calls), 3)
-        self.assertEqual(label_calls[0]['text'], header_text)
-        self.assertEqual(label_calls[1]['text'], desc_text)
-        self.assertEqual(label_calls[2]['text'], date_text)
+        # Assert the row shows the header, description and date
+        row = self.screen.ids['todo_list_view'].data[-1]
+        self.assertEqual(row['header_text'], header_text)
+        self.assertEqual(row['desc_text'], desc_text)
+        self.assertEqual(row['due_text'], date_text)
 
 
 class TestToDoScreenIntegration(unittest.TestCase):
@@ -194,21 +207,19 @@ class TestToDoScreenIntegration(unittest.TestCase):
         mock_ids['task_date_input'].text = ""
         mock_ids['task_date_input'].opacity = 0
         
-        mock_ids['todo_items_container'] = Mock()
-        mock_ids['todo_items_container'].add_widget = Mock()
+        # Stands in for the TaskRecycleView: rendering sets its data
+        mock_ids['todo_list_view'] = Mock(data=[], height=dp(500))
         
         # Assign the mock_ids dict
         self.screen.ids = mock_ids
     
-    @patch('kivymd.uix.boxlayout.MDBoxLayout', return_value=Mock(add_widget=Mock()))
-    @patch('kivymd.uix.label.MDLabel', return_value=Mock())
     @patch('screens.todo.Animation')
-    def test_multiple_tasks_workflow(self, mock_animation, mock_label, mock_box):
+    def test_multiple_tasks_workflow(self, mock_animation):
         """Test adding multiple tasks in sequence"""
         tasks = [
-            ("Task 1", "Description 1", "01/01/2026"),
-            ("Task 2", "Description 2", "01/02/2026"),
-            ("Task 3", "Description 3", "01/03/2026")
+            ("Task 1", "Description 1", DUE),
+            ("Task 2", "Description 2", DUE),
+            ("Task 3", "Description 3", DUE)
         ]
         
         for header, desc, date in tasks:
@@ -222,9 +233,99 @@ class TestToDoScreenIntegration(unittest.TestCase):
             
             # Add
             self.screen.addTask()
+            self.screen.flush_render()
         
-        # Verify all tasks were added
-        self.assertEqual(self.screen.ids['todo_items_container'].add_widget.call_count, 3)
+        # Verify all tasks were added, in order, at the end of the list
+        self.assertEqual(row_headers(self.screen)[-3:], ["Task 1", "Task 2", "Task 3"])
+
+
+
+class TestGroupedListWithKv(unittest.TestCase):
+    """
+    The grouped (by due date) list rendered by the real TaskRecycleView
+    from study.kv: every row must get the widget its data asks for.
+    """
+
+    KV_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "study.kv")
+
+    @classmethod
+    def setUpClass(cls):
+        from kivy.lang import Builder
+
+        cls.app = TestApp()
+        Builder.load_file(cls.KV_FILE)
+
+    @classmethod
+    def tearDownClass(cls):
+        from kivy.lang import Builder
+
+        Builder.unload_file(cls.KV_FILE)
+
+    def setUp(self):
+        import tempfile
+        from pathlib import Path
+        from kivy.clock import Clock
+        from screens import todo
+        from screens.task_lists import TaskListStore
+
+        tmp = tempfile.TemporaryDirectory()
+        folder = Path(tmp.name)
+        store = TaskListStore(folder / "lists.json", folder / "lists", folder / "todo.db")
+        patches = [patch.object(todo, "task_lists", store),
+                   patch.object(todo, "load_tasks", lambda: [])]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(store.close)
+
+        today = date.today()
+        ui = lambda day: day.strftime("%m/%d/%Y")
+        store.open(todo.DEFAULT_LIST).add_many([
+            {"header": "Lab", "due_date": ui(today - timedelta(days=2))},
+            {"header": "Essay", "due_date": ui(today)},
+            {"header": "Seminar", "due_date": ui(today + timedelta(days=1)), "recurrence": "daily"},
+            {"header": "Reading", "due_date": ""},
+        ])
+
+        self.screen = todo.ToDoScreen()
+        Clock.tick()  # _post_kv_setup: loads the tasks and renders
+        self.addCleanup(self.screen.writer.stop)
+        self.addCleanup(self.screen.reminders.stop)
+
+    def rendered_views(self):
+        """(data row, view widget) for every row, after a layout pass."""
+        from kivy.clock import Clock
+
+        list_view = self.screen.ids.todo_list_view
+        list_view.size = (dp(400), dp(3000))  # tall enough to show every row
+        self.screen.flush_render()
+        Clock.tick()
+        Clock.tick()
+        views = list_view.view_adapter.views
+        self.assertEqual(len(views), len(list_view.data))
+        return [(list_view.data[index], views[index]) for index in sorted(views)]
+
+    def test_grouped_rows_get_their_own_views(self):
+        self.screen.toggle_group_by_due()
+        rows = self.rendered_views()
+
+        headers = [view.text for row, view in rows if type(view).__name__ == "TaskSectionHeader"]
+        self.assertEqual(headers, ["Overdue (1)", "Today (1)", "Next 7 days (7)"])
+        previews = 0
+        for row, view in rows:
+            self.assertEqual(type(view).__name__, row["viewclass"])
+            if row["viewclass"] == "TaskRowView":
+                self.assertEqual(view.task_id, row["task_id"])
+                self.assertEqual(view.preview, row["preview"])
+                previews += row["preview"]
+        self.assertEqual(previews, 6)  # Seminar again on each of the following days
+
+    def test_flat_rows_are_task_rows(self):
+        rows = self.rendered_views()
+        self.assertEqual([view.task_id for row, view in rows],
+                         [task["id"] for task in self.screen.task_list])
+        self.assertTrue(all(type(view).__name__ == "TaskRowView" for row, view in rows))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,193 @@
+"""
+Screen-level tests for the To-Do bulk operations (complete_tasks,
+delete_tasks, clear_completed, shift_due_dates): each one hands its rows
+to the writer as one batch and renders once. Also the due-date reminders
+of the screen: once a day per task, one message for a burst.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kivymd.app import MDApp
+
+
+class TestApp(MDApp):
+    """Minimal test app for KivyMD initialization"""
+    def build(self):
+        pass
+
+
+class RecordingWriter:
+    """Stands in for the WriteBehind writer: records every batch it is given."""
+
+    def __init__(self):
+        self.batches = []
+
+    def mark_dirty(self, key, value):
+        self.batches.append([(key, value)])
+
+    def mark_dirty_many(self, changes):
+        self.batches.append(list(changes))
+
+    def flush(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+def ui_date(day):
+    return day.strftime("%m/%d/%Y")
+
+
+class ScreenTestCase(unittest.TestCase):
+    """A ToDoScreen on a temporary list of five tasks, rendered once."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = TestApp()
+
+    def setUp(self):
+        from screens import todo
+        from screens.task_lists import TaskListStore
+
+        self.tmp = tempfile.TemporaryDirectory()
+        folder = Path(self.tmp.name)
+        store = TaskListStore(folder / "lists.json", folder / "lists", folder / "todo.db")
+        patches = [patch.object(todo, "task_lists", store),
+                   patch.object(todo, "load_tasks", lambda: [])]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(store.close)
+
+        self.today = date.today()
+        store.open(todo.DEFAULT_LIST).add_many([
+            {"header": "Essay", "due_date": ui_date(self.today + timedelta(days=3))},
+            {"header": "Lab", "due_date": ui_date(self.today - timedelta(days=5))},
+            {"header": "Reading", "due_date": ""},
+            {"header": "Quiz", "due_date": ui_date(self.today + timedelta(days=1)),
+             "completed": True, "completed_at": datetime.now().isoformat(timespec="seconds")},
+            {"header": "Seminar", "due_date": ui_date(self.today - timedelta(days=2)),
+             "recurrence": "weekly mon"},
+        ])
+
+        self.screen = todo.ToDoScreen()
+        self.screen.ids = {}
+        self.screen._ensure_loaded()
+        self.screen.writer = RecordingWriter()
+        self.addCleanup(self.screen.reminders.stop)
+        self.screen.render_tasks()
+        self.renders = self.screen.render_count
+
+    def ids_of(self, *headers):
+        return [t["id"] for t in self.screen.task_list if t["header"] in headers]
+
+    def task(self, header):
+        return next(t for t in self.screen.task_list if t["header"] == header)
+
+
+class TestBulkOperations(ScreenTestCase):
+
+    def assert_one_save_and_render(self):
+        self.screen.flush_render()
+        self.assertEqual(len(self.screen.writer.batches), 1)
+        self.assertEqual(self.screen.render_count, self.renders + 1)
+
+    def test_complete_tasks(self):
+        changed = self.screen.complete_tasks(self.ids_of("Essay", "Lab", "Quiz"))
+        self.assertEqual(changed, 2)  # Quiz was already done
+        self.assertTrue(self.task("Essay")["completed"])
+        self.assertTrue(self.task("Lab")["completed"])
+        self.assert_one_save_and_render()
+        self.assertEqual(len(self.screen.writer.batches[0]), 2)
+
+    def test_delete_tasks(self):
+        self.assertEqual(self.screen.delete_tasks(self.ids_of("Essay", "Reading")), 2)
+        self.assertEqual([t["header"] for t in self.screen.task_list], ["Lab", "Quiz", "Seminar"])
+        self.assert_one_save_and_render()
+        self.assertTrue(all(value is None for _, value in self.screen.writer.batches[0]))
+
+    def test_clear_completed(self):
+        self.assertEqual(self.screen.clear_completed(), 1)
+        self.assertNotIn("Quiz", [t["header"] for t in self.screen.task_list])
+        self.assert_one_save_and_render()
+
+    def test_shift_due_dates(self):
+        moved = self.screen.shift_due_dates(self.ids_of("Essay", "Reading"), 2)
+        self.assertEqual(moved, 1)  # Reading has no due date
+        self.assertEqual(self.task("Essay")["due_date"], ui_date(self.today + timedelta(days=5)))
+        self.assert_one_save_and_render()
+
+    def test_shift_clamps_overdue_tasks_to_today(self):
+        # +1 day on a task 5 days overdue used to abort the whole batch
+        moved = self.screen.shift_due_dates(self.ids_of("Essay", "Lab"), 1)
+        self.assertEqual(moved, 2)
+        self.assertEqual(self.task("Lab")["due_date"], ui_date(self.today))
+        self.assertEqual(self.task("Essay")["due_date"], ui_date(self.today + timedelta(days=4)))
+        self.assert_one_save_and_render()
+
+    def test_shift_keeps_recurring_tasks_on_their_weekdays(self):
+        self.screen.shift_due_dates(self.ids_of("Seminar"), 1)
+        due = datetime.strptime(self.task("Seminar")["due_date"], "%m/%d/%Y").date()
+        self.assertEqual(due.weekday(), 0)  # Monday
+        self.assertGreaterEqual(due, self.today)
+        self.assert_one_save_and_render()
+
+    def test_nothing_to_do_saves_and_renders_nothing(self):
+        self.assertEqual(self.screen.complete_tasks(self.ids_of("Quiz")), 0)
+        self.assertEqual(self.screen.delete_tasks([]), 0)
+        self.screen.flush_render()
+        self.assertEqual(self.screen.writer.batches, [])
+        self.assertEqual(self.screen.render_count, self.renders)
+
+
+class TestReminders(ScreenTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.messages = []
+        self.screen.notify = self.messages.append
+
+    def fire_due_reminders(self):
+        """Run the reminders that are due LATE_DELAY seconds from now, then the frame."""
+        reminders = self.screen.reminders
+        reminders._now = lambda: time.time() + 60
+        reminders._fire(0)
+        reminders._now = time.time
+        self.screen._show_reminders()
+
+    def test_overdue_tasks_share_one_message(self):
+        # Lab and Seminar are overdue; Essay is reminded in three days
+        self.assertEqual(len(self.screen.reminders), 3)
+        self.fire_due_reminders()
+        self.assertEqual(self.messages, ["2 tasks overdue"])
+        self.assertEqual(len(self.screen.reminders), 1)
+
+    def test_reindexing_does_not_remind_again_today(self):
+        self.fire_due_reminders()
+        for task in self.screen.task_list:
+            self.screen._index_task(task)  # as after an import or an undo
+        self.assertEqual(len(self.screen.reminders), 1)
+
+    def test_new_due_date_is_reminded(self):
+        self.fire_due_reminders()
+        lab = self.task("Lab")
+        lab["due_date"] = ui_date(self.today - timedelta(days=1))
+        self.screen._due_changed(lab)
+        self.fire_due_reminders()
+        self.assertEqual(self.messages, ["2 tasks overdue", "Overdue: Lab"])
+
+
+if __name__ == '__main__':
+    unittest.main()
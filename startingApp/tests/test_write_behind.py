@@ -0,0 +1,67 @@
+"""
+Unit tests for the coalescing background writer (screens/write_behind.py)
+"""
+
+import os
+import sys
+import time
+import unittest
+
+# Add startingApp to the path so we can import from screens
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.write_behind import WriteBehind
+
+
+class TestWriteBehind(unittest.TestCase):
+
+    def setUp(self):
+        self.batches = []
+        self.writer = WriteBehind(self.batches.append, delay=0.05, max_delay=1.0)
+
+    def tearDown(self):
+        self.writer.stop()
+
+    def test_burst_is_written_once(self):
+        for i in range(100):
+            self.writer.mark_dirty(i % 5, {"completed": i % 2 == 0})
+        self.writer.flush()
+
+        stats = self.writer.stats()
+        self.assertEqual(stats["requests"], 100)
+        self.assertEqual(stats["writes"], 1)
+        self.assertEqual(stats["coalesced"], 99)
+        # Only the latest value per key is written
+        self.assertEqual(len(self.batches[0]), 5)
+        self.assertEqual(self.batches[0][4], {"completed": False})
+
+    def test_worker_writes_after_debounce(self):
+        self.writer.mark_dirty("a", 1)
+        self.writer.mark_dirty("a", 2)
+        deadline = time.monotonic() + 2
+        while not self.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.batches, [{"a": 2}])
+        self.assertEqual(self.writer.stats()["pending"], 0)
+
+    def test_stop_flushes_pending(self):
+        writer = WriteBehind(self.batches.append, delay=10)
+        writer.mark_dirty("x", None)
+        writer.stop()
+        self.assertEqual(self.batches, [{"x": None}])
+
+    def test_mark_dirty_many_is_one_write(self):
+        self.writer.mark_dirty_many([(i, None) for i in range(50)])
+        self.writer.flush()
+        stats = self.writer.stats()
+        self.assertEqual(stats["requests"], 50)
+        self.assertEqual(stats["writes"], 1)
+        self.assertEqual(len(self.batches[0]), 50)
+
+    def test_flush_with_nothing_pending(self):
+        self.writer.flush()
+        self.assertEqual(self.writer.stats()["writes"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()